@@ -0,0 +1,59 @@
+"""
+# Import-Time Benchmark
+
+Measures the time to import `vlsirtools` modules in fresh interpreters,
+and reports which heavyweight dependencies each loads.
+
+Usage: `python benchmarks/import_time.py [--runs N]`
+"""
+
+import sys, subprocess, argparse, statistics
+
+# Modules to import, each in its own fresh interpreter
+MODULES = [
+    "vlsirtools",
+    "vlsirtools.netlist",
+    "vlsirtools.primitives",
+    "vlsirtools.spice",
+    "vlsirtools.spice.xyce",
+]
+# Dependencies whose loading we report
+HEAVY = ["numpy", "pandas", "vlsirtools.spice"]
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(module: str) -> tuple:
+    """Import `module` in a fresh interpreter. Returns its import time and the heavy dependencies it loaded."""
+    script = SCRIPT.format(module=module, heavy=HEAVY)
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    elapsed, _, loaded = out.stdout.strip().partition(" ")
+    return float(elapsed), loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':<28}{'median (ms)':>12}{'min (ms)':>10}  loads")
+    for module in MODULES:
+        results = [measure(module) for _ in range(args.runs)]
+        times = [1e3 * t for t, _ in results]
+        loaded = results[0][1] or "-"
+        print(
+            f"{module:<28}{statistics.median(times):>12.1f}{min(times):>10.1f}  {loaded}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+# Prefixed-Parameter Netlisting Benchmark
+
+Measures the time to netlist a module of 40k resistors, each with three `Prefixed` parameter-values,
+120k in total, drawn from a few hundred distinct values.
+`--no-memo` effectively disables the memo of formatted `Prefixed` values, for comparison.
+Earlier revisions, without the memo, can be measured by running this script against their checkout.
+
+Usage: `python benchmarks/netlist_prefixed.py [--fmt FMT] [--runs N] [--no-memo]`
+"""
+
+import io, time, argparse, statistics
+
+import vlsir
+import vlsir.circuit_pb2 as vckt
+import vlsirtools
+from vlsirtools.netlist import base
+
+NUM_INSTANCES = 40_000
+
+
+def prefixed(number: int, prefix: vlsir.SIPrefix) -> vlsir.ParamValue:
+    return vlsir.ParamValue(prefixed=vlsir.Prefixed(prefix=prefix, int64_value=number))
+
+
+def package() -> vckt.Package:
+    """Create the benchmark package, of a single module of `NUM_INSTANCES` resistors."""
+    res = vlsir.Reference(
+        external=vlsir.QualifiedName(domain="vlsir.primitives", name="resistor")
+    )
+    conns = [
+        vckt.Connection(portname="p", target=vckt.ConnectionTarget(sig="a")),
+        vckt.Connection(portname="n", target=vckt.ConnectionTarget(sig="b")),
+    ]
+    instances = [
+        vckt.Instance(
+            name=f"r{idx}",
+            module=res,
+            connections=conns,
+            parameters=[
+                vlsir.Param(
+                    name="r", value=prefixed(idx % 50 + 1, vlsir.SIPrefix.KILO)
+                ),
+                vlsir.Param(
+                    name="w", value=prefixed(idx % 7 + 1, vlsir.SIPrefix.MICRO)
+                ),
+                vlsir.Param(name="l", value=prefixed(150, vlsir.SIPrefix.NANO)),
+            ],
+        )
+        for idx in range(NUM_INSTANCES)
+    ]
+    module = vckt.Module(
+        name="resistors",
+        signals=[vckt.Signal(name="a", width=1), vckt.Signal(name="b", width=1)],
+        instances=instances,
+    )
+    return vckt.Package(domain="benchmark", modules=[module])
+
+
+def measure(pkg: vckt.Package, fmt: str) -> float:
+    """Netlist `pkg` in format `fmt`. Returns the elapsed time."""
+    getattr(base, "_prefixed_memos", dict()).clear()  # Absent in earlier revisions
+    start = time.perf_counter()
+    vlsirtools.netlist(pkg=pkg, dest=io.StringIO(), fmt=fmt)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fmt", default="spice")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--no-memo", action="store_true")
+    args = parser.parse_args()
+
+    if args.no_memo:
+        # Clear the memo before every insertion
+        base.PREFIXED_MEMO_SIZE = 0
+
+    pkg = package()
+    times = [measure(pkg, args.fmt) for _ in range(args.runs)]
+    print(f"{'format':<10}{'median (s)':>12}{'min (s)':>10}")
+    print(f"{args.fmt:<10}{statistics.median(times):>12.3f}{min(times):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
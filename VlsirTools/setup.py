@@ -33,5 +33,9 @@ setup(
         "numpy",  # For `sim_data` simulation results
         "pandas",  # For CSV reading
     ],
-    extras_require={"dev": ["vlsirdev"]},
+    extras_require={
+        "dev": ["vlsirdev"],
+        "arrow": ["pyarrow"],  # For Arrow and Parquet result export
+        "zstd": ["zstandard"],  # For zstd-compressed netlists
+    },
 )
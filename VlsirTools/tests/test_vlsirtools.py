@@ -716,3 +716,1211 @@ write ./test.raw
             assert any(
                 len(arr) > 0 for arr in res.data.values()
             ), "No data in parsed result"
+
+
+def test_simulator_registry(tmp_path, monkeypatch):
+    """Test the once-per-process simulator probing, and its persistent cache-file."""
+    import subprocess
+    from vlsirtools.spice import registry, xyce
+
+    # Create a fake "simulator" executable, which just prints a version
+    exe = tmp_path / "FakeXyce"
+    exe.write_text("#!/bin/sh\necho 'Xyce Release 7.6.0'\n")
+    exe.chmod(0o755)
+    monkeypatch.setattr(xyce, "XYCE_EXECUTABLE", str(exe))
+    monkeypatch.setattr(registry, "CACHE_PATH", tmp_path / "cache.json")
+    monkeypatch.setattr(registry, "_probed", dict())
+
+    # Count the probing subprocesses
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(*args, **kwargs):
+        calls.append(args)
+        return real_run(*args, **kwargs)
+
+    monkeypatch.setattr(registry.subprocess, "run", counting_run)
+
+    info = registry.get(SupportedSimulators.XYCE)
+    assert info.available
+    assert info.path == str(exe)
+    assert info.version == "7.6.0"
+    assert xyce.available()
+    assert registry.versions()[SupportedSimulators.XYCE] == "7.6.0"
+    assert len(calls) == 1  # Probed once, despite several queries
+
+    # Clear the in-process results; the cache-file should prevent re-probing
+    monkeypatch.setattr(registry, "_probed", dict())
+    assert registry.get(SupportedSimulators.XYCE).version == "7.6.0"
+    assert len(calls) == 1
+
+    # Clearing the registry removes the cache-file, and forces a re-probe
+    registry.clear()
+    assert not (tmp_path / "cache.json").exists()
+    assert registry.get(SupportedSimulators.XYCE).available
+    assert len(calls) == 2
+
+
+def test_sim_telemetry(tmp_path):
+    """Test collecting and exporting simulation telemetry, using a stand-in subprocess."""
+    import sys, json
+    from vlsirtools.spice import SimOptions, SimError
+    from vlsirtools.spice.xyce import XyceSim
+    from vlsirtools.spice.telemetry import Phase, write_jsonl
+
+    opts = SimOptions(simulator=SupportedSimulators.XYCE, rundir=tmp_path / "run")
+    sim = XyceSim(inp=vsp.SimInput(), opts=opts)
+    sim.setup()
+    with sim.phase(Phase.NETLIST):
+        pass
+    sim.run_subprocess([sys.executable, "-c", "x = bytearray(2**24)"])
+
+    t = sim.telemetry
+    assert t.simulator == "xyce"
+    assert set(t.phases.keys()) == {Phase.NETLIST.value, Phase.SIMULATE.value}
+    assert len(t.processes) == 1
+    assert t.processes[0].returncode == 0
+    assert t.processes[0].wall_time > 0
+    if t.max_rss is not None:  # Not available on all platforms
+        assert t.max_rss > 2**24
+        assert t.cpu_time > 0
+
+    # Failing subprocesses raise `SimError`s, including their output
+    with pytest.raises(SimError) as e:
+        sim.run_subprocess(
+            [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+        )
+    assert e.value.stderr == b"boom"
+    assert t.processes[1].returncode == 3
+
+    # Export as JSON lines
+    dest = tmp_path / "telemetry.jsonl"
+    write_jsonl([t, t], dest)
+    lines = dest.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["simulator"] == "xyce"
+    assert len(record["processes"]) == 2
+
+
+def test_sim_iter(monkeypatch):
+    """Test yielding batch-simulation results as they complete, using a stand-in simulator."""
+    import time
+    from vlsirtools.spice import SimOptions, sim, sim_iter
+    from vlsirtools.spice.xyce import XyceSim
+    from vlsirtools.spice.telemetry import SimTelemetry
+
+    def fake_sim(cls, io):
+        # Later inputs finish first
+        time.sleep(0.05 * (3 - len(io.inp.top)))
+        return io.inp.top, SimTelemetry()
+
+    monkeypatch.setattr(XyceSim, "apply_with_telemetry", classmethod(fake_sim))
+    inputs = [vsp.SimInput(top="a" * (i + 1)) for i in range(3)]
+    opts = SimOptions(simulator=SupportedSimulators.XYCE)
+
+    results = list(sim_iter(inputs, opts))
+    assert sorted(results) == [(0, "a"), (1, "aa"), (2, "aaa")]
+    assert results[0] == (2, "aaa")
+
+    # And the batch `sim` returns results in input order
+    assert sim(inputs, opts) == ["a", "aa", "aaa"]
+
+
+def test_netlist_saves():
+    """Test netlisting `Save` controls in each simulation-netlist format."""
+    from vlsirtools.netlist import (
+        SpiceNetlister,
+        NgspiceNetlister,
+        HspiceNetlister,
+        XyceNetlister,
+        SpectreNetlister,
+    )
+
+    def netlist_with(netlister_cls, saves: List[vsp.Save]) -> str:
+        dest = StringIO()
+        netlister = netlister_cls(dest=dest)
+        netlister.write_control_elements([vsp.Control(save=s) for s in saves])
+        # Add an analysis to Xyce netlists, for its `.print` statement
+        if netlister_cls is XyceNetlister:
+            netlister.write_tran(vsp.TranInput(analysis_name="tr", tstop=1, tstep=1))
+        return dest.getvalue()
+
+    signals = [vsp.Save(signal="out"), vsp.Save(signal="i(vdd)")]
+    none = [vsp.Save(mode=vsp.Save.SaveMode.NONE)]
+    all_ = [vsp.Save(mode=vsp.Save.SaveMode.ALL)]
+
+    for cls in (SpiceNetlister, NgspiceNetlister):
+        assert ".save v(out) i(vdd)" in netlist_with(cls, signals)
+        assert ".save none" in netlist_with(cls, none)
+        assert ".save all" in netlist_with(cls, all_ + signals)
+
+    assert ".probe v(out) i(vdd)" in netlist_with(HspiceNetlister, signals)
+    assert ".option probe" in netlist_with(HspiceNetlister, none)
+
+    spectre = netlist_with(SpectreNetlister, signals)
+    assert "options save=selected" in spectre
+    assert "save out vdd:p" in spectre
+    assert "options save=none" in netlist_with(SpectreNetlister, none)
+
+    # Xyce selects signals in its `.print` statements, and omits them when saving nothing
+    xyce = netlist_with(XyceNetlister, signals)
+    assert ".print tran format=csv v(out) i(vdd)" in xyce
+    assert ".print" not in netlist_with(XyceNetlister, none)
+    assert ".print tran format=csv v(*) i(*)" in netlist_with(XyceNetlister, [])
+
+
+def test_xyce_missing_results(tmp_path):
+    """Test that missing Xyce results-files are only empty results when nothing is saved."""
+    from vlsirtools.spice import SimOptions
+    from vlsirtools.spice.xyce import XyceSim
+    from vlsirtools.netlist import XyceNetlister
+
+    opts = SimOptions(simulator=SupportedSimulators.XYCE, rundir=tmp_path / "run")
+    sim = XyceSim(inp=vsp.SimInput(), opts=opts)
+    sim.setup()
+
+    # Saving nothing writes no `.print` statement, and hence no results-file
+    sim.dut_netlister = XyceNetlister(dest=StringIO())
+    none = vsp.Save(mode=vsp.Save.SaveMode.NONE)
+    sim.dut_netlister.write_control_elements([vsp.Control(save=none)])
+    assert sim.read_results("tran.sp.csv", "tran") == dict()
+
+    # Otherwise a missing results-file is an error, e.g. from a crashed simulation
+    sim.dut_netlister = XyceNetlister(dest=StringIO())
+    with pytest.raises(RuntimeError) as e:
+        sim.read_results("tran.sp.csv", "tran")
+    assert str(sim.rundir) in str(e.value)
+
+
+def test_rundir_retention(tmp_path):
+    """Test scratch-rooted temporary run-directories, and their retention policies."""
+    from vlsirtools.spice import SimOptions, Retention
+    from vlsirtools.spice.xyce import XyceSim
+
+    def run(failed: bool = False, **kwargs) -> "Path":
+        opts = SimOptions(
+            simulator=SupportedSimulators.XYCE, scratch=tmp_path / "scratch", **kwargs
+        )
+        sim = XyceSim(inp=vsp.SimInput(), opts=opts)
+        sim.setup()
+        assert sim.rundir.parent == tmp_path / "scratch"
+        sim.open("netlist.sp", "w").write(1000 * "*")
+        sim.cleanup(failed=failed)
+        return sim.rundir
+
+    # Default: always delete
+    assert not run().exists()
+    assert not run(failed=True).exists()
+
+    # Keep only failures
+    assert not run(retention=Retention.KEEP_ON_FAILURE).exists()
+    failure = run(failed=True, retention=Retention.KEEP_ON_FAILURE)
+    assert failure.exists()
+
+    # Keep the last N
+    kept = [run(retention=Retention.KEEP_LAST, keep_last=2) for _ in range(4)]
+    assert [p.exists() for p in kept] == [False, False, True, True]
+    assert failure.exists()  # Not subject to pruning
+
+    # And with a size cap, which fits only the latest
+    latest = run(retention=Retention.KEEP_LAST, keep_last=2, keep_max_bytes=1500)
+    assert latest.exists()
+    assert not any(p.exists() for p in kept)
+
+
+def test_measure():
+    """Test the vectorized waveform-measurement functions."""
+    from vlsirtools.spice import measure
+
+    # Create a batch of ramps with different delays, on slightly different time-axes
+    results = []
+    for delay in (1.0, 2.0, 3.0):
+        t = np.linspace(0, 10, 1001 + int(delay))
+        inp = np.clip(t - 1.0, 0, 1)
+        out = np.clip(t - 1.0 - delay, 0, 1)
+        results.append(
+            sd.TranResult(
+                analysis_name="tran",
+                data={"TIME": t, "INP": inp, "OUT": out},
+                measurements={},
+            )
+        )
+
+    x, y = measure.stack(results, ["inp", "out"])
+    assert y.shape == (3, 2, 1004)
+    assert np.allclose(x[[0, -1]], [0, 10])
+
+    # Delays from the 50% point of the input to that of the output
+    delays = measure.delay(x, y[:, 0], y[:, 1], 0.5, 0.5, trig_edge=measure.Edge.RISE)
+    assert np.allclose(delays, [1.0, 2.0, 3.0], atol=1e-6)
+
+    # Crossings, vectorized across all results and signals
+    crossings = measure.cross(x, y, 0.5)
+    assert crossings.shape == (3, 2)
+    assert np.isnan(measure.cross(x, y, 2.0)).all()  # Never crosses
+    assert np.allclose(measure.rise_time(x, y, 0, 1), 0.8, atol=1e-6)
+    assert np.isnan(measure.fall_time(x, y, 0, 1)).all()
+
+    assert np.allclose(measure.maximum(x, y), 1.0)
+    assert np.allclose(measure.minimum(x, y, start=5.0), 1.0)
+    assert np.allclose(measure.average(x, y[:, 0], start=0, stop=2), 0.25, atol=1e-3)
+    assert np.allclose(measure.rms(x, y[:, 0], start=3, stop=4), 1.0)
+    assert np.allclose(measure.settling_time(x, y[:, 1]), [3.0, 4.0, 5.0], atol=1e-2)
+
+    # Loop-gain margins of a three-pole system
+    freq = np.logspace(0, 6, 601)
+    s = 2j * np.pi * freq
+    p = 2 * np.pi * 1e3
+    h = np.stack([k / (1 + s / p) ** 3 for k in (4.0, 10.0)])
+    gm = measure.gain_margin(freq, h)
+    assert np.allclose(gm, 20 * np.log10(8 / np.array([4, 10])), atol=0.05)
+    pm = measure.phase_margin(freq, h)
+    assert pm[0] > 0 > pm[1]
+
+
+def test_signal_table(tmp_path):
+    """Test the columnar `SignalTable` result-data container, and parsing nutbin data into it."""
+    from vlsirtools.spice.ngspice import parse_nutbin
+    from vlsirtools.spice.sim_data import SignalTable
+
+    # Create a small nutbin file, with three signals and four points
+    points = np.array([[0, 1, 2, 3], [0, 0.5, 1, 1], [1, 1, 0, 0]], dtype=float)
+    header = (
+        "Title: test\nPlotname: Transient Analysis\nFlags: real\n"
+        "No. Variables: 3\nNo. Points: 4\nVariables:\n"
+        "\t0\ttime\ttime\n\t1\tv(a)\tvoltage\n\t2\tv(b)\tvoltage\nBinary:\n"
+    )
+    path = tmp_path / "test.raw"
+    path.write_bytes(header.encode("ascii") + points.T.astype("<f8").tobytes())
+    nutbin = parse_nutbin(path.open("rb"))["Plotname: Transient Analysis\n"]
+
+    table = nutbin.data
+    assert isinstance(table, SignalTable)
+    assert table.array.shape == (3, 4)
+    assert table.array.flags["C_CONTIGUOUS"]
+    assert list(table.keys()) == ["time", "v(a)", "v(b)"]
+    assert np.array_equal(table["v(a)"], points[1])
+
+    # Zero-copy selections, by signal and by time
+    selected = table.select(["v(a)", "v(b)"])
+    assert np.shares_memory(selected.array, table.array)
+    windowed = table.window(start=1, stop=2)
+    assert np.shares_memory(windowed.array, table.array)
+    assert np.array_equal(windowed["v(b)"], [1, 0])
+
+    # Writing a sub-table's signals copies, rather than modifying its parent
+    before = table["v(a)"].copy()
+    selected["v(a)"] = np.full(4, 7.0)
+    assert np.array_equal(selected["v(a)"], np.full(4, 7.0))
+    assert np.array_equal(table["v(a)"], before)
+    assert not np.shares_memory(selected.array, table.array)
+
+    # Dictionary-style compatibility
+    table["v(c)"] = np.zeros(4)
+    assert len(table) == 4
+    del table["v(c)"]
+    assert "v(c)" not in table
+
+    # Results convert dictionaries to tables, and to flat proto data
+    tran = sd.TranResult(analysis_name="tr", data=dict(table), measurements={})
+    assert isinstance(tran.data, SignalTable)
+    proto = tran.to_proto()
+    assert list(proto.signals) == ["time", "v(a)", "v(b)"]
+    assert np.array_equal(proto.data, points.ravel())
+
+
+def example_sim_result() -> sd.SimResult:
+    """Create an example `sim_data.SimResult`, with one of each analysis-type with waveform data."""
+    t = np.linspace(0, 1e-9, 11)
+    f = np.logspace(3, 6, 4)
+    return sd.SimResult(
+        an=[
+            sd.OpResult(analysis_name="op", data={"v(a)": 1.0, "v(b)": 0.5}),
+            sd.DcResult(
+                analysis_name="dc",
+                indep_name="x",
+                data={"x": np.arange(3.0), "v(a)": np.ones(3)},
+                measurements={"m": 1.5},
+            ),
+            sd.TranResult(
+                analysis_name="tran",
+                data={"time": t, "v(a)": np.sin(t * 1e9)},
+                measurements={},
+            ),
+            sd.AcResult(
+                analysis_name="ac",
+                freq=f,
+                data={"v(a)": 1 / (1 + 1j * f / 1e4)},
+                measurements={},
+            ),
+        ]
+    )
+
+
+def check_exported_sim_result(result: sd.SimResult) -> None:
+    """Check a round-tripped copy of `example_sim_result`."""
+    expected = example_sim_result()
+    assert [type(a) for a in result.an] == [type(a) for a in expected.an]
+    assert result["op"].data == expected["op"].data
+    assert result["dc"].indep_name == "x"
+    assert result["dc"].measurements == {"m": 1.5}
+    for name in ("dc", "tran", "ac"):
+        assert list(result[name].data.keys()) == list(expected[name].data.keys())
+        for k, v in expected[name].data.items():
+            assert np.array_equal(result[name].data[k], v)
+    assert np.array_equal(result["ac"].freq, expected["ac"].freq)
+
+
+def test_export_npz(tmp_path):
+    """Test round-tripping `SimResult`s through NPZ files."""
+    from vlsirtools.spice import export
+
+    path = tmp_path / "result.npz"
+    export.write_npz(example_sim_result(), path)
+    result = export.read_npz(path)
+    check_exported_sim_result(result)
+    assert isinstance(result["tran"].data.array, np.memmap)
+
+    export.write_npz(example_sim_result(), path, compress=True)
+    check_exported_sim_result(export.read_npz(path))
+
+
+def test_export_arrow(tmp_path):
+    """Test round-tripping `SimResult`s through Arrow IPC and Parquet files."""
+    pytest.importorskip("pyarrow")
+    from vlsirtools.spice import export
+
+    export.write_arrow(example_sim_result(), tmp_path / "arrow")
+    check_exported_sim_result(export.read_arrow(tmp_path / "arrow"))
+    tables = export.open_arrow(tmp_path / "arrow")
+    assert tables[2].column_names == ["time", "v(a)"]
+
+    export.write_parquet(example_sim_result(), tmp_path / "parquet")
+    check_exported_sim_result(export.read_parquet(tmp_path / "parquet"))
+
+
+def test_resample():
+    """Test resampling transient data, with each `ResampleMethod`."""
+    from vlsirtools.spice import Resample, ResampleMethod
+    from vlsirtools.spice.sim_data import SignalTable
+
+    # A non-uniform time-axis, with a sharp pulse on one signal
+    t = np.sort(np.concatenate([np.linspace(0, 1, 10_000), [0.5001, 0.5002]]))
+    pulse = np.where((t > 0.5) & (t < 0.5003), 1.0, 0.0)
+    data = SignalTable(names=["TIME", "ramp", "pulse"], array=np.stack([t, t, pulse]))
+
+    uniform = Resample(npts=101).apply(data)
+    assert uniform.array.shape == (3, 101)
+    assert np.allclose(uniform["TIME"], np.linspace(0, 1, 101))
+    assert np.allclose(uniform["ramp"], uniform["TIME"])
+    stepped = Resample(tstep=0.01).apply(data)
+    assert np.allclose(np.diff(stepped["TIME"]), 0.01)
+
+    # Shape-preserving methods keep the pulse, which interpolation misses
+    for method in (ResampleMethod.MINMAX, ResampleMethod.LTTB):
+        for npts in (100, 101):
+            reduced = Resample(method=method, npts=npts).apply(data)
+            assert reduced.array.shape == (3, npts)
+            assert np.all(np.diff(reduced["TIME"]) > 0)
+            assert reduced["pulse"].max() == 1.0
+            assert reduced["TIME"][0] == 0 and reduced["TIME"][-1] == 1
+
+    with pytest.raises(ValueError):
+        Resample(method=ResampleMethod.LTTB, tstep=1e-3)
+
+
+def test_measurement_files(tmp_path):
+    """Test reading multi-row, multi-file measurement results."""
+    from vlsirtools.spice import meas
+
+    # Names and values both wrap across lines, as in multi-row alter and Monte Carlo results
+    (tmp_path / "tb.mt0").write_text(
+        "$DATA1 SOURCE='HSPICE'\n.TITLE 'tb'\n"
+        "tdelay trise\nalter#\n"
+        "1.0e-9 2.0e-10\n1\n"
+        "1.5e-9 failed\n2\n"
+    )
+    (tmp_path / "tb.mt10").write_text("$DATA1\n.TITLE 'tb'\ntdelay alter#\n3.0e-9 3\n")
+    (tmp_path / "tb.mt2").write_text("$DATA1\n.TITLE 'tb'\ntdelay trise alter#\n")
+
+    table = meas.read_files(tmp_path.glob("tb.mt*"), meas.parse_mt0)
+    assert list(table.keys()) == ["tdelay", "trise", "alter#"]
+    assert np.allclose(table["tdelay"], [1e-9, 1.5e-9, 3e-9])
+    assert np.allclose(table["alter#"], [1, 2, 3])
+    assert table["trise"][0] == 2e-10 and np.isnan(table["trise"][1:]).all()
+    assert meas.first_row(table) == {"tdelay": 1e-9, "trise": 2e-10, "alter#": 1.0}
+
+    # Larger files are parsed in one vectorized pass
+    rows = "\n".join(f"{i} {2 * i}" for i in range(100_000))
+    text = f"$DATA1\n.TITLE 'tb'\na b\n{rows}\n"
+    table = meas.parse_mt0(StringIO(text))
+    assert table["b"].shape == (100_000,)
+    assert table["b"][-1] == 2 * 99_999
+
+    # Failed first measurements are values, not names
+    text = "$DATA1\n.TITLE 'tb'\ndelay rise temper alter#\nfailed 1.0e-9 25.0 1\n"
+    table = meas.parse_mt0(StringIO(text))
+    assert list(table.keys()) == ["delay", "rise", "temper", "alter#"]
+    assert np.isnan(table["delay"][0]) and table["rise"][0] == 1e-9
+
+    xyce = meas.parse_name_value(StringIO("DELAY = 1.0\nRISE = FAILED\n\n"))
+    assert xyce["DELAY"] == [1.0] and np.isnan(xyce["RISE"][0])
+
+
+def test_binary_sim_result_proto():
+    """Test round-tripping `SimResult`s through protos, with both `repeated` and `BinaryArray` data."""
+    result = example_sim_result()
+    for binary in (False, True):
+        proto = result.to_proto(binary=binary)
+        assert proto.an[2].tran.HasField("binary_data") == binary
+        check_exported_sim_result(sd.SimResult.from_proto(proto))
+
+    proto = result.to_proto(binary=True)
+    assert not proto.an[2].tran.data and not proto.an[3].ac.data
+    ac = proto.an[3].ac.binary_data
+    assert ac.dtype == vsp.BinaryArray.COMPLEX128
+    assert len(ac.data) == 16 * np.prod(ac.shape)
+    # Decoding is zero-copy, producing read-only views of the proto's bytes
+    data = sd.from_binary_array(proto.an[2].tran.binary_data)
+    assert not data.flags.writeable
+
+
+def test_result_stream():
+    """Test round-tripping `SimResult`s through chunked result-streams."""
+    from io import BytesIO
+    from vlsirtools.delimited import encode_varint, read_varint
+    from vlsirtools.spice import stream
+
+    for value in (0, 1, 127, 128, 300, 2**40):
+        assert read_varint(BytesIO(encode_varint(value))) == value
+
+    # Small chunks, so that each waveform analysis is split across several
+    buf = BytesIO()
+    nbytes = stream.write_stream(example_sim_result(), buf, chunk_bytes=64)
+    assert nbytes == len(buf.getvalue())
+    buf.seek(0)
+    check_exported_sim_result(stream.read_stream(buf))
+
+    buf.seek(0)
+    items = list(stream.iter_stream(buf))
+    chunks = [i for i in items if isinstance(i, stream.StreamChunk)]
+    assert len(items) - len(chunks) == 4  # One per analysis
+    tran = [c for c in chunks if c.an.analysis_name == "tran"]
+    assert [c.start for c in tran] == [0, 4, 8]
+    assert all(c.num_points == 11 for c in tran)
+
+    # Incremental writes must match their header
+    writer = stream.ResultStreamWriter(BytesIO())
+    writer.write_header(example_sim_result()["tran"], num_points=4)
+    with pytest.raises(ValueError):
+        writer.write_chunk(np.zeros((3, 2)))
+    writer.write_chunk(np.zeros((2, 3)))
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+
+def test_lazy_imports():
+    """Test that netlisting never loads simulation dependencies, which are instead loaded on first use."""
+    import subprocess, sys
+
+    script = """
+import sys
+import vlsirtools, vlsirtools.netlist
+assert "numpy" not in sys.modules and "pandas" not in sys.modules
+assert "vlsirtools.spice" not in sys.modules
+vlsirtools.xyce.sim
+assert "vlsirtools.spice.xyce" in sys.modules and "pandas" not in sys.modules
+assert vlsirtools.primitives.dct["resistor"] is vlsirtools.primitives.resistor
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_netlist_batch(tmp_path):
+    """Test batch netlisting, from directories, manifests and streams, via both the API and CLI."""
+    import subprocess, sys
+    import vlsir.netlist_pb2 as vnl
+    from vlsirtools.delimited import write_delimited
+    from vlsirtools.netlist.batch import iter_inputs, netlist_batch
+
+    def inp(idx: int, fmt: int) -> vnl.NetlistInput:
+        return vnl.NetlistInput(
+            pkg=dummy_testbench_package(),
+            netlist_path=str(tmp_path / f"{idx}.netlist"),
+            fmt=fmt,
+            result_path=str(tmp_path / f"{idx}.result.pb"),
+        )
+
+    # The testbench is not verilog-compatible, so the last input fails
+    fmts = [vnl.NetlistFormat.SPICE, vnl.NetlistFormat.SPECTRE]
+    fmts += [vnl.NetlistFormat.VERILOG]
+    inputs = [inp(idx, fmt) for idx, fmt in enumerate(fmts)]
+
+    (tmp_path / "inputs").mkdir()
+    for idx, x in enumerate(inputs):
+        (tmp_path / "inputs" / f"{idx}.pb").write_bytes(x.SerializeToString())
+    (tmp_path / "manifest.txt").write_text("# Inputs\ninputs/0.pb\ninputs/1.pb\n")
+    with open(tmp_path / "stream.pb", "wb") as f:
+        for x in inputs:
+            write_delimited(f, x)
+
+    assert list(iter_inputs(tmp_path / "inputs")) == inputs
+    assert list(iter_inputs(tmp_path / "manifest.txt", manifest=True)) == inputs[:2]
+    assert list(iter_inputs(tmp_path / "stream.pb")) == inputs
+
+    results = netlist_batch(inputs, jobs=2)
+    assert [r.success for r in results] == [True, True, False]
+    assert "subckt" in (tmp_path / "1.netlist").read_text()
+    result = vnl.NetlistResult.FromString((tmp_path / "2.result.pb").read_bytes())
+    assert result.fail
+
+    cmd = [sys.executable, "-m", "vlsirtools.cli", "batch", str(tmp_path / "stream.pb")]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    assert proc.returncode == 1
+    assert "Netlisted 2 of 3 inputs" in proc.stdout
+
+
+def test_sim_to_stream(monkeypatch):
+    """Test writing batch-simulation results to a length-delimited stream, in input order."""
+    import time
+    from io import BytesIO
+    from vlsirtools.delimited import iter_delimited
+    from vlsirtools.spice import SimOptions, sim_to_stream
+    from vlsirtools.spice.xyce import XyceSim
+    from vlsirtools.spice.telemetry import SimTelemetry
+
+    def fake_sim(cls, io):
+        # Later inputs finish first
+        time.sleep(0.02 * (3 - len(io.inp.top)))
+        result = vsp.SimResult(an=[vsp.AnalysisResult(op=vsp.OpResult())])
+        result.an[0].op.analysis_name = io.inp.top
+        return result, SimTelemetry()
+
+    monkeypatch.setattr(XyceSim, "apply_with_telemetry", classmethod(fake_sim))
+    inputs = [vsp.SimInput(top="a" * (i + 1)) for i in range(3)]
+    opts = SimOptions(simulator=SupportedSimulators.XYCE, jobs=3)
+
+    buf = BytesIO()
+    assert sim_to_stream(inputs, buf, opts) == 3
+    buf.seek(0)
+    results = list(iter_delimited(buf, vsp.SimResult))
+    assert [r.an[0].op.analysis_name for r in results] == ["a", "aa", "aaa"]
+
+
+def test_server(tmp_path):
+    """Test netlisting and simulating via a `VlsirServer`, on a Unix-domain socket."""
+    import threading
+    import vlsir.netlist_pb2 as vnl
+    from vlsirtools.server import VlsirServer, Client, ServerError
+
+    path = tmp_path / "vlsir.sock"
+    server = VlsirServer(path, jobs=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with Client(path) as client:
+            # Several requests share each connection
+            fmts = [vnl.NetlistFormat.SPICE, vnl.NetlistFormat.XYCE]
+            for idx, fmt in enumerate(fmts):
+                inp = vnl.NetlistInput(
+                    pkg=dummy_testbench_package(),
+                    netlist_path=str(tmp_path / f"{idx}.sp"),
+                    fmt=fmt,
+                )
+                assert client.netlist(inp).success
+                assert (tmp_path / f"{idx}.sp").exists()
+
+            inp.fmt = vnl.NetlistFormat.VERILOG
+            assert client.netlist(inp).fail
+
+            # Simulation errors, here for the lack of any simulator, are reported as `ServerError`s
+            with pytest.raises(ServerError):
+                client.sim(vsp.SimInput(top="nonexistent"))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not path.exists()
+
+
+def test_netlist_sharded(tmp_path):
+    """Test sharded netlisting, and that unchanged shards are not re-written."""
+    from vlsirtools.netlist import netlist_sharded
+
+    pkg = dummy_testbench_package()
+    second = pkg.modules.add()
+    second.CopyFrom(pkg.modules[0])
+    second.name = "second_testbench"
+    result = netlist_sharded(pkg, tmp_path, fmt="spice")
+    assert result.top == tmp_path / "top.sp"
+    assert len(result.shards) == len(pkg.modules)
+    assert result.written == result.shards + [result.top]
+    top = result.top.read_text()
+    for path in result.shards:
+        assert f".include '{path.relative_to(tmp_path).as_posix()}'" in top
+        assert ".SUBCKT" in path.read_text()
+
+    # Re-netlisting an unchanged package writes nothing
+    again = netlist_sharded(pkg, tmp_path, fmt="spice")
+    assert again.shards == result.shards
+    assert again.written == []
+
+    # Grouping modules removes the now-stale shards
+    grouped = netlist_sharded(pkg, tmp_path, fmt="spice", modules_per_shard=100)
+    assert len(grouped.shards) == 1
+    assert sorted(grouped.removed) == sorted(result.shards[1:])
+    assert sorted((tmp_path / "modules").iterdir()) == grouped.shards
+
+
+def test_flatten():
+    """Test flattening a hierarchy with buses, slices, concatenations and parameters."""
+    from vlsir.circuit_pb2 import Slice, Concat
+    from vlsirtools.netlist import flatten, FlattenOptions
+
+    def res(name: str, p: ConnectionTarget, r: str) -> Instance:
+        return Instance(
+            name=name,
+            module=Reference(
+                external=QualifiedName(domain="vlsir.primitives", name="resistor")
+            ),
+            connections=[
+                Connection(portname="p", target=p),
+                Connection(portname="n", target=ConnectionTarget(sig="n")),
+            ],
+            parameters=[Param(name="r", value=ParamValue(literal=r))],
+        )
+
+    def bit(signal: str, idx: int) -> ConnectionTarget:
+        return ConnectionTarget(slice=Slice(signal=signal, top=idx, bot=idx))
+
+    # A two-resistor divider, with a two-bit bus port
+    divider = Module(
+        name="divider",
+        ports=[Port(signal="bus"), Port(signal="n")],
+        signals=[Signal(name="bus", width=2), Signal(name="n", width=1)],
+        parameters=[Param(name="rval", value=ParamValue(int64_value=1))],
+        instances=[
+            res("r0", bit("bus", 1), "rval*2"),
+            res("r1", bit("bus", 0), "rval"),
+        ],
+    )
+    # Instantiated with a concatenation of a scalar and a slice of a bus
+    bus = ConnectionTarget(
+        concat=Concat(parts=[ConnectionTarget(sig="a"), bit("b", 2)])
+    )
+    top = Module(
+        name="top",
+        ports=[Port(signal="VSS")],
+        signals=[
+            Signal(name="VSS", width=1),
+            Signal(name="a", width=1),
+            Signal(name="b", width=3),
+        ],
+        instances=[
+            Instance(
+                name="x1",
+                module=Reference(local="divider"),
+                connections=[
+                    Connection(portname="bus", target=bus),
+                    Connection(portname="n", target=ConnectionTarget(sig="VSS")),
+                ],
+                parameters=[Param(name="rval", value=ParamValue(int64_value=5))],
+            ),
+        ],
+    )
+    # And in turn instantiated by `nested`, making its signals internal
+    nested = Module(
+        name="nested",
+        ports=[Port(signal="VSS")],
+        signals=[Signal(name="VSS", width=1)],
+        instances=[
+            Instance(
+                name="xt",
+                module=Reference(local="top"),
+                connections=[
+                    Connection(portname="VSS", target=ConnectionTarget(sig="VSS"))
+                ],
+            )
+        ],
+    )
+    pkg = Package(domain="flat", modules=[divider, top, nested])
+
+    flat = flatten(pkg, "top", FlattenOptions(sep="/"))
+    assert flat.name == "top"
+    assert [s.name for s in flat.signals] == ["VSS", "a", "b"]
+    assert [i.name for i in flat.instances] == ["x1/r0", "x1/r1"]
+    r0, r1 = flat.instances
+    assert r0.connections[0].target == ConnectionTarget(sig="a")
+    assert r1.connections[0].target == bit("b", 2)
+    assert r0.parameters[0].value.literal == "(5)*2"
+    assert r1.parameters[0].value.int64_value == 5
+
+    flat = flatten(pkg, "nested")
+    signals = ["VSS", "xt.a", "xt.b_2", "xt.b_1", "xt.b_0"]
+    assert [s.name for s in flat.signals] == signals
+    assert [i.name for i in flat.instances] == ["xt.x1.r0", "xt.x1.r1"]
+    assert flat.instances[1].connections[0].target == ConnectionTarget(sig="xt.b_2")
+    assert flat.instances[1].connections[1].target == ConnectionTarget(sig="VSS")
+
+    # The flat module netlists
+    dest = StringIO()
+    vlsirtools.netlist(
+        pkg=Package(domain="flat", modules=[flat]), dest=dest, fmt="spice"
+    )
+    assert "xt.x1.r1" in dest.getvalue()
+
+    # Default values referencing other parameters are resolved against the instance's values
+    leaf = Module(
+        name="leaf",
+        ports=[Port(signal="bus"), Port(signal="n")],
+        signals=[Signal(name="bus", width=2), Signal(name="n", width=1)],
+        parameters=[
+            Param(name="w", value=ParamValue(int64_value=1)),
+            Param(name="l", value=ParamValue(literal="w*2")),
+        ],
+        instances=[res("r", bit("bus", 0), "l+w")],
+    )
+    top.instances[0].module.local = "leaf"
+    top.instances[0].ClearField("parameters")
+    top.instances[0].parameters.append(Param(name="w", value=ParamValue(int64_value=7)))
+    flat = flatten(Package(domain="flat", modules=[leaf, top]), "top")
+    assert flat.instances[0].parameters[0].value.literal == "((7)*2)+(7)"
+
+
+def test_netlist_compressed(tmp_path):
+    """Test netlisting to compressed destinations, by path suffix and by option."""
+    import gzip, lzma
+    import vlsir.netlist_pb2 as vnl
+    from vlsirtools.netlist import NetlistOptions, netlist_from_proto
+
+    pkg = dummy_testbench_package()
+    plain = StringIO()
+    vlsirtools.netlist(pkg=pkg, dest=plain, fmt="spice")
+    plain = plain.getvalue()
+
+    vlsirtools.netlist(pkg=pkg, dest=tmp_path / "tb.sp.gz", fmt="spice")
+    assert gzip.decompress((tmp_path / "tb.sp.gz").read_bytes()).decode() == plain
+
+    # By option, to an (binary) IO destination
+    opts = NetlistOptions(compression="xz")
+    with open(tmp_path / "tb.sp.compressed", "wb") as f:
+        vlsirtools.netlist(pkg=pkg, dest=f, fmt="spice", opts=opts)
+    assert (
+        lzma.decompress((tmp_path / "tb.sp.compressed").read_bytes()).decode() == plain
+    )
+
+    # Via `NetlistInput`
+    path = tmp_path / "input.sp.gz"
+    inp = vnl.NetlistInput(pkg=pkg, netlist_path=str(path), fmt=vnl.NetlistFormat.SPICE)
+    assert netlist_from_proto(inp).success
+    assert gzip.decompress(path.read_bytes()).decode() == plain
+
+
+def test_parse(tmp_path):
+    """Test parsing SPICE, CDL and Spectre netlists into packages."""
+    import gzip
+    from vlsirtools.parse import parse, iter_parse, ParseError
+
+    spice = """* Header comment
+.SUBCKT top_cell a y VDD VSS
+XINV a mid VDD VSS inv_cell wp=1u
++ wn=0.5u $ inline comment
+xinv2 mid y vdd vss inv_cell
+R1 y VSS 1k
+.ENDS
+.subckt inv_cell a y vdd vss params: wp=2u wn=1u
+mp y a vdd vdd pch w=wp l=0.15u
+mn y a vss vss nch w=wn l=0.15u
+.ends
+"""
+    pkg = parse(StringIO(spice), fmt="spice")
+    # Modules are emitted dependencies-first, with models as `ExternalModule`s
+    assert [m.name for m in pkg.modules] == ["inv_cell", "top_cell"]
+    assert sorted(e.name.name for e in pkg.ext_modules) == ["nch", "pch"]
+    inv, top = pkg.modules
+    assert [p.name for p in inv.parameters] == ["wp", "wn"]
+    assert [i.name for i in top.instances] == ["XINV", "xinv2", "R1"]
+    xinv = top.instances[0]
+    assert xinv.module.local == "inv_cell"
+    assert [(p.name, p.value.literal) for p in xinv.parameters] == [
+        ("wp", "1u"),
+        ("wn", "0.5u"),
+    ]
+    # SPICE nodes are case-insensitive, and take the spelling of their first appearance
+    assert [c.target.sig for c in top.instances[1].connections] == [
+        "mid",
+        "y",
+        "VDD",
+        "VSS",
+    ]
+    assert [sig.name for sig in top.signals] == ["a", "y", "VDD", "VSS", "mid"]
+    r1 = top.instances[2]
+    assert r1.module.external.domain == "vlsir.primitives"
+    assert r1.parameters[0].value.literal == "1k"
+
+    # Round-trip through the netlister and back, in another format
+    dest = StringIO()
+    vlsirtools.netlist(pkg=pkg, dest=dest, fmt="spectre")
+    again = parse(StringIO(dest.getvalue()), fmt="spectre")
+    assert [m.name for m in again.modules] == ["inv_cell", "top_cell"]
+    assert len(again.modules[1].instances) == 3
+
+    # CDL, with port directions, model annotations, and undefined sub-circuits
+    cdl = """.SUBCKT buf a y vdd vss
+*.PININFO a:I y:O vdd:B vss:B
+X0 a y vdd vss / missing
+R0 a y 2k $[rpoly]
+.ENDS
+"""
+    path = tmp_path / "buf.cdl.gz"
+    path.write_bytes(gzip.compress(cdl.encode()))
+    items = list(iter_parse(path, fmt="cdl"))
+    assert [type(i).__name__ for i in items] == [
+        "ExternalModule",
+        "ExternalModule",
+        "Module",
+    ]
+    buf = items[-1]
+    directions = [vckt.Port.Direction.Name(p.direction) for p in buf.ports]
+    assert directions == ["INPUT", "OUTPUT", "INOUT", "INOUT"]
+    assert buf.instances[1].module.external.name == "rpoly"
+
+    # Spectre, switching to SPICE mid-netlist
+    spectre = """simulator lang=spectre
+model nch bsim4 type=n
+subckt inv (a y vdd vss)
+parameters wn=1u
+mn (y a vss vss) nch w=wn l=(2*0.15u)
+ends inv
+simulator lang=spice
+X1 a y vdd vss inv wn=2u
+"""
+    pkg = parse(StringIO(spectre), fmt="spectre")
+    assert [m.name for m in pkg.modules] == ["inv", "top"]
+    assert pkg.modules[0].instances[0].parameters[1].value.literal == "(2*0.15u)"
+
+    with pytest.raises(ParseError) as e:
+        parse(StringIO(".subckt a x\n.ends\nX1 x y a\n"))
+    assert "Line 3" in str(e.value)
+
+
+def test_instance_arrays():
+    """Test combining runs of regular instances into arrays."""
+    from vlsir.circuit_pb2 import Slice
+    from vlsirtools.netlist import NetlistOptions
+
+    def bit(idx: int) -> ConnectionTarget:
+        return ConnectionTarget(slice=Slice(signal="d", top=idx, bot=idx))
+
+    inv = Module(
+        name="inv",
+        ports=[
+            Port(signal="i", direction=Port.Direction.INPUT),
+            Port(signal="o", direction=Port.Direction.OUTPUT),
+        ],
+        signals=[Signal(name="i", width=1), Signal(name="o", width=1)],
+    )
+    ref = Reference(local="inv")
+    instances = [
+        Instance(
+            name=f"xinv_{idx}",
+            module=ref,
+            connections=[
+                Connection(portname="i", target=bit(idx)),
+                Connection(portname="o", target=ConnectionTarget(sig="y")),
+            ],
+        )
+        for idx in range(8)
+    ]
+    # Plus a run of identical, parallel instances
+    instances += [
+        Instance(
+            name=f"xpar{idx}",
+            module=ref,
+            connections=[
+                Connection(portname="i", target=ConnectionTarget(sig="y")),
+                Connection(portname="o", target=ConnectionTarget(sig="z")),
+            ],
+        )
+        for idx in range(4)
+    ]
+    top = Module(
+        name="top",
+        ports=[Port(signal="d", direction=Port.Direction.INPUT)],
+        signals=[
+            Signal(name="d", width=8),
+            Signal(name="y", width=1),
+            Signal(name="z", width=1),
+        ],
+        instances=instances,
+    )
+    pkg = Package(domain="arrays", modules=[inv, top])
+    opts = NetlistOptions(instance_arrays=True)
+
+    dest = StringIO()
+    vlsirtools.netlist(pkg=pkg, dest=dest, fmt="verilog", opts=opts)
+    verilog = dest.getvalue()
+    assert "xinv[7:0]" in verilog
+    assert ".i(d[7:0])" in verilog
+    assert "xinv_3" not in verilog
+    # The parallel instances are not named as Verilog arrays, and are written one at a time
+    assert "xpar3" in verilog
+
+    dest = StringIO()
+    vlsirtools.netlist(pkg=pkg, dest=dest, fmt="spectre", opts=opts)
+    spectre = dest.getvalue()
+    assert "xinv_7" in spectre
+    assert "m=4" in spectre
+    assert "xpar1" not in spectre
+
+    # Off by default
+    dest = StringIO()
+    vlsirtools.netlist(pkg=pkg, dest=dest, fmt="spectre")
+    assert "m=4" not in dest.getvalue()
+    assert "xpar3" in dest.getvalue()
+
+
+def test_fold_params():
+    """Test constant-folding and hoisting instance parameter values."""
+    from vlsirtools.netlist import fold_params, FoldOptions, NetlistOptions
+
+    def lit(text: str) -> ParamValue:
+        return ParamValue(literal=text)
+
+    res = Reference(external=QualifiedName(domain="vlsir.primitives", name="resistor"))
+    conns = [
+        Connection(portname="p", target=ConnectionTarget(sig="a")),
+        Connection(portname="n", target=ConnectionTarget(sig="b")),
+    ]
+    values = ["'2*0.5k'", "1000", "w*nf", "w*nf", "w*nf", "1/0", "1.5e-6*2"]
+    instances = [
+        Instance(
+            name=f"r{idx}",
+            module=res,
+            connections=conns,
+            parameters=[Param(name="r", value=lit(value))],
+        )
+        for idx, value in enumerate(values)
+    ]
+    instances.append(
+        Instance(
+            name="rp",
+            module=res,
+            connections=conns,
+            parameters=[
+                Param(
+                    name="r",
+                    value=ParamValue(
+                        prefixed=vutils.Prefixed(
+                            prefix=vutils.SIPrefix.MICRO, string_value="2500"
+                        )
+                    ),
+                )
+            ],
+        )
+    )
+    module = Module(
+        name="rs",
+        signals=[Signal(name="a", width=1), Signal(name="b", width=1)],
+        parameters=[
+            Param(name="w", value=ParamValue(int64_value=1)),
+            Param(name="nf", value=ParamValue(int64_value=2)),
+        ],
+        instances=instances,
+    )
+    pkg = Package(domain="fold", modules=[module])
+
+    folded = fold_params(pkg).modules[0]
+    rvals = [inst.parameters[0].value for inst in folded.instances]
+    assert rvals[0] == ParamValue(int64_value=1000)
+    assert rvals[1] == ParamValue(int64_value=1000)
+    # Repeated expressions are hoisted into a module parameter
+    assert [p.name for p in folded.parameters] == ["w", "nf", "vlsir_expr0"]
+    assert folded.parameters[2].value == lit("w*nf")
+    assert rvals[2] == rvals[3] == rvals[4] == lit("vlsir_expr0")
+    # Non-constant values are left as-is
+    assert rvals[5] == lit("1/0")
+    assert rvals[6].prefixed == vutils.Prefixed(
+        prefix=vutils.SIPrefix.MICRO, int64_value=3
+    )
+    assert rvals[7].prefixed == vutils.Prefixed(
+        prefix=vutils.SIPrefix.MILLI, string_value="2.5"
+    )
+    # The original package is unmodified
+    assert pkg.modules[0].instances[0].parameters[0].value == lit("'2*0.5k'")
+
+    # Hoisting only
+    opts = FoldOptions(fold=False, hoist_min_uses=3)
+    folded = fold_params(pkg, opts).modules[0]
+    assert folded.instances[0].parameters[0].value == lit("'2*0.5k'")
+    assert len(folded.parameters) == 3
+
+    # And via the netlisting options
+    dest = StringIO()
+    opts = NetlistOptions(fold_params=True)
+    vlsirtools.netlist(pkg=pkg, dest=dest, fmt="spectre", opts=opts)
+    assert "vlsir_expr0=w*nf" in dest.getvalue()
+    assert "r=2.5m" in dest.getvalue()
+    # SPICE dialects declare hoisted expressions in the same form as instance values
+    for fmt, decl in [("spice", "vlsir_expr0='w*nf'"), ("xyce", "vlsir_expr0={w*nf}")]:
+        dest = StringIO()
+        vlsirtools.netlist(pkg=pkg, dest=dest, fmt=fmt, opts=opts)
+        assert decl in dest.getvalue()
+
+    # Suffixes are read per format: `M` is milli in SPICE, and mega in Spectre
+    mega = Package(domain="fold", modules=[Module(name="m", instances=instances[:1])])
+    mega.modules[0].instances[0].parameters[0].value.literal = "1M"
+
+    def value(fmt) -> Param:
+        return fold_params(mega, fmt=fmt).modules[0].instances[0].parameters[0]
+
+    assert value("spice").value.prefixed.prefix == vutils.SIPrefix.MILLI
+    assert value("spectre").value == ParamValue(int64_value=1_000_000)
+    # Ambiguous suffixes are not folded for multiple formats, nor for Verilog, which has none
+    assert value(["spice", "spectre"]).value == lit("1M")
+    assert value("verilog").value == lit("1M")
+    # As are values which overflow a double
+    mega.modules[0].instances[0].parameters[0].value.literal = "1e300*1e300"
+    assert value("spice").value == lit("1e300*1e300")
+
+
+def test_format_prefixed():
+    """Test formatting `Prefixed` values, via the per-class prefix tables and memo."""
+    from vlsirtools.netlist import SpiceNetlister, VerilogNetlister
+    from vlsirtools.netlist.base import _prefixed_memos
+
+    _prefixed_memos.clear()
+    micro = vutils.Prefixed(prefix=vutils.SIPrefix.MICRO, int64_value=5)
+    assert SpiceNetlister.format_prefixed(micro) == "5u"
+    assert _prefixed_memos[SpiceNetlister] == {(vutils.SIPrefix.MICRO, 5): "5u"}
+    assert VerilogNetlister.format_prefixed(micro) == "5e-6"
+    assert _prefixed_memos[VerilogNetlister] == {(vutils.SIPrefix.MICRO, 5): "5e-6"}
+    # Second time through, from the memo
+    _prefixed_memos[SpiceNetlister][(vutils.SIPrefix.MICRO, 5)] = "memoized"
+    assert SpiceNetlister.format_prefixed(micro) == "memoized"
+    _prefixed_memos.clear()
+    kilo = vutils.Prefixed(prefix=vutils.SIPrefix.KILO, string_value="1.5")
+    assert SpiceNetlister.format_prefixed(kilo) == "1.5K"
+    with pytest.raises(ValueError):
+        SpiceNetlister.format_prefixed(
+            vutils.Prefixed(prefix=vutils.SIPrefix.MICRO, double_value=1.0)
+        )
+
+
+def test_netlist_profile(tmp_path):
+    """Test profiling netlisting via `NetlistOptions.profile`."""
+    import json
+    from vlsirtools.netlist import NetlistOptions, NetlistProfile
+
+    pkg = dummy_testbench_package()
+    profile = NetlistProfile(trace=True)
+    dest = StringIO()
+    vlsirtools.netlist(
+        pkg=pkg, dest=dest, fmt="spice", opts=NetlistOptions(profile=profile)
+    )
+    assert profile.methods["write_module_definition"].calls == 1
+    assert profile.methods["write_instance"].calls == 2
+    assert profile.methods["resolve_reference"].calls >= 2
+    # All but the package header is attributed to the module
+    assert 0 < profile.module_bytes["dummy_testbench"] < len(dest.getvalue())
+    assert "write_instance" in profile.report()
+
+    path = tmp_path / "trace.json"
+    profile.write_chrome_trace(path)
+    trace = json.loads(path.read_text())
+    names = {e["name"] for e in trace["traceEvents"]}
+    assert "write_module_definition" in names
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
+
+    # Chrome traces require `trace`
+    with pytest.raises(RuntimeError):
+        NetlistProfile().to_chrome_trace()
+
+
+def test_netlist_multi(tmp_path):
+    """Test netlisting to several formats in a single pass, via `netlist_multi`."""
+    from vlsirtools.netlist import netlist_multi
+
+    pkg = dummy_testbench_package()
+    expected = dict()
+    for fmt in ("spectre", "spice", "xyce"):
+        dest = StringIO()
+        vlsirtools.netlist(pkg=pkg, dest=dest, fmt=fmt)
+        expected[fmt] = dest.getvalue()
+
+    spectre, spice = StringIO(), StringIO()
+    path = tmp_path / "dummy.cir"
+    netlist_multi(pkg, [("spectre", spectre), ("spice", spice), ("xyce", path)])
+    assert spectre.getvalue() == expected["spectre"]
+    assert spice.getvalue() == expected["spice"]
+    assert path.read_text() == expected["xyce"]
+
+
+def test_parse_dialects():
+    """Test parsing the netlists of each SPICE dialect and Spectre, including their own output."""
+    from vlsirtools.parse import parse, ParseOptions, ParseError
+
+    res = Reference(external=QualifiedName(domain="vlsir.primitives", name="resistor"))
+
+    def conns(*pairs) -> List[Connection]:
+        return [
+            Connection(portname=p, target=ConnectionTarget(sig=s)) for p, s in pairs
+        ]
+
+    inv = Module(
+        name="inv",
+        ports=[Port(signal="a"), Port(signal="y")],
+        signals=[Signal(name="a", width=1), Signal(name="y", width=1)],
+        parameters=[Param(name="wp", value=ParamValue(int64_value=1))],
+        instances=[
+            Instance(
+                name="r1",
+                module=res,
+                connections=conns(("p", "a"), ("n", "y")),
+                parameters=[Param(name="r", value=ParamValue(literal="wp*2"))],
+            )
+        ],
+    )
+    top = Module(
+        name="top",
+        ports=[Port(signal="VSS")],
+        signals=[Signal(name="VSS", width=1), Signal(name="x", width=1)],
+        instances=[
+            Instance(
+                name="xi",
+                module=Reference(local="inv"),
+                connections=conns(("a", "x"), ("y", "VSS")),
+                parameters=[Param(name="wp", value=ParamValue(int64_value=3))],
+            )
+        ],
+    )
+    pkg = Package(domain="dialects", modules=[inv, top])
+
+    # Round-trip through each format's netlister
+    for fmt in ("spice", "xyce", "ngspice", "hspice", "spectre"):
+        dest = StringIO()
+        vlsirtools.netlist(pkg=pkg, dest=dest, fmt=fmt)
+        again = parse(StringIO(dest.getvalue()), fmt=fmt)
+        assert [m.name for m in again.modules] == ["inv", "top"], fmt
+        assert len(again.ext_modules) == 0, fmt
+        r1 = again.modules[0].instances[0]
+        assert r1.module == res, fmt
+        assert [(p.name, p.value.literal) for p in r1.parameters] == [("r", "wp*2")]
+        xi = again.modules[1].instances[0]
+        assert xi.module.local == "inv", fmt
+        assert [p.name for p in xi.parameters] == ["wp"], fmt
+
+    # HSPICE and Xyce `PARAMS:` instance parameters
+    for fmt in ("hspice", "xyce"):
+        src = ".subckt sub a b params: w=2\n.ends\nx1 a b sub PARAMS: w=1\n"
+        pkg = parse(StringIO(src), fmt=fmt)
+        x1 = pkg.modules[1].instances[0]
+        assert x1.module.local == "sub"
+        assert [(p.name, p.value.int64_value) for p in x1.parameters] == [("w", 1)]
+
+    # SPICE decks begin with a title line, unless they begin with a comment or directive
+    deck = "My test deck\nR1 a b 1k\n"
+    assert parse(StringIO(deck)).modules[0].instances[0].name == "R1"
+    lib = ".subckt sub a b\n.ends\n"
+    assert [m.name for m in parse(StringIO(lib)).modules] == ["sub"]
+    with pytest.raises(ParseError):
+        parse(StringIO(deck), opts=ParseOptions(title=False))
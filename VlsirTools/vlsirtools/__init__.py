@@ -1,22 +1,41 @@
 """
 # Vlsir Tools
+
+Simulation (`spice`), simulator-specific (`xyce`, `spectre`, `ngspice`), and `primitives` modules
+are loaded lazily, on first attribute access, so that netlist-only usage never loads simulator dependencies.
 """
 
 __version__ = "7.0.0"  # VLSIR_VERSION
 
+import importlib
+
 # Python module namespaces
-from . import spice
 from . import spicetype
 from .spicetype import SpiceType
 
-# Primitive Definitions
-from . import primitives  # The python module
-
 # Note `vlsirtools.netlist` becomes a *function* here, where there is also a *module* by that name. Maybe not ideal.
 from .netlist import netlist
 
-# Pull the `spice/{simulator}` namespaces into the `vlsirtools` namespace as well
+# Lazily-loaded modules, and their (relative) import paths.
+# Note this includes the `spice/{simulator}` namespaces, which are pulled into the `vlsirtools` namespace as well.
 # FIXME: probably integrate netlisting into these at some point
-from .spice import xyce
-from .spice import spectre
-from .spice import ngspice
+_LAZY_MODULES = {
+    "spice": ".spice",
+    "primitives": ".primitives",
+    "xyce": ".spice.xyce",
+    "spectre": ".spice.spectre",
+    "ngspice": ".spice.ngspice",
+}
+
+
+def __getattr__(name: str):
+    """Module-level attribute access (PEP 562), importing `_LAZY_MODULES` on first use."""
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_MODULES))
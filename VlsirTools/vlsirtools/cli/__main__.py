@@ -3,6 +3,7 @@
 """
 
 # Std-Lib Imports
+import sys
 import argparse
 from enum import Enum
 from pathlib import Path
@@ -10,8 +11,10 @@ from typing import Any
 
 # Local Imports
 import vlsir
+import vlsir.spice_pb2 as vsp
 from .. import __version__
 from ..netlist import netlist_from_proto
+from ..netlist.batch import iter_inputs, netlist_batch, write_result
 
 
 class Actions(Enum):
@@ -23,7 +26,9 @@ class Actions(Enum):
 
     VERSION = "version"
     NETLIST = "netlist"
+    BATCH = "batch"  # Batch netlisting
     SIM = "sim"
+    SERVE = "serve"  # Long-running server, on Unix-domain socket `target`
 
 
 def main() -> Any:
@@ -33,17 +38,45 @@ def main() -> Any:
     parser = argparse.ArgumentParser()
     parser.add_argument("action", choices=[a.value for a in Actions])
     parser.add_argument("target", type=Path)
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="Number of parallel jobs"
+    )
+    parser.add_argument(
+        "--manifest",
+        action="store_true",
+        help="Read `target` as a manifest of input-file paths, rather than a stream",
+    )
+    parser.add_argument(
+        "--pattern", default="*", help="Input-file pattern, for directory targets"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read `target` as a length-delimited stream of inputs (`sim` only)",
+    )
+    parser.add_argument(
+        "--simulator", default=None, help="Simulator (`sim` only). Default: detected"
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="Result path (`sim` only)"
+    )
     args = parser.parse_args()
 
     if args.action == Actions.VERSION.value:
         return print(__version__)
+    if args.action == Actions.BATCH.value:
+        return batch_action(args)
+    if args.action == Actions.SIM.value:
+        return sim_action(args)
+    if args.action == Actions.SERVE.value:
+        from ..server import serve
+
+        return serve(args.target, jobs=args.jobs)
 
     with open(args.target, "rb") as f:
         data = f.read()
         if args.action == Actions.NETLIST.value:
             return netlist_action(data)
-        if args.action == Actions.SIM.value:
-            return sim_action(data)
 
     raise ValueError(f"Invalid CLI action {args.action}")
 
@@ -60,14 +93,63 @@ def netlist_action(data: bytes) -> vlsir.netlist.NetlistResult:
     result = netlist_from_proto(inp)  # Main action
 
     if inp.result_path:  # Write back
-        result_file = open(inp.result_path, "wb")
-        result_file.write(vlsir.NetlistResult.SerializeToString(result))
+        write_result(result, inp.result_path)
 
     return result  # And... why not return it?
 
 
-def sim_action(data: bytes) -> None:
-    raise NotImplementedError
+def batch_action(args: argparse.Namespace) -> None:
+    """
+    # Batch Netlisting CLI Action
+    Netlist a directory, manifest, or length-delimited stream of `NetlistInput`s, in a pool of worker processes.
+    Each result is written to its input's `result_path`. Exits with a non-zero status if any fail.
+    """
+    inputs = iter_inputs(args.target, manifest=args.manifest, pattern=args.pattern)
+    results = netlist_batch(inputs, jobs=args.jobs)
+
+    failures = [(i, r.fail) for i, r in enumerate(results) if not r.success]
+    for idx, fail in failures:
+        print(f"Input {idx} failed: {fail}", file=sys.stderr)
+    print(f"Netlisted {len(results) - len(failures)} of {len(results)} inputs")
+    if failures:
+        sys.exit(1)
+
+
+def sim_action(args: argparse.Namespace) -> None:
+    """
+    # Simulation CLI Action
+    Simulate a `SimInput`, or a directory, manifest, or length-delimited stream of them,
+    running up to `--jobs` simulations concurrently.
+    A single input's `SimResult` is written to `--output` in protobuf binary format.
+    Several inputs' results are written to `--output` as a length-delimited stream, in input order.
+    """
+    from ..spice import SimOptions, SupportedSimulators, sim, sim_to_stream
+
+    if args.output is None:
+        raise ValueError("The `sim` action requires an `--output` path")
+
+    opts = SimOptions(jobs=args.jobs)
+    if args.simulator is not None:
+        opts.simulator = SupportedSimulators(args.simulator)
+
+    if not (args.target.is_dir() or args.manifest or args.stream):
+        # Single input
+        with open(args.target, "rb") as f:
+            inp = vsp.SimInput.FromString(f.read())
+        write_result(sim(inp, opts), args.output)
+        return
+
+    inputs = list(
+        iter_inputs(
+            args.target,
+            msg_type=vsp.SimInput,
+            manifest=args.manifest,
+            pattern=args.pattern,
+        )
+    )
+    with open(args.output, "wb") as dest:
+        num = sim_to_stream(inputs, dest, opts)
+    print(f"Simulated {num} inputs")
 
 
 if __name__ != "__main__":
@@ -0,0 +1,95 @@
+"""
+# Length-Delimited Protobuf Messages
+
+Reads and writes sequences of protobuf messages, each preceded by its length as a varint.
+This is the same framing as Java's `writeDelimitedTo` and C++'s `SerializeDelimitedToOstream`,
+and allows any number of messages to share a single file or socket.
+"""
+
+# Std-Lib Imports
+from typing import IO, Iterator, Optional, Type, TypeVar
+
+# PyPi Imports
+from google.protobuf.message import Message
+
+# Type variable for protobuf message-types
+M = TypeVar("M", bound=Message)
+
+
+def write_delimited(dest: IO[bytes], msg: Message) -> int:
+    """Write `msg` to binary file-like `dest`, preceded by its length.
+    Returns the total number of bytes written."""
+    data = msg.SerializeToString()
+    header = encode_varint(len(data))
+    dest.write(header)
+    dest.write(data)
+    return len(header) + len(data)
+
+
+def read_delimited(src: IO[bytes], msg_type: Type[M]) -> Optional[M]:
+    """Read a single message of type `msg_type` from binary file-like `src`.
+    Returns `None` at a clean end-of-file, i.e. before any of the message is read."""
+    size = read_varint(src)
+    if size is None:
+        return None
+    data = read_exactly(src, size)
+    msg = msg_type()
+    msg.ParseFromString(data)
+    return msg
+
+
+def iter_delimited(src: IO[bytes], msg_type: Type[M]) -> Iterator[M]:
+    """Iterate over all messages of type `msg_type` in binary file-like `src`."""
+    while True:
+        msg = read_delimited(src, msg_type)
+        if msg is None:
+            return
+        yield msg
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode non-negative integer `value` as a protobuf base-128 varint."""
+    if value < 0:
+        raise ValueError(f"Cannot encode negative varint {value}")
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def read_varint(src: IO[bytes]) -> Optional[int]:
+    """Read a varint from binary file-like `src`. Returns `None` at a clean end-of-file."""
+    result = 0
+    shift = 0
+    while True:
+        byte = src.read(1)
+        if not byte:
+            if shift == 0:
+                return None
+            raise EOFError("Unexpected end-of-file in varint")
+        result |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return result
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Invalid varint: more than 64 bits")
+
+
+def read_exactly(src: IO[bytes], size: int) -> bytes:
+    """Read exactly `size` bytes from `src`, across as many reads as necessary, e.g. from sockets."""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = src.read(remaining)
+        if not chunk:
+            raise EOFError(
+                f"Unexpected end-of-file: {remaining} of {size} bytes unread"
+            )
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
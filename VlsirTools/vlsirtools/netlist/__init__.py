@@ -4,8 +4,14 @@
 Exports `vlsir.circuit.Package` and `vlsir.netlist.NetlistInput` to a netlist format.
 """
 
-from .main import netlist, netlist_from_proto, NetlistOptions
+from .main import netlist, netlist_multi, netlist_from_proto, NetlistOptions
 from .fmt import NetlistFormat, NetlistFormatSpec
+from .compress import Compression, CompressedWriter, open_netlist
+from .shard import netlist_sharded, ShardedNetlist
+from .flat import flatten, iter_flat, FlattenOptions
+from .arrays import find_arrays, ArrayKind, InstanceArray
+from .fold import fold_params, FoldOptions
+from .profile import NetlistProfile, CallStats
 from .spectre import SpectreNetlister
 from .verilog import VerilogNetlister
 from .spice import (
@@ -0,0 +1,211 @@
+"""
+# Instance Arrays
+
+Detection of runs of regular instances, which netlisters can write as a single array-instance.
+
+Two varieties of array are detected:
+* `ArrayKind.PARALLEL` runs have identical modules, parameters and connections,
+  and can be written as a single instance with `m=`-style multiplicity.
+* `ArrayKind.BUS` runs are named `base_0`, `base_1`, etc., and each of their connections is either identical,
+  or steps through consecutive bits of a bus. These can be written as Verilog instance arrays.
+"""
+
+# Std-Lib Imports
+import re
+from enum import Enum
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Union
+
+# Local Imports
+import vlsir.circuit_pb2 as vckt
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+MIN_ARRAY_SIZE = 2  # Minimum number of instances combined into an array
+
+# Names of `BUS` array elements, e.g. `inv_3`
+_ELEMENT_NAME = re.compile(r"^(.+)_(\d+)$")
+
+
+class ArrayKind(Enum):
+    """Enumerated Instance-Array Kinds"""
+
+    PARALLEL = "parallel"  # Identical connections, e.g. for `m=` multiplicity
+    BUS = (
+        "bus"  # Connections stepping through bus bits, e.g. for Verilog instance arrays
+    )
+
+
+@dataclass
+class InstanceArray:
+    """# Instance Array
+    A run of two or more regular instances, and their combined connections."""
+
+    kind: ArrayKind
+    instances: List[vckt.Instance]
+    # Combined connections, in the port-order of the first instance.
+    # For `BUS` arrays, stepped connections are slices spanning every element's bits.
+    connections: List[vckt.Connection]
+    base: str = ""  # Base name of `BUS` arrays, e.g. `inv` for `inv_0`, `inv_1`
+    first: int = 0  # Index of the first `BUS` element, e.g. 0 for `inv_0`
+    # Direction in which `BUS` connections step through bus bits, per element: +1 or -1.
+    # Zero if every connection is identical.
+    step: int = 0
+
+    @property
+    def last(self) -> int:
+        """Index of the last `BUS` element"""
+        return self.first + len(self.instances) - 1
+
+
+def find_arrays(
+    instances: List[vckt.Instance], kind: ArrayKind
+) -> List[Union[vckt.Instance, InstanceArray]]:
+    """Combine runs of consecutive regular `instances` into `InstanceArray`s of kind `kind`.
+    Returns the instances in their original order, with each run replaced by its array.
+    Instances outside any run are returned as-is."""
+
+    names = {pinst.name for pinst in instances}
+    result: List[Union[vckt.Instance, InstanceArray]] = []
+    start = 0
+    while start < len(instances):
+        array = _longest_run(instances, start, kind, names)
+        if array is None:
+            result.append(instances[start])
+            start += 1
+        else:
+            result.append(array)
+            start += len(array.instances)
+    return result
+
+
+def _longest_run(
+    instances: List[vckt.Instance], start: int, kind: ArrayKind, names: Set[str]
+) -> Optional[InstanceArray]:
+    """Get the longest array of `instances` beginning at index `start`, or `None` if it has fewer than `MIN_ARRAY_SIZE` elements."""
+    if start + 1 >= len(instances):
+        return None
+    first, second = instances[start], instances[start + 1]
+    if first.module != second.module or first.parameters != second.parameters:
+        return None
+    targets = _targets(first)
+    if targets is None:
+        return None
+
+    base, index = "", 0
+    if kind == ArrayKind.BUS:
+        match = _ELEMENT_NAME.match(first.name)
+        if match is None:
+            return None
+        base, index = match.group(1), int(match.group(2))
+        if base in names:  # The array name would conflict with another instance
+            return None
+
+    # Sort out which connections step from the first and second instances
+    steps = _steps(targets, _targets(second), kind)
+    if steps is None:
+        return None
+    step = next((1 if s > 0 else -1 for s in steps.values() if s), 0)
+
+    # And extend the run while each instance matches its predicted name and connections
+    num = 1
+    while start + num < len(instances):
+        pinst = instances[start + num]
+        if pinst.module != first.module or pinst.parameters != first.parameters:
+            break
+        if kind == ArrayKind.BUS and pinst.name != f"{base}_{index + num}":
+            break
+        expected = {
+            pname: _stepped(target, steps[pname] * num)
+            for pname, target in targets.items()
+        }
+        if _targets(pinst) != expected:
+            break
+        num += 1
+
+    if num < MIN_ARRAY_SIZE:
+        return None
+    connections = [
+        vckt.Connection(portname=pname, target=_combined(target, steps[pname], num))
+        for pname, target in targets.items()
+    ]
+    return InstanceArray(
+        kind=kind,
+        instances=instances[start : start + num],
+        connections=connections,
+        base=base,
+        first=index,
+        step=step,
+    )
+
+
+def _targets(pinst: vckt.Instance) -> Optional[Dict[str, vckt.ConnectionTarget]]:
+    """Get the connection targets of `pinst`, keyed by port name. `None` if any port is doubly connected."""
+    targets = {conn.portname: conn.target for conn in pinst.connections}
+    if len(targets) != len(pinst.connections):
+        return None
+    return targets
+
+
+def _steps(
+    first: Dict[str, vckt.ConnectionTarget],
+    second: Optional[Dict[str, vckt.ConnectionTarget]],
+    kind: ArrayKind,
+) -> Optional[Dict[str, int]]:
+    """Get the per-element bit-step of each connection, from the `first` and `second` instances of a run.
+    Each step is zero for identical connections, and otherwise plus or minus the width of the connected slice.
+    Returns `None` if the two cannot start an array of kind `kind`."""
+    if second is None or first.keys() != second.keys():
+        return None
+    steps = dict()
+    for pname, target in first.items():
+        other = second[pname]
+        if other == target:
+            steps[pname] = 0
+            continue
+        if kind != ArrayKind.BUS:
+            return None
+        if (
+            target.WhichOneof("stype") != "slice"
+            or other.WhichOneof("stype") != "slice"
+        ):
+            return None
+        this, that = target.slice, other.slice
+        width = this.top - this.bot + 1
+        if that.signal != this.signal or that.top - that.bot + 1 != width:
+            return None
+        if that.bot - this.bot not in (width, -width):
+            return None
+        steps[pname] = that.bot - this.bot
+    # Every stepped connection must step in the same direction
+    if len({s > 0 for s in steps.values() if s}) > 1:
+        return None
+    return steps
+
+
+def _stepped(target: vckt.ConnectionTarget, offset: int) -> vckt.ConnectionTarget:
+    """Get `target`, shifted by `offset` bits. Identical to `target` for zero offsets."""
+    if not offset:
+        return target
+    pslice = target.slice
+    return vckt.ConnectionTarget(
+        slice=vckt.Slice(
+            signal=pslice.signal, top=pslice.top + offset, bot=pslice.bot + offset
+        )
+    )
+
+
+def _combined(
+    target: vckt.ConnectionTarget, step: int, num: int
+) -> vckt.ConnectionTarget:
+    """Get the combined connection target of `num` elements, from the first element's `target` and per-element `step`."""
+    if not step:
+        return target
+    last = _stepped(target, step * (num - 1)).slice
+    pslice = target.slice
+    return vckt.ConnectionTarget(
+        slice=vckt.Slice(
+            signal=pslice.signal,
+            top=max(pslice.top, last.top),
+            bot=min(pslice.bot, last.bot),
+        )
+    )
@@ -3,7 +3,7 @@
 """
 
 # Std-Lib Imports
-from typing import Optional, Union, IO, Dict, Iterable, List, Tuple
+from typing import Optional, Union, IO, Dict, Iterable, List, Set, Tuple
 from dataclasses import dataclass, field
 
 # Local Imports
@@ -12,10 +12,17 @@ import vlsir.circuit_pb2 as vckt
 import vlsir.spice_pb2 as vsp
 from .. import primitives
 from ..spicetype import SpiceType
+from .arrays import ArrayKind, InstanceArray, find_arrays
 
 # Internal type shorthand
 ModuleLike = Union[vckt.Module, vckt.ExternalModule]
 
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+PREFIXED_MEMO_SIZE = 1 << 16  # Formatted `Prefixed` values memoized per netlister class
+
+# Memoized formatted `Prefixed` values, by netlister class, and by (prefix, number)
+_prefixed_memos: Dict[type, Dict[Tuple[int, Union[int, str]], str]] = dict()
+
 
 @dataclass
 class ResolvedModule:
@@ -101,6 +108,98 @@ class ResolvedParams:
         return key in self.inner
 
 
+@dataclass
+class SharedResolution:
+    """# Shared Resolution
+    Format-independent netlisting results, shared between `Netlister`s writing the same `Package`, e.g. by `netlist_multi`.
+
+    Resolved references are keyed by content, and kept for the whole package.
+    Signals and parameters are keyed by the identity of their proto-messages, each of which is held alongside its result,
+    and are dropped by `next_module` once every netlister has written the current module.
+    """
+
+    # Resolved references, keyed by `reference_key`
+    refs: Dict[Tuple[str, ...], ResolvedRef] = field(default_factory=dict)
+    # Collected signals, keyed by module identity.
+    # Values are the module, its signals by name, internal signals by name, and port names.
+    signals: Dict[
+        int,
+        Tuple[vckt.Module, Dict[str, vckt.Signal], Dict[str, vckt.Signal], Set[str]],
+    ] = field(default_factory=dict)
+    # Number of sharing netlisters, keyed by the identity of their `PREFIXES` table
+    formats: Dict[int, int] = field(default_factory=dict)
+    # Resolved instance parameters, keyed by `PREFIXES` table identity, then by instance identity.
+    # Only kept for tables shared by more than one netlister.
+    params: Dict[int, Dict[int, Tuple[vckt.Instance, ResolvedParams]]] = field(
+        default_factory=dict
+    )
+
+    def next_module(self) -> None:
+        """Drop the per-module results of the current module."""
+        self.signals.clear()
+        for params in self.params.values():
+            params.clear()
+
+
+def reference_key(ref: vlsir.utils.Reference) -> Tuple[str, ...]:
+    """Get a hashable key identifying the referent of `ref`."""
+    if ref.WhichOneof("to") == "local":
+        return (ref.local,)
+    return (ref.external.domain, ref.external.name)
+
+
+@dataclass
+class SaveSpec:
+    """# Combined Signal-Saving Specification
+    Resolved from a list of `vsp.Save` controls, such that:
+    * If any requests `SaveMode.ALL`, everything is saved.
+    * Otherwise only the requested `voltages` and `currents` are saved.
+      If there are none, e.g. for a lone `SaveMode.NONE`, no signals are saved. Measurements are still evaluated.
+
+    `Save.signal` strings of the form `i(name)` request the current through element `name`.
+    Those of the form `v(name)`, or bare signal names, request the voltage of node `name`.
+    """
+
+    save_all: bool = False  # Save everything
+    voltages: List[str] = field(default_factory=list)  # Node names
+    currents: List[str] = field(default_factory=list)  # Element names
+
+    @classmethod
+    def from_saves(cls, saves: Iterable[vsp.Save]) -> "SaveSpec":
+        """Combine a list of `vsp.Save` controls."""
+        spec = cls()
+        for save in saves:
+            inner = save.WhichOneof("save")
+            if inner == "mode":
+                if save.mode == vsp.Save.SaveMode.ALL:
+                    spec.save_all = True
+            elif inner == "signal":
+                spec.add_signal(save.signal)
+            else:
+                raise ValueError(f"Invalid `Save` {save}")
+        return spec
+
+    def add_signal(self, signal: str) -> None:
+        """Add a signal, in either `v(node)`, `i(element)`, or bare-node form."""
+        signal = signal.strip()
+        kind, name = "v", signal
+        if len(signal) > 3 and signal[1] == "(" and signal[-1] == ")":
+            kind, name = signal[0].lower(), signal[2:-1].strip()
+        if kind == "v":
+            target = self.voltages
+        elif kind == "i":
+            target = self.currents
+        else:
+            raise ValueError(f"Invalid `Save` signal {signal}")
+        if name not in target:
+            target.append(name)
+
+    @property
+    def signals(self) -> bool:
+        """Boolean indication of whether any specific signals are requested."""
+        return bool(self.voltages or self.currents)
+
+
 @dataclass
 class Indent:
     """
@@ -160,9 +259,17 @@ class Netlister:
     * `get_*` methods, which retrieve some internal data, e.g. extracting the type of a `Connection`.
     """
 
-    def __init__(self, dest: IO):
+    # Kind of instance array supported by the netlist format
+    ARRAY_KIND: ArrayKind = ArrayKind.PARALLEL
+    # Formatted `SIPrefix`es, used by `format_prefix`.
+    # Netlisters sharing a table format parameter values identically, and can share their resolution.
+    PREFIXES: Dict[int, str] = dict()
+
+    def __init__(self, dest: IO, instance_arrays: bool = False):
         self.dest = dest
         self.indent = Indent(chars="  ")
+        # Whether to combine runs of regular instances into arrays
+        self.instance_arrays = instance_arrays
 
         self.module_names = set()  # Netlisted Module names
         self.pmodules = dict()  # Visited proto-Modules
@@ -181,6 +288,9 @@ class Netlister:
         # i.e. it is possible to have a sub-circuit and a model with the same name.
         self.spice_models_by_name: Dict[str, vckt.ExternalModule] = dict()
 
+        # Signal-saving specification, set by `Save` controls. Saves everything by default.
+        self.saves = SaveSpec(save_all=True)
+
         # Attributes of the currently-netlisted Module
 
         # Signals in the currently-visited module, keyed by name
@@ -191,6 +301,22 @@ class Netlister:
         # Names of all ports, for membership testing
         self.port_names = set()  # : Set[str]
 
+        # Resolved references, keyed by `reference_key`.
+        # Replaced by those of a `SharedResolution` if one is set via `share`.
+        self.resolved_refs: Dict[Tuple[str, ...], ResolvedRef] = dict()
+        # Resolution shared with other netlisters of the same package, if any
+        self.shared: Optional[SharedResolution] = None
+
+    def share(self, shared: SharedResolution) -> None:
+        """Share format-independent resolution with other netlisters via `shared`.
+        Must be called before writing any content."""
+        self.shared = shared
+        self.resolved_refs = shared.refs
+        key = id(self.PREFIXES)
+        shared.formats[key] = shared.formats.get(key, 0) + 1
+        if shared.formats[key] > 1:
+            shared.params.setdefault(key, dict())
+
     """
     # Core Interactions with our Destination `IO`
     """
@@ -291,6 +417,23 @@ class Netlister:
         # And wrap the resolved values in a `ResolvedParams` object
         return ResolvedParams(values)
 
+    def resolve_instance_params(
+        self, pinst: vckt.Instance, pmodule: ModuleLike
+    ) -> ResolvedParams:
+        """Resolve the parameters of `pinst`, as in `get_instance_params`.
+        Shares results between netlisters with the same `PREFIXES`, if a `SharedResolution` is set.
+        Each call returns a new `ResolvedParams`, which callers may modify."""
+        params = None
+        if self.shared is not None:
+            params = self.shared.params.get(id(self.PREFIXES), None)
+        if params is None:  # Not shared
+            return self.get_instance_params(pinst, pmodule)
+        cached = params.get(id(pinst), None)
+        if cached is None:
+            cached = (pinst, self.get_instance_params(pinst, pmodule))
+            params[id(pinst)] = cached
+        return ResolvedParams(dict(cached[1].inner))
+
     @classmethod
     def get_module_name(cls, module: vckt.Module) -> str:
         """Create a netlist-compatible name for proto-Module `module`"""
@@ -304,7 +447,16 @@ class Netlister:
         return name
 
     def resolve_reference(self, ref: vlsir.utils.Reference) -> ResolvedRef:
-        """Resolve the `ModuleLike` referent of `ref`."""
+        """Resolve the `ModuleLike` referent of `ref`.
+        Results are memoized by referent, in `resolved_refs`."""
+        key = reference_key(ref)
+        resolved = self.resolved_refs.get(key, None)
+        if resolved is None:
+            resolved = self.resolved_refs[key] = self.get_referent(ref)
+        return resolved
+
+    def get_referent(self, ref: vlsir.utils.Reference) -> ResolvedRef:
+        """Resolve the `ModuleLike` referent of `ref`, without memoization."""
 
         if ref.WhichOneof("to") == "local":  # Internally-defined Module
             module = self.pmodules.get(ref.local, None)
@@ -435,8 +587,20 @@ class Netlister:
     def collect_signals_by_name(self, module: vckt.Module):
         """Collect a `Module`'s worth of signals into a dictionary keyed by name.
         This often proves important for references to internal Signals, e.g. in Ports and Slices.
+        Shares results with other netlisters, if a `SharedResolution` is set.
         """
 
+        if self.shared is not None:
+            cached = self.shared.signals.get(id(module), None)
+            if cached is not None:
+                (
+                    _,
+                    self.signals_by_name,
+                    self.internal_signals_by_name,
+                    self.port_names,
+                ) = cached
+                return
+
         # Reset the state of our mappings
         self.signals_by_name = {}
         self.port_names = set()
@@ -457,6 +621,14 @@ class Netlister:
             if signal.name not in self.port_names:
                 self.internal_signals_by_name[signal.name] = signal
 
+        if self.shared is not None:
+            self.shared.signals[id(module)] = (
+                module,
+                self.signals_by_name,
+                self.internal_signals_by_name,
+                self.port_names,
+            )
+
     @classmethod
     def validate_sim_top(cls, inp: vsp.SimInput) -> vckt.Module:
         """# Ensure that `SimInput` `inp`'s `top` module exists,
@@ -567,9 +739,15 @@ class Netlister:
         self.writeln("")
 
     def write_control_elements(self, ctrls: List[vsp.Control]) -> None:
-        """# Write a list of `Control` elements"""
+        """# Write a list of `Control` elements
+        `Save` controls are combined into a single `SaveSpec`, written first via `write_saves`."""
+        saves = [ctrl.save for ctrl in ctrls if ctrl.WhichOneof("ctrl") == "save"]
+        if saves:
+            self.saves = SaveSpec.from_saves(saves)
+            self.write_saves(self.saves)
         for ctrl in ctrls:
-            self.write_control_element(ctrl=ctrl)
+            if ctrl.WhichOneof("ctrl") != "save":
+                self.write_control_element(ctrl=ctrl)
 
     def write_control_element(self, ctrl: vsp.Control) -> None:
         """# Write a `Control` element"""
@@ -639,21 +817,48 @@ class Netlister:
 
     @classmethod
     def format_prefixed(cls, pre: vlsir.Prefixed) -> str:
-        prefix = cls.format_prefix(pre.prefix)
+        """Format `Prefixed` number `pre`, e.g. `5u`.
+        Results are memoized per netlister class, keyed by `(prefix, number)`."""
         numtp = pre.WhichOneof("number")
         if numtp == "int64_value":
-            num = str(pre.int64_value)
+            key = (pre.prefix, pre.int64_value)
         elif numtp == "string_value":
-            num = str(pre.string_value)
+            key = (pre.prefix, pre.string_value)
         elif numtp == "double_value":
             raise ValueError(f"Deprecated double-valued Prefixed parameter {pre}")
         else:
             raise ValueError(f"Invalid `Prefixed` number type {numtp}")
 
-        # Note the "prefix" is in fact at the *end*,
-        # e.g. "5u", "11K".
-        # (Calling it a *pre*-fix refers to *units*, not to numeric values)
-        return f"{num}{prefix}"
+        memo = _prefixed_memos.setdefault(cls, dict())
+        formatted = memo.get(key, None)
+        if formatted is None:
+            if len(memo) >= PREFIXED_MEMO_SIZE:
+                memo.clear()
+            # Note the "prefix" is in fact at the *end*,
+            # e.g. "5u", "11K".
+            # (Calling it a *pre*-fix refers to *units*, not to numeric values)
+            formatted = f"{key[1]}{cls.format_prefix(pre.prefix)}"
+            memo[key] = formatted
+        return formatted
+
+    def write_instances(self, module: vckt.Module) -> None:
+        """# Write the instances of `module`.
+        If `instance_arrays` is set, runs of regular instances are combined into a single array-instance,
+        where the format supports it. Others are written one at a time."""
+        if not self.instance_arrays:
+            for pinst in module.instances:
+                self.write_instance(pinst)
+            return
+        for item in find_arrays(list(module.instances), self.ARRAY_KIND):
+            if not isinstance(item, InstanceArray):
+                self.write_instance(item)
+                continue
+            pinst = self.get_array_instance(item)
+            if pinst is not None:
+                self.write_instance(pinst)
+                continue
+            for pinst in item.instances:
+                self.write_instance(pinst)
 
     def write_literals(self, literals: List[str]) -> None:
         """# Write a list of literal strings, one per line."""
@@ -696,6 +901,11 @@ class Netlister:
 
     def write_save(self, save: vsp.Save) -> None:
         """# Write a `Save` statement"""
+        self.saves = SaveSpec.from_saves([save])
+        self.write_saves(self.saves)
+
+    def write_saves(self, saves: SaveSpec) -> None:
+        """# Write a combined signal-saving specification"""
         raise NotImplementedError
 
     def write_meas(self, meas: vsp.Meas) -> None:
@@ -776,7 +986,9 @@ class Netlister:
 
     @classmethod
     def format_prefix(cls, pre: vlsir.SIPrefix) -> str:
-        """Format a `SIPrefix` to a string"""
+        """Format a `SIPrefix` to a string.
+        Generally a lookup in a per-class table, as `format_prefixed` is among the hottest paths in netlisting.
+        """
         raise NotImplementedError
 
     @classmethod
@@ -793,6 +1005,11 @@ class Netlister:
         """Get our entry in the `NetlistFormat` enumeration"""
         raise NotImplementedError
 
+    def get_array_instance(self, array: InstanceArray) -> Optional[vckt.Instance]:
+        """Get a single instance equivalent to `array`, in this format's array syntax.
+        Returns `None` if `array` cannot be written as a single instance."""
+        raise NotImplementedError
+
     """ 
     Other Helper Methods
     """
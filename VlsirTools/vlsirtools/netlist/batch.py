@@ -0,0 +1,101 @@
+"""
+# Batch Netlisting
+
+Netlists many `NetlistInput`s in a single process, across a pool of worker processes,
+avoiding per-input interpreter startup and import costs.
+
+Inputs can be read from:
+* A directory of files, each a single binary-format message
+* A manifest: a text file listing such files, one path per line
+* A stream: a single file of length-delimited messages, as written by `vlsirtools.delimited`
+"""
+
+# Std-Lib Imports
+import os
+import concurrent.futures
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Type, TypeVar, Union
+
+# PyPi Imports
+from google.protobuf.message import Message
+
+# Local Imports
+import vlsir.netlist_pb2 as vnl
+from ..delimited import iter_delimited
+from .main import netlist_from_proto
+
+# Type variable for protobuf message-types
+M = TypeVar("M", bound=Message)
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+CHUNKSIZE = 16  # Number of inputs sent to each worker process at a time
+
+
+def iter_inputs(
+    src: Union[str, os.PathLike],
+    msg_type: Type[M] = vnl.NetlistInput,
+    manifest: bool = False,
+    pattern: str = "*",
+) -> Iterator[M]:
+    """Iterate over the messages of type `msg_type` at path `src`.
+    Directories are read as one message per file matching `pattern`, in sorted order.
+    Files are read as a manifest of message-file paths if `manifest` is set, and as a length-delimited stream otherwise.
+    Relative paths in manifests are relative to the manifest's directory."""
+    src = Path(src)
+    if src.is_dir():
+        paths = sorted(p for p in src.glob(pattern) if p.is_file())
+        yield from (_read_message(p, msg_type) for p in paths)
+    elif manifest:
+        with open(src, "r") as f:
+            lines = [line.strip() for line in f]
+        for line in lines:
+            if line and not line.startswith("#"):
+                yield _read_message(src.parent / line, msg_type)
+    else:
+        with open(src, "rb") as f:
+            yield from iter_delimited(f, msg_type)
+
+
+def netlist_batch(
+    inputs: Iterable[vnl.NetlistInput], jobs: Optional[int] = None
+) -> List[vnl.NetlistResult]:
+    """Netlist each of `inputs`, across up to `jobs` worker processes.
+    Each result is written to its input's `result_path`, if set, and returned in input order.
+    Failures are reported as failed `NetlistResult`s, and do not stop the batch.
+    `jobs` defaults to the number of CPUs; with `jobs=1`, everything runs in this process.
+    """
+    if jobs == 1:
+        return [netlist_and_write(inp) for inp in inputs]
+    # Messages are sent to and from workers in serialized form.
+    # Generated protobuf classes are not reliably picklable, and serialization is faster anyway.
+    serialized = (inp.SerializeToString() for inp in inputs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(netlist_serialized, serialized, chunksize=CHUNKSIZE)
+        return [vnl.NetlistResult.FromString(r) for r in results]
+
+
+def netlist_and_write(inp: vnl.NetlistInput) -> vnl.NetlistResult:
+    """Netlist `inp`, and write its result to its `result_path`, if set."""
+    result = netlist_from_proto(inp)
+    if inp.result_path:
+        write_result(result, inp.result_path)
+    return result
+
+
+def netlist_serialized(data: bytes) -> bytes:
+    """Worker-process entry point. Netlist serialized `NetlistInput` `data`, returning a serialized `NetlistResult`."""
+    return netlist_and_write(vnl.NetlistInput.FromString(data)).SerializeToString()
+
+
+def write_result(msg: Message, path: Union[str, os.PathLike]) -> None:
+    """Write `msg` to `path`, in protobuf binary format."""
+    with open(path, "wb") as f:
+        f.write(msg.SerializeToString())
+
+
+def _read_message(path: Path, msg_type: Type[M]) -> M:
+    """Read a single binary-format message of type `msg_type` from `path`."""
+    msg = msg_type()
+    with open(path, "rb") as f:
+        msg.ParseFromString(f.read())
+    return msg
@@ -0,0 +1,209 @@
+"""
+# Compressed Netlist Output
+
+Writes netlists directly to gzip, zstd, or xz compressed destinations, in a single pass.
+
+Netlisters write text to a `CompressedWriter`, which batches it into blocks.
+Blocks are compressed and written on a background thread, overlapping with netlist formatting.
+(The `zlib`, `lzma` and `zstandard` compressors all release the GIL while compressing.)
+"""
+
+# Std-Lib Imports
+import os
+import queue
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import IO, Optional, Union
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+BLOCK_SIZE = 1 << 20  # Characters of text per block handed to the compression thread
+QUEUE_DEPTH = 8  # Maximum number of blocks queued for compression
+
+
+class Compression(Enum):
+    """Enumerated Compression Formats"""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"  # Requires the optional `zstandard` dependency
+    XZ = "xz"
+
+    @staticmethod
+    def get(spec: "CompressionSpec") -> "Compression":
+        """Get the format specified by `spec`, either a `Compression` or its string value."""
+        if spec is None:
+            return Compression.NONE
+        if isinstance(spec, Compression):
+            return spec
+        if isinstance(spec, str):
+            spec = spec.lower()
+            for c in Compression:
+                if c.value == spec:
+                    return c
+        raise ValueError(f"Invalid compression format {spec}")
+
+    @staticmethod
+    def from_path(path: Union[str, os.PathLike]) -> "Compression":
+        """Infer the compression format of `path` from its suffix."""
+        suffix = Path(path).suffix.lower()
+        return _SUFFIXES.get(suffix, Compression.NONE)
+
+
+# Union of types which can serve as compression-format specifiers
+CompressionSpec = Union[Compression, str, None]
+
+# File suffixes of each compression format
+_SUFFIXES = {
+    ".gz": Compression.GZIP,
+    ".gzip": Compression.GZIP,
+    ".zst": Compression.ZSTD,
+    ".zstd": Compression.ZSTD,
+    ".xz": Compression.XZ,
+}
+
+
+class CompressedWriter:
+    """# Compressed Text Writer
+
+    A write-only text file-like object, which compresses its content into `dest`:
+    either a binary file-like object, or a path, which is opened and closed by the writer.
+    Compression and writes to `dest` run on a background thread.
+    `close` must be called to complete the compressed stream.
+    Usable as a context manager, which closes on exit.
+    """
+
+    def __init__(
+        self,
+        dest: Union[IO[bytes], str, os.PathLike],
+        compression: CompressionSpec,
+        level: Optional[int] = None,
+    ):
+        # Create the compressor first, so that errors (e.g. a missing `zstandard`) leave no file behind
+        self.compressor = _compressor(Compression.get(compression), level)
+        self.owns_dest = isinstance(dest, (str, os.PathLike))
+        self.dest = open(dest, "wb") if self.owns_dest else dest
+        self.closed = False
+
+        self._parts = []  # Pending text, not yet handed to the compression thread
+        self._size = 0  # Number of characters in `_parts`
+        self._error: Optional[BaseException] = None
+        self._queue = queue.Queue(maxsize=QUEUE_DEPTH)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, s: str) -> int:
+        if self.closed:
+            raise ValueError("Write to closed CompressedWriter")
+        self._parts.append(s)
+        self._size += len(s)
+        if self._size >= BLOCK_SIZE:
+            self._send()
+        return len(s)
+
+    def flush(self) -> None:
+        """Hand all pending text to the compression thread.
+        Note this does not wait for it to be compressed; `close` does."""
+        if self._parts:
+            self._send()
+        self._check()
+
+    def close(self) -> None:
+        """Complete the compressed stream, and wait for it to be written."""
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        self._queue.put(None)
+        self._thread.join()
+        if self.owns_dest:
+            self.dest.close()
+        self._check()
+
+    def _send(self) -> None:
+        data = "".join(self._parts).encode("utf-8")
+        self._parts, self._size = [], 0
+        self._check()
+        self._queue.put(data)
+
+    def _check(self) -> None:
+        """Re-raise any error from the compression thread."""
+        if self._error is not None:
+            raise RuntimeError("Netlist compression failed") from self._error
+
+    def _run(self) -> None:
+        """Compression thread. Compress and write each block, until the `None` end-marker."""
+        while True:
+            data = self._queue.get()
+            if self._error is not None:
+                if data is None:
+                    return
+                continue  # Drain the queue, so the writer never blocks
+            try:
+                if data is None:
+                    self.dest.write(self.compressor.flush())
+                    self.dest.flush()
+                    return
+                self.dest.write(self.compressor.compress(data))
+            except BaseException as e:
+                self._error = e
+                if data is None:
+                    return
+
+    def __enter__(self) -> "CompressedWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def open_netlist(
+    path: Union[str, os.PathLike],
+    compression: CompressionSpec = None,
+    level: Optional[int] = None,
+) -> IO[str]:
+    """Open `path` for writing netlist text.
+    Compression is inferred from the suffix of `path` unless `compression` is specified.
+    Returns a plain text file for uncompressed paths, and a `CompressedWriter` otherwise.
+    """
+    comp = Compression.get(compression)
+    if compression is None:
+        comp = Compression.from_path(path)
+    if comp == Compression.NONE:
+        return open(path, "w")
+    return CompressedWriter(path, comp, level)
+
+
+class _Identity:
+    """Pass-through "compressor", for `Compression.NONE`"""
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def _compressor(comp: Compression, level: Optional[int]):
+    """Create a compressor object, with `compress` and `flush` methods, for format `comp`."""
+    if comp == Compression.NONE:
+        return _Identity()
+    if comp == Compression.GZIP:
+        import zlib
+
+        level = 6 if level is None else level
+        return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if comp == Compression.XZ:
+        import lzma
+
+        preset = 6 if level is None else level
+        return lzma.LZMACompressor(format=lzma.FORMAT_XZ, preset=preset)
+    if comp == Compression.ZSTD:
+        try:
+            import zstandard
+        except ImportError as e:
+            msg = "zstd compression requires `zstandard`. Install it via `pip install vlsirtools[zstd]`."
+            raise ImportError(msg) from e
+        level = 3 if level is None else level
+        return zstandard.ZstdCompressor(level=level).compressobj()
+    raise ValueError(f"Invalid compression format {comp}")
@@ -0,0 +1,390 @@
+"""
+# Hierarchy Flattening
+
+Flattens a hierarchical `vlsir.circuit.Package` into a single `Module`,
+whose instances are all of external modules and primitives.
+
+Hierarchical instance and signal names are joined with a configurable separator, e.g. `x1.x2.r1`,
+and the bits of multi-bit signals with another, e.g. `x1.bus_3`.
+Parameters are propagated down the hierarchy: references to a module's parameters in literal
+expressions are replaced by the values of its instance.
+Slices and concatenations are expanded to individual bits.
+
+Flattening is designed for very large results. Each module definition is analyzed once,
+resolving its connections to integer bit-indices, no matter how many times it is instantiated.
+Each flat net name is created exactly once, and shared by reference through the hierarchy.
+And `iter_flat` yields flat signals and instances one at a time, so they can be written to a netlist
+or stream without ever being held in memory together.
+"""
+
+# Std-Lib Imports
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+# Local Imports
+import vlsir
+import vlsir.circuit_pb2 as vckt
+from .fold import EXPONENTS
+
+
+@dataclass
+class FlattenOptions:
+    """Options for hierarchy flattening"""
+
+    sep: str = "."  # Hierarchical path separator, e.g. `x1.x2.r1`
+    bit_sep: str = "_"  # Bus-bit separator, e.g. `x1.bus_3`
+
+
+# A flat net. Either the name of a scalar signal, or a (name, index) bit of a multi-bit top-level signal.
+Net = Union[str, Tuple[str, int]]
+
+# A parameter environment: a module's parameter values, keyed by name
+Env = Mapping[str, vlsir.ParamValue]
+
+
+def flatten(
+    pkg: vckt.Package, top: str, opts: Optional[FlattenOptions] = None
+) -> vckt.Module:
+    """Flatten Module `top` of `pkg` into a single Module, instantiating only external modules and primitives.
+    The flat Module keeps `top`'s name, ports, signals and parameters.
+    Hierarchical nets are added as scalar signals."""
+    top_module = _find_module(pkg, top)
+    flat = vckt.Module(
+        name=top_module.name,
+        ports=top_module.ports,
+        parameters=top_module.parameters,
+        literals=top_module.literals,
+    )
+    for item in iter_flat(pkg, top, opts):
+        if isinstance(item, vckt.Instance):
+            flat.instances.append(item)
+        else:
+            flat.signals.append(item)
+    return flat
+
+
+def iter_flat(
+    pkg: vckt.Package, top: str, opts: Optional[FlattenOptions] = None
+) -> Iterator[Union[vckt.Signal, vckt.Instance]]:
+    """Iterate over the signals and instances of the flattened Module `top` of `pkg`.
+    Yields `top`'s own signals first. Each hierarchical signal is yielded before any instance connected to it.
+    """
+    flattener = _Flattener(pkg, opts or FlattenOptions())
+    yield from flattener.run(_find_module(pkg, top))
+
+
+@dataclass
+class _InstanceTemplate:
+    """An instance within a `_ModuleTemplate`, with connections resolved to bit-indices"""
+
+    inst: vckt.Instance
+    # Module template for local modules, `None` for leaves
+    child: Optional["_ModuleTemplate"]
+    # For leaves: (port-name, parent bit-indices) per connection, in the instance's order.
+    conns: List[Tuple[str, List[int]]] = field(default_factory=list)
+    # For local modules: pairs of (child port bit-index, parent bit-index)
+    port_map: List[Tuple[int, int]] = field(default_factory=list)
+    # (name, value, referenced identifiers) of each parameter
+    params: List[Tuple[str, vlsir.ParamValue, frozenset]] = field(default_factory=list)
+
+
+@dataclass
+class _ModuleTemplate:
+    """A Module definition, analyzed once for all of its instances"""
+
+    module: vckt.Module
+    bits: Dict[str, List[int]]  # Bit-indices of each signal, most-significant first
+    names: List[str]  # Local name of each bit, e.g. `bus_3`
+    internal: List[int]  # Indices of non-port bits
+    ports: List[int]  # Indices of port bits, in port order
+    instances: List[_InstanceTemplate] = field(default_factory=list)
+
+
+class _Flattener:
+    """Flattening state: the package, options, and each module's analyzed template"""
+
+    def __init__(self, pkg: vckt.Package, opts: FlattenOptions):
+        self.opts = opts
+        self.modules: Dict[str, vckt.Module] = {m.name: m for m in pkg.modules}
+        self.templates: Dict[str, _ModuleTemplate] = dict()
+        # Names of templates being analyzed, for cycle detection
+        self.stack: List[str] = []
+
+    def run(self, top: vckt.Module) -> Iterator[Union[vckt.Signal, vckt.Instance]]:
+        template = self.template(top)
+        # Top-level nets keep their original names: scalar signals by name, and bits of buses by (name, index)
+        nets: List[Net] = [None] * len(template.names)
+        for signal in top.signals:
+            yield signal
+            idxs = template.bits[signal.name]
+            if signal.width == 1:
+                nets[idxs[0]] = signal.name
+            else:
+                for bit, idx in zip(idxs, reversed(range(signal.width))):
+                    nets[bit] = (signal.name, idx)
+        yield from self.visit(template, nets, prefix="", env={})
+
+    def visit(
+        self, template: _ModuleTemplate, nets: List[Net], prefix: str, env: Env
+    ) -> Iterator[Union[vckt.Signal, vckt.Instance]]:
+        """Yield the flattened contents of an instance of `template`,
+        with bits connected to `nets`, hierarchical names prefixed by `prefix`, and parameter values `env`.
+        """
+        for itemp in template.instances:
+            name = prefix + itemp.inst.name
+            params = [
+                (pname, _resolve(pval, refs, env)) for pname, pval, refs in itemp.params
+            ]
+
+            if itemp.child is None:  # Leaf instance
+                yield vckt.Instance(
+                    name=name,
+                    module=itemp.inst.module,
+                    parameters=[vlsir.Param(name=n, value=v) for n, v in params],
+                    connections=[
+                        vckt.Connection(
+                            portname=portname, target=_target([nets[b] for b in bits])
+                        )
+                        for portname, bits in itemp.conns
+                    ],
+                )
+                continue
+
+            # Local module instance. Create its internal nets, and recursively visit it.
+            child = itemp.child
+            child_prefix = name + self.opts.sep
+            child_nets: List[Net] = [None] * len(child.names)
+            for child_bit, parent_bit in itemp.port_map:
+                child_nets[child_bit] = nets[parent_bit]
+            for bit in child.internal:
+                net = child_prefix + child.names[bit]
+                child_nets[bit] = net
+                yield vckt.Signal(name=net, width=1)
+            child_env = self.child_env(child.module, itemp.inst, params)
+            yield from self.visit(child, child_nets, child_prefix, child_env)
+
+    def child_env(
+        self,
+        module: vckt.Module,
+        inst: vckt.Instance,
+        params: List[Tuple[str, vlsir.ParamValue]],
+    ) -> Dict[str, vlsir.ParamValue]:
+        """Get the parameter environment of instance `inst` of `module`, with (resolved) instance parameters `params`.
+        Like netlisting, parameters not declared by `module` are passed through.
+        Default values are resolved in declaration order, against the parameters declared before them."""
+        values = dict(params)
+        env = dict()
+        for mparam in module.parameters:
+            if mparam.name in values:
+                env[mparam.name] = values.pop(mparam.name)
+            elif mparam.value.WhichOneof("value") is not None:
+                default = mparam.value
+                env[mparam.name] = _resolve(default, _identifiers(default), env)
+            else:
+                msg = f"Required parameter `{mparam.name}` not specified for Instance `{inst.name}` of `{module.name}`"
+                raise RuntimeError(msg)
+        env.update(values)
+        return env
+
+    def template(self, module: vckt.Module) -> _ModuleTemplate:
+        """Get the template of `module`, analyzing it on first use."""
+        cached = self.templates.get(module.name, None)
+        if cached is not None:
+            return cached
+        if module.name in self.stack:
+            raise RuntimeError(
+                f"Invalid recursive instantiation of Module `{module.name}`"
+            )
+        self.stack.append(module.name)
+        template = self.analyze(module)
+        self.stack.pop()
+        self.templates[module.name] = template
+        return template
+
+    def analyze(self, module: vckt.Module) -> _ModuleTemplate:
+        """Analyze `module`, resolving its signals and connections to bit-indices."""
+        if len(self.stack) > 1 and len(module.literals):
+            msg = f"Cannot flatten literal content of non-top Module `{module.name}`"
+            raise RuntimeError(msg)
+
+        bits: Dict[str, List[int]] = dict()
+        names: List[str] = []
+        for signal in module.signals:
+            if signal.name in bits:
+                msg = f"Duplicate signal definition `{signal.name}` in Module `{module.name}`"
+                raise RuntimeError(msg)
+            if signal.width < 1:
+                msg = f"Invalid signal `{signal.name}` of width {signal.width} in Module `{module.name}`"
+                raise RuntimeError(msg)
+            if signal.width == 1:
+                bits[signal.name] = [len(names)]
+                names.append(signal.name)
+            else:
+                start = len(names)
+                bits[signal.name] = list(range(start, start + signal.width))
+                names.extend(
+                    f"{signal.name}{self.opts.bit_sep}{idx}"
+                    for idx in reversed(range(signal.width))
+                )
+
+        ports: List[int] = []
+        for port in module.ports:
+            if port.signal not in bits:
+                msg = f"Port `{port.signal}` has no signal in Module `{module.name}`"
+                raise RuntimeError(msg)
+            ports.extend(bits[port.signal])
+        port_bits = set(ports)
+        internal = [bit for bit in range(len(names)) if bit not in port_bits]
+
+        template = _ModuleTemplate(
+            module=module, bits=bits, names=names, internal=internal, ports=ports
+        )
+        for inst in module.instances:
+            template.instances.append(self.analyze_instance(template, inst))
+        return template
+
+    def analyze_instance(
+        self, parent: _ModuleTemplate, inst: vckt.Instance
+    ) -> _InstanceTemplate:
+        """Analyze instance `inst` within `parent`."""
+        params = [(p.name, p.value, _identifiers(p.value)) for p in inst.parameters]
+        conns = [
+            (conn.portname, self.target_bits(parent, conn.target))
+            for conn in inst.connections
+        ]
+
+        ref = inst.module
+        if ref.WhichOneof("to") != "local":  # External module or primitive: a leaf
+            return _InstanceTemplate(inst=inst, child=None, conns=conns, params=params)
+
+        module = self.modules.get(ref.local, None)
+        if module is None:
+            raise RuntimeError(f"Invalid undefined Module `{ref.local}`")
+        child = self.template(module)
+
+        port_map: List[Tuple[int, int]] = []
+        conns_by_port = dict(conns)
+        if len(conns_by_port) != len(conns):
+            msg = f"Duplicate connections on Instance `{inst.name}` of `{module.name}`"
+            raise RuntimeError(msg)
+        for port in module.ports:
+            parent_bits = conns_by_port.pop(port.signal, None)
+            if parent_bits is None:
+                msg = f"Unconnected port `{port.signal}` on Instance `{inst.name}` of `{module.name}`"
+                raise RuntimeError(msg)
+            child_bits = child.bits[port.signal]
+            if len(child_bits) != len(parent_bits):
+                msg = f"Connection to port `{port.signal}` on Instance `{inst.name}` of `{module.name}` "
+                msg += f"has width {len(parent_bits)}, port has width {len(child_bits)}"
+                raise RuntimeError(msg)
+            port_map.extend(zip(child_bits, parent_bits))
+        if conns_by_port:
+            msg = f"Connections to undefined ports {list(conns_by_port)} on Instance `{inst.name}` of `{module.name}`"
+            raise RuntimeError(msg)
+
+        return _InstanceTemplate(
+            inst=inst, child=child, port_map=port_map, params=params
+        )
+
+    def target_bits(
+        self, parent: _ModuleTemplate, target: vckt.ConnectionTarget
+    ) -> List[int]:
+        """Get the bit-indices of connection-target `target` in `parent`, most-significant first."""
+        stype = target.WhichOneof("stype")
+        if stype == "sig":
+            return self.signal_bits(parent, target.sig)
+        if stype == "slice":
+            slice_ = target.slice
+            sbits = self.signal_bits(parent, slice_.signal)
+            width = len(sbits)
+            if not (0 <= slice_.bot <= slice_.top < width):
+                msg = f"Invalid slice [{slice_.top}:{slice_.bot}] of `{slice_.signal}` of width {width}"
+                raise RuntimeError(msg)
+            # `sbits` is most-significant first, i.e. bit `k` is at position `width - 1 - k`
+            return sbits[width - 1 - slice_.top : width - slice_.bot]
+        if stype == "concat":
+            out: List[int] = []
+            for part in target.concat.parts:
+                out.extend(self.target_bits(parent, part))
+            return out
+        raise ValueError(f"Invalid connection target {target}")
+
+    @staticmethod
+    def signal_bits(parent: _ModuleTemplate, name: str) -> List[int]:
+        sbits = parent.bits.get(name, None)
+        if sbits is None:
+            msg = f"Unknown signal `{name}` in Module `{parent.module.name}`"
+            raise RuntimeError(msg)
+        return sbits
+
+
+def _find_module(pkg: vckt.Package, name: str) -> vckt.Module:
+    for module in pkg.modules:
+        if module.name == name:
+            return module
+    raise RuntimeError(f"Module `{name}` not found in package")
+
+
+def _target(nets: List[Net]) -> vckt.ConnectionTarget:
+    """Create a connection target for `nets`, most-significant first."""
+    if len(nets) == 1:
+        return _bit_target(nets[0])
+    return vckt.ConnectionTarget(
+        concat=vckt.Concat(parts=[_bit_target(net) for net in nets])
+    )
+
+
+def _bit_target(net: Net) -> vckt.ConnectionTarget:
+    if isinstance(net, str):
+        return vckt.ConnectionTarget(sig=net)
+    name, idx = net
+    return vckt.ConnectionTarget(slice=vckt.Slice(signal=name, top=idx, bot=idx))
+
+
+# Identifiers in literal expressions. Excludes the exponents of numbers such as `1e3`.
+_IDENTIFIER = re.compile(r"(?<![\w.])[A-Za-z_]\w*")
+
+
+def _identifiers(pval: vlsir.ParamValue) -> frozenset:
+    """Get the identifiers referenced by `pval`. Only literal expressions reference any."""
+    if pval.WhichOneof("value") != "literal":
+        return frozenset()
+    return frozenset(_IDENTIFIER.findall(pval.literal))
+
+
+def _resolve(pval: vlsir.ParamValue, refs: frozenset, env: Env) -> vlsir.ParamValue:
+    """Resolve parameter-value `pval`, referencing identifiers `refs`, in environment `env`.
+    Values which reference no parameter in `env` are returned as-is, without copying."""
+    if not refs or refs.isdisjoint(env):
+        return pval
+    literal = pval.literal
+    if literal.strip() in env:
+        # Direct reference. Take the referent's value, of any type.
+        return env[literal.strip()]
+
+    def replace(match: re.Match) -> str:
+        name = match.group(0)
+        if name not in env:
+            return name
+        return f"({_expression(env[name], name)})"
+
+    return vlsir.ParamValue(literal=_IDENTIFIER.sub(replace, literal))
+
+
+def _expression(pval: vlsir.ParamValue, name: str) -> str:
+    """Get the literal-expression form of `pval`, the value of parameter `name`."""
+    ptype = pval.WhichOneof("value")
+    if ptype == "int64_value":
+        return str(pval.int64_value)
+    if ptype == "double_value":
+        return repr(pval.double_value)
+    if ptype == "literal":
+        return pval.literal
+    if ptype == "prefixed":
+        pre = pval.prefixed
+        numtp = pre.WhichOneof("number")
+        num = pre.int64_value if numtp == "int64_value" else getattr(pre, numtp)
+        return f"{num}e{EXPONENTS[pre.prefix]}"
+    msg = f"Cannot use {ptype} parameter `{name}` in a literal expression"
+    raise RuntimeError(msg)
@@ -62,6 +62,16 @@ class NetlistFormat(Enum):
             return CdlNetlister
         raise ValueError(f"Unknown NetlistFormat: {self}")
 
+    def extension(self) -> str:
+        """Get the conventional file-extension for this format, excluding the leading dot."""
+        if self == NetlistFormat.SPECTRE:
+            return "scs"
+        if self == NetlistFormat.VERILOG:
+            return "v"
+        if self == NetlistFormat.CDL:
+            return "cdl"
+        return "sp"  # All other spice dialects
+
     def to_proto(self) -> vlsir.netlist.NetlistFormat:
         """Convert a `NetlistFormat` to a protobuf `NetlistFormat`."""
         F = vlsir.netlist.NetlistFormat
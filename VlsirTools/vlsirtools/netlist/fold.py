@@ -0,0 +1,380 @@
+"""
+# Parameter Folding
+
+An optional pass over instance parameter values, which:
+* Constant-folds numeric `literal` expressions, e.g. `'2*0.5u'`, and numeric `prefixed` values,
+  into a canonical, engineering-notation form, e.g. `1u`. Equal values are thereby formatted identically.
+  Folded values are interned by their source text, so each distinct expression is evaluated once.
+  Numeric suffixes are read per the target format, e.g. `1M` is milli in SPICE, but mega in Spectre.
+* Hoists literal expressions repeated across instances of a module, e.g. `w*nf`,
+  into a shared parameter of that module, which each instance then references by name.
+  Simulators evaluate each hoisted expression once per module-instance, rather than once per use.
+"""
+
+# Std-Lib Imports
+import re
+import math
+import itertools
+from dataclasses import dataclass
+from decimal import Context, Decimal, InvalidOperation
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+# Local Imports
+import vlsir
+import vlsir.circuit_pb2 as vckt
+from .fmt import NetlistFormat, NetlistFormatSpec
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+PRECISION = 15  # Significant digits of folded values
+
+
+@dataclass
+class FoldOptions:
+    """Options for parameter folding"""
+
+    fold: bool = True  # Constant-fold numeric literal and prefixed values
+    # Minimum number of uses within a module for a literal expression to be hoisted. Zero disables hoisting.
+    hoist_min_uses: int = 2
+    hoist_prefix: str = "vlsir_expr"  # Names of hoisted parameters, e.g. `vlsir_expr0`
+
+
+# Exponents of each `SIPrefix`
+EXPONENTS = {
+    vlsir.SIPrefix.YOCTO: -24,
+    vlsir.SIPrefix.ZEPTO: -21,
+    vlsir.SIPrefix.ATTO: -18,
+    vlsir.SIPrefix.FEMTO: -15,
+    vlsir.SIPrefix.PICO: -12,
+    vlsir.SIPrefix.NANO: -9,
+    vlsir.SIPrefix.MICRO: -6,
+    vlsir.SIPrefix.MILLI: -3,
+    vlsir.SIPrefix.CENTI: -2,
+    vlsir.SIPrefix.DECI: -1,
+    vlsir.SIPrefix.UNIT: 0,
+    vlsir.SIPrefix.DECA: 1,
+    vlsir.SIPrefix.HECTO: 2,
+    vlsir.SIPrefix.KILO: 3,
+    vlsir.SIPrefix.MEGA: 6,
+    vlsir.SIPrefix.GIGA: 9,
+    vlsir.SIPrefix.TERA: 12,
+    vlsir.SIPrefix.PETA: 15,
+    vlsir.SIPrefix.EXA: 18,
+    vlsir.SIPrefix.ZETTA: 21,
+    vlsir.SIPrefix.YOTTA: 24,
+}
+
+# Prefixes of canonical folded values, by exponent.
+# Limited to those which every netlist format writes unambiguously; e.g. SPICE reads `M` as milli, not mega.
+# Values outside their range fold to doubles.
+_CANONICAL = {
+    -18: vlsir.SIPrefix.ATTO,
+    -15: vlsir.SIPrefix.FEMTO,
+    -12: vlsir.SIPrefix.PICO,
+    -9: vlsir.SIPrefix.NANO,
+    -6: vlsir.SIPrefix.MICRO,
+    -3: vlsir.SIPrefix.MILLI,
+    0: vlsir.SIPrefix.UNIT,
+    3: vlsir.SIPrefix.KILO,
+}
+
+# Exponents of SPICE numeric suffixes, by lower-case suffix. SPICE suffixes are case-insensitive.
+_SPICE_SUFFIXES = {
+    "a": -18,
+    "f": -15,
+    "p": -12,
+    "n": -9,
+    "u": -6,
+    "m": -3,
+    "k": 3,
+    "meg": 6,
+    "g": 9,
+    "t": 12,
+}
+
+# Exponents of SPICE numeric suffixes, by every spelling, e.g. `meg`, `Meg` and `MEG`
+_SPICE_SPELLINGS = {
+    "".join(chars): exp
+    for suffix, exp in _SPICE_SUFFIXES.items()
+    for chars in itertools.product(*((c, c.upper()) for c in suffix))
+}
+
+# Exponents of Spectre numeric suffixes. These are case-sensitive: `M` is mega, and `m` milli.
+_SPECTRE_SUFFIXES = {
+    "a": -18,
+    "f": -15,
+    "p": -12,
+    "n": -9,
+    "u": -6,
+    "m": -3,
+    "k": 3,
+    "K": 3,
+    "M": 6,
+    "G": 9,
+    "T": 12,
+}
+
+# Tokens of numeric expressions: numbers with optional suffixes, operators, and parentheses.
+# Anything else, e.g. an identifier or an unknown suffix, makes an expression non-constant.
+_TOKEN = re.compile(
+    r"\s*(?:(?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(?P<suffix>[A-Za-z]+)?(?![\w.])"
+    r"|(?P<op>\*\*|[-+*/()]))"
+)
+
+# Identifiers in literal expressions. Excludes the exponents of numbers such as `1e3`.
+_IDENTIFIER = re.compile(r"(?<![\w.])[A-Za-z_]\w*")
+
+
+def fold_params(
+    pkg: vckt.Package,
+    opts: Optional[FoldOptions] = None,
+    fmt: Union[NetlistFormatSpec, Sequence[NetlistFormatSpec]] = NetlistFormat.SPICE,
+) -> vckt.Package:
+    """Fold and hoist the instance parameter values of `pkg`, per `opts`, for netlisting in format `fmt`.
+    Returns a new `Package`.
+
+    `fmt` may also be a sequence of formats, in which case only suffixes which mean the same thing in every format are folded.
+    """
+    opts = opts or FoldOptions()
+    fmts = [fmt] if isinstance(fmt, (NetlistFormat, str)) else fmt
+    folder = _Folder(opts, common_suffixes(fmts))
+    result = vckt.Package()
+    result.CopyFrom(pkg)
+    for module in result.modules:
+        folder.module(module)
+    return result
+
+
+class _Folder:
+    """Parameter-folding state, shared across modules. Folded values are memoized by their source."""
+
+    def __init__(self, opts: FoldOptions, suffixes: Mapping[str, int]):
+        self.opts = opts
+        self.suffixes = suffixes
+        self.literals: Dict[str, Optional[vlsir.ParamValue]] = dict()
+        self.prefixed: Dict[bytes, Optional[vlsir.ParamValue]] = dict()
+
+    def module(self, module: vckt.Module) -> None:
+        """Fold and hoist the instance parameters of `module`, in place."""
+        if self.opts.fold:
+            for pinst in module.instances:
+                for param in pinst.parameters:
+                    folded = self.fold(param.value)
+                    if folded is not None:
+                        param.value.CopyFrom(folded)
+        if self.opts.hoist_min_uses:
+            self.hoist(module)
+
+    def fold(self, pval: vlsir.ParamValue) -> Optional[vlsir.ParamValue]:
+        """Get the folded form of `pval`, or `None` if it is not a constant, or not representable as a double."""
+        ptype = pval.WhichOneof("value")
+        if ptype == "literal":
+            text = pval.literal
+            if text not in self.literals:
+                value = evaluate(text, self.suffixes)
+                self.literals[text] = None if value is None else canonical(value)
+            return self.literals[text]
+        if ptype == "prefixed":
+            key = pval.prefixed.SerializeToString()
+            if key not in self.prefixed:
+                value = _prefixed_value(pval.prefixed)
+                self.prefixed[key] = None if value is None else canonical(value)
+            return self.prefixed[key]
+        return None
+
+    def hoist(self, module: vckt.Module) -> None:
+        """Hoist literal expressions used at least `hoist_min_uses` times in `module` into its parameters."""
+        uses: Dict[str, List[vlsir.Param]] = dict()
+        for pinst in module.instances:
+            for param in pinst.parameters:
+                if param.value.WhichOneof("value") != "literal":
+                    continue
+                text = param.value.literal
+                if _IDENTIFIER.fullmatch(text.strip()):
+                    continue  # Already a direct reference
+                uses.setdefault(text, []).append(param)
+
+        # Hoisted names must not shadow any parameter or identifier in the module
+        taken = {p.name for p in module.parameters}
+        for text in uses:
+            taken.update(_IDENTIFIER.findall(text))
+        num = 0
+        for text, params in uses.items():
+            if len(params) < self.opts.hoist_min_uses:
+                continue
+            name = f"{self.opts.hoist_prefix}{num}"
+            while name in taken:
+                num += 1
+                name = f"{self.opts.hoist_prefix}{num}"
+            num += 1
+            module.parameters.append(
+                vlsir.Param(name=name, value=vlsir.ParamValue(literal=text))
+            )
+            for param in params:
+                param.value.literal = name
+
+
+def format_suffixes(fmt: NetlistFormatSpec) -> Dict[str, int]:
+    """Get the exponents of the numeric suffixes of format `fmt`, by exact spelling."""
+    fmt = NetlistFormat.get(fmt)
+    if fmt == NetlistFormat.SPECTRE:
+        return _SPECTRE_SUFFIXES
+    if fmt == NetlistFormat.VERILOG:
+        return dict()  # Verilog has none
+    return _SPICE_SPELLINGS  # SPICE dialects, including CDL
+
+
+def common_suffixes(fmts: Sequence[NetlistFormatSpec]) -> Dict[str, int]:
+    """Get the numeric suffixes which have the same exponent in every format of `fmts`."""
+    tables = [format_suffixes(fmt) for fmt in fmts]
+    if not tables:
+        return dict()
+    first, rest = tables[0], tables[1:]
+    return {
+        suffix: exp
+        for suffix, exp in first.items()
+        if all(table.get(suffix, None) == exp for table in rest)
+    }
+
+
+def evaluate(
+    text: str, suffixes: Optional[Mapping[str, int]] = None
+) -> Optional[Decimal]:
+    """Evaluate numeric literal expression `text`, e.g. `'2*0.5u'`.
+    Numeric suffixes are looked up in `suffixes`, which defaults to those of SPICE.
+    Returns `None` if it is not a constant, e.g. if it references any parameter or unknown suffix."""
+    if suffixes is None:
+        suffixes = _SPICE_SPELLINGS
+    text = text.strip()
+    if len(text) > 1 and (text[0], text[-1]) in (("'", "'"), ("{", "}")):
+        text = text[1:-1]
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            if text[pos:].strip():
+                return None
+            break
+        if match.group("num") is not None:
+            num = Decimal(match.group("num"))
+            suffix = match.group("suffix")
+            if suffix:
+                exp = suffixes.get(suffix, None)
+                if exp is None:
+                    return None
+                num = num.scaleb(exp)
+            tokens.append(num)
+        else:
+            tokens.append(match.group("op"))
+        pos = match.end()
+    if not tokens:
+        return None
+    try:
+        parser = _Parser(tokens)
+        value = parser.expr()
+        if parser.pos != len(tokens):
+            return None
+        return value
+    except (ArithmeticError, InvalidOperation, IndexError, ValueError):
+        return None
+
+
+class _Parser:
+    """Recursive-descent evaluator of tokenized numeric expressions"""
+
+    def __init__(self, tokens: list):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        tok = self.tokens[self.pos]
+        self.pos += 1
+        return tok
+
+    def expr(self) -> Decimal:
+        value = self.term()
+        while self.peek() in ("+", "-"):
+            if self.take() == "+":
+                value += self.term()
+            else:
+                value -= self.term()
+        return value
+
+    def term(self) -> Decimal:
+        value = self.unary()
+        while self.peek() in ("*", "/"):
+            if self.take() == "*":
+                value *= self.unary()
+            else:
+                value /= self.unary()
+        return value
+
+    def unary(self) -> Decimal:
+        if self.peek() in ("+", "-"):
+            sign = self.take()
+            value = self.unary()
+            return -value if sign == "-" else value
+        return self.power()
+
+    def power(self) -> Decimal:
+        value = self.atom()
+        if self.peek() == "**":
+            self.take()
+            value = value ** self.unary()
+        return value
+
+    def atom(self) -> Decimal:
+        tok = self.take()
+        if isinstance(tok, Decimal):
+            return tok
+        if tok == "(":
+            value = self.expr()
+            if self.take() != ")":
+                raise ValueError("Unbalanced parentheses")
+            return value
+        raise ValueError(f"Unexpected token {tok}")
+
+
+def canonical(value: Decimal) -> Optional[vlsir.ParamValue]:
+    """Get the canonical `ParamValue` of numeric `value`: an integer for integral values,
+    engineering-notation `prefixed` for others, e.g. `1.5u`, or a double for those outside the range of canonical prefixes.
+    Returns `None` for values which are not finite, or which over- or under-flow a double.
+    """
+    if not value.is_finite():
+        return None
+    as_float = float(value)
+    if math.isinf(as_float) or (as_float == 0 and value != 0):
+        return None
+    value = Context(prec=PRECISION).plus(value)
+    if value == value.to_integral_value() and abs(value) < 10**PRECISION:
+        return vlsir.ParamValue(int64_value=int(value))
+    exponent = (value.adjusted() // 3) * 3
+    prefix = _CANONICAL.get(exponent, None)
+    if prefix is None:
+        return vlsir.ParamValue(double_value=float(value))
+    mantissa = value.scaleb(-exponent).normalize()
+    if mantissa == mantissa.to_integral_value():
+        pre = vlsir.Prefixed(prefix=prefix, int64_value=int(mantissa))
+    else:
+        pre = vlsir.Prefixed(prefix=prefix, string_value=format(mantissa, "f"))
+    return vlsir.ParamValue(prefixed=pre)
+
+
+def _prefixed_value(pre: vlsir.Prefixed) -> Optional[Decimal]:
+    """Get the numeric value of `pre`, or `None` if its number is not numeric."""
+    numtp = pre.WhichOneof("number")
+    if numtp == "int64_value":
+        num = Decimal(pre.int64_value)
+    elif numtp == "string_value":
+        try:
+            num = Decimal(pre.string_value)
+        except InvalidOperation:
+            return None
+    else:
+        return None
+    if not num.is_finite():
+        return None
+    return num.scaleb(EXPONENTS[pre.prefix])
@@ -4,12 +4,18 @@
 """
 
 # Std-Lib Imports
+import os
+from contextlib import contextmanager, ExitStack
 from dataclasses import dataclass
-from typing import IO, Optional
+from typing import IO, Iterator, List, Optional, Sequence, Tuple, Union
 
 # Local Imports
 import vlsir
 from .fmt import NetlistFormat, NetlistFormatSpec
+from .base import Netlister, SharedResolution
+from .compress import Compression, CompressionSpec, CompressedWriter, open_netlist
+from .fold import fold_params
+from .profile import NetlistProfile
 
 
 @dataclass
@@ -18,16 +24,30 @@ class NetlistOptions:
 
     indent: str = 2 * " "  # Indentation. Defaults to two spaces.
     width: int = 80  # Line-width. Defaults to 80.
+    # Compression format. Defaults to none, or for path destinations, to that inferred from their suffix.
+    compression: CompressionSpec = None
+    compression_level: Optional[int] = None  # Compression level. Defaults per format.
+    # Combine runs of regular instances into arrays: Verilog instance arrays, or SPICE and Spectre `m=` multiplicity.
+    # Note this renames or removes the combined instances.
+    instance_arrays: bool = False
+    # Constant-fold instance parameter values, and hoist repeated expressions into module parameters.
+    # See `vlsirtools.netlist.fold`.
+    fold_params: bool = False
+    # Profile to collect netlister call counts and timing into, if any. See `vlsirtools.netlist.profile`.
+    profile: Optional[NetlistProfile] = None
 
 
 ## FIXME: add more `Netlistable`s
 ##Netlistable = Union[vlsir.circuit.Package]
 Netlistable = vlsir.circuit.Package
 
+# Netlist destinations: text or binary `IO`, or paths
+Destination = Union[IO, str, os.PathLike]
+
 
 def netlist(
     pkg: Netlistable,  ## FIXME: rename
-    dest: IO,
+    dest: Destination,
     fmt: NetlistFormatSpec = "spectre",
     opts: Optional[NetlistOptions] = None,
 ) -> None:
@@ -46,34 +66,113 @@ def netlist(
     h.netlist(pkg, dest=sys.stdout, fmt='spice')
     ```
 
+    ```python
+    h.netlist(pkg, dest='mynetlist.scs.gz', fmt='spectre')
+    ```
+
     Primary argument `pkg` must be a `vlsir.circuit.Package`.
     Destination `dest` may be anything that supports the `typing.IO` bundle,
     commonly including open file-handles. `StringIO` is particularly helpful
     for producing a netlist in an in-memory string.
+    `dest` may also be a path, which is compressed if its suffix is `.gz`, `.zst`, or `.xz`,
+    or if `opts.compression` is set. Compressed IO destinations must be binary.
     Format-specifier `fmt` may be any of the `NetlistFormatSpec` enumerated values
     or their string equivalents.
     """
 
-    if opts is not None:
-        raise NotImplementedError("NetlistOptions")  # FIXME!
+    opts = _check_options(opts)
+    if opts.fold_params:
+        pkg = fold_params(pkg, fmt=fmt)
+
+    # Open or wrap `dest` for compression, if necessary, and write the netlist
+    with _open_dest(dest, opts) as f:
+        return _netlister(fmt, f, opts).write_package(pkg)
+
 
-    # If `fmt` is a string, turn it into an enum
-    fmt_enum = NetlistFormat.get(fmt)
+def netlist_multi(
+    pkg: Netlistable,
+    targets: Sequence[Tuple[NetlistFormatSpec, Destination]],
+    opts: Optional[NetlistOptions] = None,
+) -> None:
+    """Netlist proto-Package `pkg` to several formats in a single pass.
+
+    Each of `targets` is a `(fmt, dest)` pair, as for the like-named arguments to `netlist`.
+    Each netlist is identical to that written by `netlist`.
+    But rather than walking `pkg` once per format, each module is visited once, and written in every format in turn.
+    Format-independent work - reference resolution, signal collection, and resolution of parameter values
+    for formats which write them identically - is shared between formats via a `SharedResolution`.
 
-    # Get the corresponding `Netlister` class and instantiate it
-    netlister_cls = fmt_enum.netlister()
-    netlister = netlister_cls(dest=dest)
+    Example usage:
+    ```python
+    netlist_multi(pkg, [("spectre", "pkg.scs"), ("verilog", "pkg.v")])
+    ```
+    """
 
-    # Write the netlist
-    return netlister.write_package(pkg)
+    opts = _check_options(opts)
+    if opts.fold_params:
+        # Fold once for every format, so that they share a package. Only suffixes common to all are folded.
+        pkg = fold_params(pkg, fmt=[fmt for fmt, _ in targets])
+
+    shared = SharedResolution()
+    with ExitStack() as stack:
+        netlisters: List[Netlister] = []
+        for fmt, dest in targets:
+            f = stack.enter_context(_open_dest(dest, opts))
+            netlister = _netlister(fmt, f, opts)
+            netlister.share(shared)
+            netlisters.append(netlister)
+
+        # Mirror `Netlister.write_package`, a module at a time across all netlisters
+        for netlister in netlisters:
+            for emod in pkg.ext_modules:
+                netlister.get_external_module(emod)
+            netlister.write_package_header(pkg)
+        for mod in pkg.modules:
+            for netlister in netlisters:
+                netlister.write_module_definition(mod)
+            shared.next_module()
+        for netlister in netlisters:
+            netlister.dest.flush()
+
+
+def _check_options(opts: Optional[NetlistOptions]) -> NetlistOptions:
+    """Apply defaults to `opts`, and check for unsupported options."""
+    opts = opts or NetlistOptions()
+    if (opts.indent, opts.width) != (NetlistOptions.indent, NetlistOptions.width):
+        raise NotImplementedError("NetlistOptions indent and width")  # FIXME!
+    return opts
+
+
+def _netlister(fmt: NetlistFormatSpec, dest: IO, opts: NetlistOptions) -> Netlister:
+    """Create a `Netlister` for format `fmt`, writing to text file-like `dest`."""
+    # If `fmt` is a string, turn it into an enum, and get the corresponding `Netlister` class
+    netlister_cls = NetlistFormat.get(fmt).netlister()
+    netlister = netlister_cls(dest=dest, instance_arrays=opts.instance_arrays)
+    if opts.profile is not None:
+        opts.profile.instrument(netlister)
+    return netlister
+
+
+@contextmanager
+def _open_dest(dest: Destination, opts: NetlistOptions) -> Iterator[IO]:
+    """Open or wrap `dest` for compression, if necessary. IO destinations are not closed."""
+    if isinstance(dest, (str, os.PathLike)):
+        with open_netlist(dest, opts.compression, opts.compression_level) as f:
+            yield f
+    elif Compression.get(opts.compression) != Compression.NONE:
+        with CompressedWriter(dest, opts.compression, opts.compression_level) as f:
+            yield f
+    else:
+        yield dest
 
 
 def netlist_from_proto(inp: vlsir.netlist.NetlistInput) -> vlsir.netlist.NetlistResult:
-    """# Netlist a ProtoBuf-Dicatated `NetlistInput`"""
+    """# Netlist a ProtoBuf-Dicatated `NetlistInput`.
+    Netlists are compressed if `netlist_path` has a `.gz`, `.zst`, or `.xz` suffix."""
     try:
         netlist(
             pkg=inp.pkg,
-            dest=open(inp.netlist_path, "w"),
+            dest=inp.netlist_path,
             fmt=NetlistFormat.from_proto(inp.fmt),
             opts=None,
         )
@@ -85,8 +184,10 @@ def netlist_from_proto(inp: vlsir.netlist.NetlistInput) -> vlsir.netlist.Netlist
 # Set our exported content for star-imports
 __all__ = [
     "netlist",
+    "netlist_multi",
     "netlist_from_proto",
     "NetlistFormat",
     "NetlistFormatSpec",
     "NetlistOptions",
+    "Compression",
 ]
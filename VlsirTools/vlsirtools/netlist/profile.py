@@ -0,0 +1,154 @@
+"""
+# Netlisting Profiles
+
+Opt-in instrumentation of `Netlister`s, without an external profiler.
+Counts and times calls to the `Netlister` methods in `METHODS`, and tallies the text written per module.
+Results are available as a text summary, or as Chrome-trace JSON, viewable in `chrome://tracing` or Perfetto.
+
+Profile a `netlist` call via `NetlistOptions.profile`:
+```python
+profile = NetlistProfile()
+netlist(pkg, dest, fmt="spectre", opts=NetlistOptions(profile=profile))
+print(profile.report())
+```
+"""
+
+# Std-Lib Imports
+import os
+import json
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, IO, List, Union
+
+# Local Imports
+from .base import Netlister
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+# Netlister methods instrumented by `NetlistProfile.instrument`
+METHODS = (
+    "write_module_definition",
+    "write_instance",
+    "resolve_reference",
+    "get_instance_params",
+    "format_connection_target",
+)
+
+
+@dataclass
+class CallStats:
+    """Call count and total time of an instrumented method"""
+
+    calls: int = 0
+    time: float = 0.0  # Total wall-clock time, in seconds, including nested calls
+
+    @property
+    def mean(self) -> float:
+        """Mean time per call, in seconds"""
+        return self.time / self.calls if self.calls else 0.0
+
+
+@dataclass
+class NetlistProfile:
+    """# Netlisting Profile
+
+    Collects `CallStats` per instrumented method, and the size of each module's definition.
+    If `trace` is set, also records a Chrome-trace event for every instrumented call.
+    Note tracing large netlists records millions of events.
+    """
+
+    trace: bool = False  # Record Chrome-trace events
+    methods: Dict[str, CallStats] = field(default_factory=dict)
+    # Size of each module's definition, keyed by module name.
+    # In characters, equal to bytes for the ASCII content of netlists.
+    module_bytes: Dict[str, int] = field(default_factory=dict)
+    events: List[Dict[str, Any]] = field(default_factory=list)  # Chrome-trace events
+    _written: int = field(default=0, init=False, repr=False)
+    _start: float = field(default_factory=time.perf_counter, init=False, repr=False)
+
+    def instrument(self, netlister: Netlister) -> None:
+        """Instrument `netlister`, by wrapping the `METHODS` of the instance.
+        Other instances of its class are unaffected."""
+        for name in METHODS:
+            setattr(netlister, name, self._wrap(name, getattr(netlister, name)))
+
+        # Count all text written
+        write = netlister.write
+
+        def counted(s: str) -> None:
+            self._written += len(s)
+            write(s)
+
+        netlister.write = counted
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        """Wrap `method`, named `name`, to count and time its calls."""
+        stats = self.methods.setdefault(name, CallStats())
+        events = self.events if self.trace else None
+        modules = name == "write_module_definition"
+        pid = os.getpid()
+
+        def wrapper(*args, **kwargs):
+            written = self._written
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                stats.calls += 1
+                stats.time += end - start
+                if modules:
+                    mname = args[0].name
+                    size = self._written - written
+                    self.module_bytes[mname] = self.module_bytes.get(mname, 0) + size
+                if events is not None:
+                    event = dict(
+                        name=name,
+                        ph="X",  # "Complete" events, with a duration
+                        ts=(start - self._start) * 1e6,
+                        dur=(end - start) * 1e6,
+                        pid=pid,
+                        tid=threading.get_ident(),
+                    )
+                    if modules:
+                        event["args"] = dict(module=args[0].name)
+                    events.append(event)
+
+        return wrapper
+
+    def report(self) -> str:
+        """Summarize the profile as text: per-method stats, slowest first, and module sizes, largest first."""
+        lines = ["Netlist Profile", ""]
+        lines.append(f"{'Method':<28}{'Calls':>10}{'Total (s)':>12}{'Mean (us)':>12}")
+        by_time = sorted(self.methods.items(), key=lambda kv: -kv[1].time)
+        for name, stats in by_time:
+            lines.append(
+                f"{name:<28}{stats.calls:>10}{stats.time:>12.4f}{stats.mean * 1e6:>12.2f}"
+            )
+        if self.module_bytes:
+            lines += ["", f"{'Module':<40}{'Bytes':>12}"]
+            by_size = sorted(self.module_bytes.items(), key=lambda kv: -kv[1])
+            for name, size in by_size:
+                lines.append(f"{name:<40}{size:>12}")
+        return "\n".join(lines) + "\n"
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Convert to a Chrome-trace JSON-compatible dictionary.
+        Requires `trace`. Per-method stats and module sizes are included as metadata."""
+        if not self.trace:
+            raise RuntimeError("Chrome traces require a `NetlistProfile` with `trace`")
+        return dict(
+            traceEvents=self.events,
+            displayTimeUnit="ms",
+            otherData=dict(
+                methods={k: v.__dict__.copy() for k, v in self.methods.items()},
+                module_bytes=dict(self.module_bytes),
+            ),
+        )
+
+    def write_chrome_trace(self, dest: Union[IO[str], os.PathLike, str]) -> None:
+        """Write Chrome-trace JSON to `dest`, either a text file-like object or a path."""
+        if isinstance(dest, (str, os.PathLike)):
+            with open(dest, "w") as f:
+                return self.write_chrome_trace(f)
+        json.dump(self.to_chrome_trace(), dest)
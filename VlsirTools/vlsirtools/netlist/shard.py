@@ -0,0 +1,145 @@
+"""
+# Sharded Netlisting
+
+Writes a `vlsir.circuit.Package` as a directory of files: one per `Module` (or group of modules),
+plus a top-level file which includes each in order, via the format's `include` statement.
+
+Shards are written concurrently with netlisting, and only those whose content has changed are re-written,
+so that unchanged files keep their modification-times, and re-netlisting a mostly-unchanged package is cheap.
+"""
+
+# Std-Lib Imports
+import os
+import re
+import concurrent.futures
+from io import StringIO
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Union
+
+# Local Imports
+import vlsir.circuit_pb2 as vckt
+import vlsir.spice_pb2 as vsp
+from .fmt import NetlistFormat, NetlistFormatSpec
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+SHARD_DIR = "modules"  # Sub-directory of shard files, relative to the top-level file
+
+
+@dataclass
+class ShardedNetlist:
+    """Paths produced by `netlist_sharded`"""
+
+    top: Path  # Top-level file
+    shards: List[Path] = field(default_factory=list)  # Shard files, in include order
+    written: List[Path] = field(default_factory=list)  # Files whose content changed
+    removed: List[Path] = field(default_factory=list)  # Stale shards, removed
+
+
+def netlist_sharded(
+    pkg: vckt.Package,
+    dest: Union[str, os.PathLike],
+    fmt: NetlistFormatSpec = "spectre",
+    modules_per_shard: int = 1,
+    top: str = "top",
+    jobs: Optional[int] = None,
+    prune: bool = True,
+) -> ShardedNetlist:
+    """Netlist proto-Package `pkg` into directory `dest`, with up to `modules_per_shard` modules per file.
+
+    Shards are written to the `SHARD_DIR` sub-directory, named after their first module.
+    The top-level file `{top}.{extension}` includes each, by paths relative to `dest`.
+    Up to `jobs` files are written concurrently.
+    If `prune` is set, files in `SHARD_DIR` with the format's extension which are no longer shards are removed.
+    """
+    if modules_per_shard < 1:
+        raise ValueError(f"Invalid `modules_per_shard` {modules_per_shard}")
+
+    fmt_enum = NetlistFormat.get(fmt)
+    ext = fmt_enum.extension()
+    dest = Path(dest)
+    shard_dir = dest / SHARD_DIR
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    # A single netlister writes every shard, switching destinations in between,
+    # so that it retains the definitions of all prior modules.
+    netlister = fmt_enum.netlister()(dest=StringIO())
+    for emod in pkg.ext_modules:
+        netlister.get_external_module(emod)
+
+    result = ShardedNetlist(top=dest / f"{top}.{ext}")
+    used_names: Set[str] = set()
+    modules = list(pkg.modules)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = dict()
+
+        def submit(path: Path, content: str) -> None:
+            futures[executor.submit(write_if_changed, path, content)] = path
+
+        for start in range(0, len(modules), modules_per_shard):
+            group = modules[start : start + modules_per_shard]
+            netlister.dest = StringIO()
+            netlister.write_comment(
+                f"Generated by `vlsirtools.{type(netlister).__name__}`"
+            )
+            netlister.writeln("")
+            for module in group:
+                netlister.write_module_definition(module)
+
+            name = _shard_name(netlister.get_module_name(group[0]), used_names)
+            path = shard_dir / f"{name}.{ext}"
+            result.shards.append(path)
+            submit(path, netlister.dest.getvalue())
+
+        # Write the top-level file, including each shard in order
+        netlister.dest = StringIO()
+        netlister.write_package_header(pkg)
+        for path in result.shards:
+            netlister.write_include(vsp.Include(path=path.relative_to(dest).as_posix()))
+        submit(result.top, netlister.dest.getvalue())
+
+        for future in concurrent.futures.as_completed(futures):
+            if future.result():
+                result.written.append(futures[future])
+
+    # Keep `written` in include-order, with the top-level file last
+    order = {path: idx for idx, path in enumerate(result.shards + [result.top])}
+    result.written.sort(key=order.__getitem__)
+
+    if prune:
+        current = set(result.shards)
+        for path in sorted(shard_dir.glob(f"*.{ext}")):
+            if path not in current:
+                path.unlink()
+                result.removed.append(path)
+
+    return result
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write `content` to `path`, unless it already holds exactly `content`.
+    Writes are atomic, via a temporary file which replaces `path`. Returns whether `path` was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def _shard_name(module_name: str, used: Set[str]) -> str:
+    """Get a unique, file-system-safe shard name for a shard beginning with module `module_name`.
+    Names are compared case-insensitively, for case-insensitive file systems."""
+    base = re.sub(r"[^\w.-]", "_", module_name) or "module"
+    name, num = base, 1
+    while name.lower() in used:
+        name = f"{base}_{num}"
+        num += 1
+    used.add(name.lower())
+    return name
@@ -12,7 +12,14 @@ import vlsir.spice_pb2 as vsp
 
 # Import the base-class
 from .spectre_spice_shared import SpectreSpiceShared
-from .base import ResolvedModule, ResolvedParams, SpiceModelRef, SpiceBuiltin, SpiceType
+from .base import (
+    ResolvedModule,
+    ResolvedParams,
+    SpiceModelRef,
+    SpiceBuiltin,
+    SpiceType,
+    SaveSpec,
+)
 
 
 def map_primitive(rmodule: SpiceBuiltin, paramvals: ResolvedParams) -> str:
@@ -131,8 +138,7 @@ class SpectreNetlister(SpectreSpiceShared):
         # spice and spectre create these "out of thin air"
 
         # Create its instances
-        for pinst in module.instances:
-            self.write_instance(pinst)
+        self.write_instances(module)
         self.writeln("")
 
         # Write any netlist-literal content
@@ -151,7 +157,7 @@ class SpectreNetlister(SpectreSpiceShared):
         module = ref.module
 
         # Resolve its parameter values, including applying module-level defaults
-        resolved_instance_parameters = self.get_instance_params(pinst, module)
+        resolved_instance_parameters = self.resolve_instance_params(pinst, module)
 
         # And sort out its "apparent module name" for netlisting
         if isinstance(ref, ResolvedModule):
@@ -287,10 +293,17 @@ class SpectreNetlister(SpectreSpiceShared):
         txt = f'include "{lib.path}" section={lib.section}'
         self.writeln(txt)
 
-    def write_save(self, save: vsp.Save) -> None:
-        """# Write a `Save` statement"""
-        # FIXME!
-        raise NotImplementedError(f"Unimplemented control card {save} for {self}")
+    def write_saves(self, saves: SaveSpec) -> None:
+        """# Write a combined signal-saving specification.
+        Sets the global `save` option, and for specific signals, writes a `save` statement.
+        Currents are saved at the positive (first) terminal of each element, e.g. `v1:p`."""
+        if saves.save_all:
+            return self.writeln("vlsirSaveOptions options save=all")
+        if not saves.signals:
+            return self.writeln("vlsirSaveOptions options save=none")
+        self.writeln("vlsirSaveOptions options save=selected")
+        signals = list(saves.voltages) + [f"{i}:p" for i in saves.currents]
+        self.writeln(f"save {' '.join(signals)}")
 
     def write_meas(self, meas: vsp.Meas) -> None:
         """# Write a `Meas` statement"""
@@ -1,11 +1,50 @@
+from typing import Optional
+
 import vlsir
-from .base import Netlister
+import vlsir.circuit_pb2 as vckt
+from .base import Netlister, ResolvedModule, SpiceType
+from .arrays import InstanceArray
 
 
 class SpectreSpiceShared(Netlister):
     """Shared logic between Spectre and Spice netlisters.
     Designed to be a parent class of both."""
 
+    # `SpiceType`s of the elements which support `m=` multiplicity
+    MULTIPLICITY = {
+        SpiceType.SUBCKT,
+        SpiceType.MOS,
+        SpiceType.BIPOLAR,
+        SpiceType.DIODE,
+        SpiceType.RESISTOR,
+        SpiceType.CAPACITOR,
+        SpiceType.INDUCTOR,
+    }
+
+    def get_array_instance(self, array: InstanceArray) -> Optional[vckt.Instance]:
+        """Get a single instance equivalent to parallel-array `array`, via `m=` multiplicity.
+        It takes the name of the array's first instance.
+        Returns `None` for elements which do not support multiplicity, or which already set or declare `m`."""
+        first = array.instances[0]
+        ref = self.resolve_reference(first.module)
+        if isinstance(ref, ResolvedModule):
+            spice_type = SpiceType.SUBCKT
+        else:
+            spice_type = ref.spice_type
+        if spice_type not in self.MULTIPLICITY:
+            return None
+        params = list(first.parameters) + list(ref.module.parameters)
+        if any(p.name.lower() == "m" for p in params):
+            return None
+        pinst = vckt.Instance()
+        pinst.CopyFrom(first)
+        pinst.parameters.append(
+            vlsir.Param(
+                name="m", value=vlsir.ParamValue(int64_value=len(array.instances))
+            )
+        )
+        return pinst
+
     @classmethod
     def format_param_decl(cls, param: vlsir.Param) -> str:
         """Format a parameter-declaration. The `value` field serves as the default value."""
@@ -18,36 +57,38 @@ class SpectreSpiceShared(Netlister):
             raise RuntimeError(msg)
         return f"{param.name}={default}"
 
+    # Formatted `SIPrefix`es, by prefix.
+    # Use the single-character string where we can, and the exponent otherwise.
+    PREFIXES = {
+        # Single-character aliases, supported by every SPICE we know
+        vlsir.SIPrefix.ATTO: "a",
+        vlsir.SIPrefix.FEMTO: "f",
+        vlsir.SIPrefix.PICO: "p",
+        vlsir.SIPrefix.NANO: "n",
+        vlsir.SIPrefix.MICRO: "u",
+        vlsir.SIPrefix.MILLI: "m",
+        vlsir.SIPrefix.UNIT: "",
+        vlsir.SIPrefix.KILO: "K",
+        vlsir.SIPrefix.MEGA: "M",
+        vlsir.SIPrefix.GIGA: "G",
+        vlsir.SIPrefix.TERA: "T",
+        vlsir.SIPrefix.PETA: "P",
+        # Fall back to the exponent for the rest
+        vlsir.SIPrefix.YOCTO: "e-24",
+        vlsir.SIPrefix.ZEPTO: "e-21",
+        vlsir.SIPrefix.CENTI: "e-2",
+        vlsir.SIPrefix.DECI: "e-1",
+        vlsir.SIPrefix.DECA: "e1",
+        vlsir.SIPrefix.HECTO: "e2",
+        vlsir.SIPrefix.EXA: "e17",
+        vlsir.SIPrefix.ZETTA: "e18",
+        vlsir.SIPrefix.YOTTA: "e19",
+    }
+
     @classmethod
     def format_prefix(cls, pre: vlsir.SIPrefix) -> str:
         """Format a `SIPrefix` to a string"""
-        # Use the single-character string where we can, and the exponent otherwise.
-        map = {
-            # Single-character aliases, supported by every SPICE we know
-            vlsir.SIPrefix.ATTO: "a",
-            vlsir.SIPrefix.FEMTO: "f",
-            vlsir.SIPrefix.PICO: "p",
-            vlsir.SIPrefix.NANO: "n",
-            vlsir.SIPrefix.MICRO: "u",
-            vlsir.SIPrefix.MILLI: "m",
-            vlsir.SIPrefix.UNIT: "",
-            vlsir.SIPrefix.KILO: "K",
-            vlsir.SIPrefix.MEGA: "M",
-            vlsir.SIPrefix.GIGA: "G",
-            vlsir.SIPrefix.TERA: "T",
-            vlsir.SIPrefix.PETA: "P",
-            # Fall back to the exponent for the rest
-            vlsir.SIPrefix.YOCTO: "e-24",
-            vlsir.SIPrefix.ZEPTO: "e-21",
-            vlsir.SIPrefix.CENTI: "e-2",
-            vlsir.SIPrefix.DECI: "e-1",
-            vlsir.SIPrefix.DECA: "e1",
-            vlsir.SIPrefix.HECTO: "e2",
-            vlsir.SIPrefix.EXA: "e17",
-            vlsir.SIPrefix.ZETTA: "e18",
-            vlsir.SIPrefix.YOTTA: "e19",
-        }
-        if pre not in map:
+        formatted = cls.PREFIXES.get(pre, None)
+        if formatted is None:
             raise ValueError(f"Invalid or Unsupported SIPrefix {pre}")
-
-        return map[pre]
+        return formatted
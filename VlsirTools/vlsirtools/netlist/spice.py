@@ -33,7 +33,8 @@ heavily re-using a central `SpiceNetlister` class, but requiring simulator-speci
 """
 
 # Std-Lib Imports
-from typing import Union
+import random
+from typing import Union, Optional
 
 # Local Imports
 import vlsir
@@ -49,6 +50,7 @@ from .base import (
     ModuleLike,
     SpiceBuiltin,
     SpiceModelRef,
+    SaveSpec,
 )
 
 
@@ -108,8 +110,7 @@ class SpiceNetlister(SpectreSpiceShared):
         self.write("\n")
 
         # Create its instances
-        for pinst in module.instances:
-            self.write_instance(pinst)
+        self.write_instances(module)
 
         # Write any netlist-literal content
         self.write_literals(module.literals)
@@ -128,8 +129,8 @@ class SpiceNetlister(SpectreSpiceShared):
         """Write the parameter declarations for Module `module`.
         Parameter declaration format: `name1=val1 name2=val2 name3=val3`"""
         self.write("+ ")
-        for pparam in module.parameters:
-            self.write(self.format_param_decl(pparam))
+        decls = [self.format_param_decl(pparam) for pparam in module.parameters]
+        self.write(" ".join(decls))
         self.write("\n")
 
     def write_instance_name(
@@ -213,7 +214,7 @@ class SpiceNetlister(SpectreSpiceShared):
         self.writeln("+ " + module_name)
 
         # Write its parameter values
-        resolved_param_values = self.get_instance_params(pinst, module)
+        resolved_param_values = self.resolve_instance_params(pinst, module)
         self.write_instance_params(resolved_param_values)
 
         # Add a blank after each instance
@@ -232,7 +233,7 @@ class SpiceNetlister(SpectreSpiceShared):
         self.write_instance_conns(pinst, ref.module)
 
         # Resolve its parameter-values to spice-strings
-        resolved_param_values = self.get_instance_params(pinst, ref.module)
+        resolved_param_values = self.resolve_instance_params(pinst, ref.module)
 
         # Write special and/or positional parameters
         if ref.spice_type == SpiceType.RESISTOR:
@@ -283,7 +284,7 @@ class SpiceNetlister(SpectreSpiceShared):
         Throws an Exception if `rmodule` is not a known voltage-source type."""
 
         # Resolve its parameter values
-        resolved_param_values = self.get_instance_params(pinst, ref.module)
+        resolved_param_values = self.resolve_instance_params(pinst, ref.module)
 
         # Write the instance name
         self.write_instance_name(pinst, ref.spice_type)
@@ -418,6 +419,13 @@ class SpiceNetlister(SpectreSpiceShared):
         """While dialects vary, the *generic* Spice-comment begins with the asterisk."""
         self.write(f"* {comment}\n")
 
+    def format_param_decl(self, param: vlsir.Param) -> str:
+        """Format a parameter-declaration. Literal defaults, e.g. `w*nf`, are formatted as expressions,
+        as for instance parameter-values."""
+        if param.value.WhichOneof("value") == "literal":
+            return f"{param.name}={self.format_expression(param.value.literal)}"
+        return super().format_param_decl(param)
+
     def format_expression(self, expr: str) -> str:
         """Format a string such that the target format interprets it as an expression.
         Example:
@@ -434,6 +442,26 @@ class SpiceNetlister(SpectreSpiceShared):
         # wrapping expressions in single-tick quotes.
         return f"'{expr}'"
 
+    def write_include(self, inc: vsp.Include) -> None:
+        """# Write an `Include`, as a `.include` statement"""
+        self.writeln(f".include '{inc.path}'")
+
+    def write_saves(self, saves: SaveSpec) -> None:
+        """# Write a combined signal-saving specification, as a `.save` statement.
+        Once any signal is `.save`d, most Spice dialects save *only* the requested signals."""
+        if saves.save_all:
+            return self.writeln(".save all")
+        if not saves.signals:
+            return self.writeln(".save none")
+        return self.writeln(f".save {self.format_save_signals(saves)}")
+
+    @classmethod
+    def format_save_signals(cls, saves: SaveSpec) -> str:
+        """# Format the specific signals in `saves`, in Spice `v(node) i(element)` syntax."""
+        signals = [f"v({v})" for v in saves.voltages]
+        signals += [f"i({i})" for i in saves.currents]
+        return " ".join(signals)
+
 
 class HspiceNetlister(SpiceNetlister):
     """
@@ -449,10 +477,28 @@ class HspiceNetlister(SpiceNetlister):
 
         return NetlistFormat.HSPICE
 
+    def write_saves(self, saves: SaveSpec) -> None:
+        """# Write a combined signal-saving specification.
+        Hspice's `.save` is an operating-point facility; signal-saving is instead done via `.probe`,
+        and restricted to `.probe`d signals by `.option probe`."""
+        if saves.save_all:
+            return self.writeln(".option post")
+        self.writeln(".option probe")
+        if saves.signals:
+            self.writeln(f".probe {self.format_save_signals(saves)}")
+
 
 class XyceNetlister(SpiceNetlister):
     """Xyce-Format Netlister"""
 
+    # Xyce supports multiplicity for a subset of devices, and not for sub-circuits
+    MULTIPLICITY = {
+        SpiceType.MOS,
+        SpiceType.RESISTOR,
+        SpiceType.CAPACITOR,
+        SpiceType.INDUCTOR,
+    }
+
     @property
     def enum(self):
         """Get our entry in the `NetlistFormat` enumeration"""
@@ -467,8 +513,8 @@ class XyceNetlister(SpiceNetlister):
         + PARAMS: name1=val1 name2=val2 name3=val3 \n
         """
         self.write("+ PARAMS: ")  # <= Xyce-specific
-        for pparam in module.parameters:
-            self.write(self.format_param_decl(pparam))
+        decls = [self.format_param_decl(pparam) for pparam in module.parameters]
+        self.write(" ".join(decls))
         self.write("\n")
 
     def write_instance_params(self, pvals: ResolvedParams) -> None:
@@ -516,9 +562,29 @@ class XyceNetlister(SpiceNetlister):
         """# Write a `LibInclude`"""
         self.writeln(f".lib {lib.path} {lib.section}")
 
-    def write_save(self, save: vsp.Save) -> None:
-        # FIXME!
-        raise NotImplementedError(f"Unimplemented control card {save} for {self}")
+    def write_saves(self, saves: SaveSpec) -> None:
+        """# Write a combined signal-saving specification.
+        Xyce has no `.save` statement. Signals are instead selected by each analysis's `.print` statement,
+        as generated by `format_print`. So there is nothing to write here."""
+        return None
+
+    def format_print(self, analysis_type: str) -> Optional[str]:
+        """# Format the `.print` statement for an analysis of type `analysis_type`, e.g. "tran".
+        Returns `None` if no signals are to be saved, in which case the analysis should have no `.print` statement.
+        Note `csv` output-formatting is encoded here."""
+        if self.saves.save_all:
+            signals = "v(*) i(*)"
+        elif self.saves.signals:
+            signals = self.format_save_signals(self.saves)
+        else:
+            return None
+        return f".print {analysis_type} format=csv {signals} \n"
+
+    def write_print(self, analysis_type: str) -> None:
+        """# Write the `.print` statement for an analysis of type `analysis_type`, if there is one."""
+        line = self.format_print(analysis_type)
+        if line is not None:
+            self.writeln(line)
 
     def write_meas(self, meas: vsp.Meas) -> None:
         """# Write a measurement."""
@@ -565,9 +631,8 @@ class XyceNetlister(SpiceNetlister):
         else:
             raise ValueError("Invalid sweep type")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        self.writeln(".print dc format=csv v(*) i(*) \n")
+        # Write the `.print` statement for our saved signals
+        self.write_print("dc")
 
         self.writeln(".end \n")
 
@@ -590,9 +655,8 @@ class XyceNetlister(SpiceNetlister):
         # Write the analysis command
         self.writeln(f".dc {dummy_param} 1 1 1 \n")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        self.writeln(".print dc format=csv v(*) i(*) \n")
+        # Write the `.print` statement for our saved signals
+        self.write_print("dc")
 
         # And don't forget - the thing SPICE can't live without - END!
         self.writeln(".end \n")
@@ -617,9 +681,8 @@ class XyceNetlister(SpiceNetlister):
         # Write the analysis command
         self.writeln(f".tran {tstep} {tstop} \n")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        self.writeln(".print tran format=csv v(*) i(*) \n")
+        # Write the `.print` statement for our saved signals
+        self.write_print("tran")
 
         # And don't forget - the thing SPICE can't live without - END!
         self.writeln(".end \n")
@@ -654,10 +717,6 @@ class NgspiceNetlister(SpiceNetlister):
         txt = f'.lib "{lib.path}" {lib.section}'
         return self.writeln(txt)
 
-    def write_save(self, save: vsp.Save) -> None:
-        # FIXME!
-        raise NotImplementedError(f"Unimplemented Save {save} for {self}")
-
     def write_meas(self, meas: vsp.Meas) -> None:
         txt = f".meas {meas.analysis_type} {meas.name} {meas.expr}"
         return self.writeln(txt)
@@ -1,12 +1,17 @@
 """
 # Verilog-Format Netlister 
 """
+# Std-Lib Imports
+from typing import Optional
+
 # Local Imports
 import vlsir
 import vlsir.circuit_pb2 as vckt
+import vlsir.spice_pb2 as vsp
 
 # Import the base-class
 from .base import Netlister, ResolvedModule, ResolvedParams
+from .arrays import ArrayKind, InstanceArray
 
 
 class VerilogNetlister(Netlister):
@@ -14,6 +19,9 @@ class VerilogNetlister(Netlister):
     # Structural Verilog Netlister
     """
 
+    # Verilog instance arrays step through bus bits
+    ARRAY_KIND = ArrayKind.BUS
+
     @property
     def enum(self):
         """Get our entry in the `NetlistFormat` enumeration"""
@@ -63,8 +71,7 @@ class VerilogNetlister(Netlister):
         if module.instances:  # Create its instances
             self.writeln("")
             self.writeln("// Instance Declarations")
-            for pinst in module.instances:
-                self.write_instance(pinst)
+            self.write_instances(module)
         else:
             self.writeln("// No Instances")
 
@@ -115,7 +122,7 @@ class VerilogNetlister(Netlister):
         module, module_name = rmodule.module, rmodule.module_name
 
         # Resolve its parameter values
-        resolved_instance_parameters = self.get_instance_params(pinst, module)
+        resolved_instance_parameters = self.resolve_instance_params(pinst, module)
 
         # Write the module-name
         self.writeln(module_name)
@@ -153,6 +160,22 @@ class VerilogNetlister(Netlister):
 
         self.writeln("")  # Post-Instance blank line
 
+    def get_array_instance(self, array: InstanceArray) -> Optional[vckt.Instance]:
+        """Get a Verilog instance array equivalent to `array`, e.g. `inv[7:0]`.
+        Array element `inv[k]` replaces instance `inv_k`.
+        Its range is ordered such that its leftmost element connects to the most significant bits."""
+        if array.step < 0:
+            rng = f"[{array.first}:{array.last}]"
+        else:
+            rng = f"[{array.last}:{array.first}]"
+        first = array.instances[0]
+        return vckt.Instance(
+            name=array.base + rng,
+            module=first.module,
+            parameters=first.parameters,
+            connections=array.connections,
+        )
+
     def write_instance_params(self, pvals: ResolvedParams) -> None:
         """Write Instance parameters `pvals`"""
         if not pvals:
@@ -246,35 +269,41 @@ class VerilogNetlister(Netlister):
         """Verilog uses C-style line comments, beginning with `//`"""
         self.write(f"// {comment}\n")
 
+    def write_include(self, inc: vsp.Include) -> None:
+        """# Write an `Include`, via the `include compiler directive"""
+        self.writeln(f'`include "{inc.path}"')
+
+    # Formatted `SIPrefix`es, by prefix.
+    # Verilog does not have the SI prefixes built in. Always write the exponent value.
+    PREFIXES = {
+        # Single-character aliases, supported by every SPICE we know
+        vlsir.SIPrefix.YOCTO: "e-24",
+        vlsir.SIPrefix.ZEPTO: "e-21",
+        vlsir.SIPrefix.ATTO: "e-18",
+        vlsir.SIPrefix.FEMTO: "e-15",
+        vlsir.SIPrefix.PICO: "e-12",
+        vlsir.SIPrefix.NANO: "e-9",
+        vlsir.SIPrefix.MICRO: "e-6",
+        vlsir.SIPrefix.MILLI: "e-3",
+        vlsir.SIPrefix.CENTI: "e-2",
+        vlsir.SIPrefix.DECI: "e-1",
+        vlsir.SIPrefix.UNIT: "",
+        vlsir.SIPrefix.DECA: "e1",
+        vlsir.SIPrefix.HECTO: "e2",
+        vlsir.SIPrefix.KILO: "e3",
+        vlsir.SIPrefix.MEGA: "e6",
+        vlsir.SIPrefix.GIGA: "e9",
+        vlsir.SIPrefix.TERA: "e12",
+        vlsir.SIPrefix.PETA: "e15",
+        vlsir.SIPrefix.EXA: "e17",
+        vlsir.SIPrefix.ZETTA: "e18",
+        vlsir.SIPrefix.YOTTA: "e19",
+    }
+
     @classmethod
     def format_prefix(cls, pre: vlsir.SIPrefix) -> str:
         """Format a `SIPrefix` to a string"""
-        # Verilog does not have the SI prefixes built in. Always write the exponent value.
-        map = {
-            # Single-character aliases, supported by every SPICE we know
-            vlsir.SIPrefix.YOCTO: "e-24",
-            vlsir.SIPrefix.ZEPTO: "e-21",
-            vlsir.SIPrefix.ATTO: "e-18",
-            vlsir.SIPrefix.FEMTO: "e-15",
-            vlsir.SIPrefix.PICO: "e-12",
-            vlsir.SIPrefix.NANO: "e-9",
-            vlsir.SIPrefix.MICRO: "e-6",
-            vlsir.SIPrefix.MILLI: "e-3",
-            vlsir.SIPrefix.CENTI: "e-2",
-            vlsir.SIPrefix.DECI: "e-1",
-            vlsir.SIPrefix.UNIT: "",
-            vlsir.SIPrefix.DECA: "e1",
-            vlsir.SIPrefix.HECTO: "e2",
-            vlsir.SIPrefix.KILO: "e3",
-            vlsir.SIPrefix.MEGA: "e6",
-            vlsir.SIPrefix.GIGA: "e9",
-            vlsir.SIPrefix.TERA: "e12",
-            vlsir.SIPrefix.PETA: "e15",
-            vlsir.SIPrefix.EXA: "e17",
-            vlsir.SIPrefix.ZETTA: "e18",
-            vlsir.SIPrefix.YOTTA: "e19",
-        }
-        if pre not in map:
+        formatted = cls.PREFIXES.get(pre, None)
+        if formatted is None:
             raise ValueError(f"Invalid or Unsupported SIPrefix {pre}")
-
-        return map[pre]
+        return formatted
@@ -0,0 +1,14 @@
+"""
+# Vlsir Netlist Parsing
+
+Imports SPICE, CDL, and Spectre netlists to `vlsir.circuit.Package`s.
+The reverse of `vlsirtools.netlist`.
+
+Netlists are read one logical line at a time, tokenized by a single compiled regular expression,
+and each sub-circuit is emitted as soon as it is complete, so that large extracted netlists
+import in memory bounded by their largest sub-circuit.
+"""
+
+from .main import parse, iter_parse
+from .base import ParseOptions
+from .lex import ParseError
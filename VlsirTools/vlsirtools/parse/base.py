@@ -0,0 +1,490 @@
+"""
+# Netlist Parsing Base
+
+Language-independent state shared by the SPICE and Spectre parsers:
+the `Builder`, which accumulates each sub-circuit into a `vlsir.circuit.Module`,
+and emits modules and external modules as soon as they are complete.
+"""
+
+# Std-Lib Imports
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+# Local Imports
+import vlsir
+import vlsir.circuit_pb2 as vckt
+from ..delimited import encode_varint
+from .lex import ParseError
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+PARAM_CACHE = 1 << 16  # Number of distinct encoded parameters cached
+CONNECTION_CACHE = 1 << 16  # Number of distinct encoded connections cached
+
+
+@dataclass
+class ParseOptions:
+    """Options for netlist parsing"""
+
+    # Domain of the resulting `Package`, and of the `ExternalModule`s created for
+    # models and for sub-circuits which are instantiated but never defined.
+    domain: str = ""
+    top: str = "top"  # Name of the `Module` holding any top-level instances
+    # Whether the first line of a SPICE deck is a title, and hence ignored.
+    # By default, it is a title unless it is a comment or dot-directive, e.g. the `.subckt` of a library file.
+    # Not applicable to Spectre or CDL.
+    title: Optional[bool] = None
+
+
+# Items emitted by the parser
+Item = Union[vckt.Module, vckt.ExternalModule]
+
+# Port names of model-based `ExternalModule`s, by `SpiceType`.
+# Each model's ports are the first N of these, where N is the number of connections of its first instance.
+_MODEL_PORTS = {
+    vckt.SpiceType.MOS: ["d", "g", "s", "b"],
+    vckt.SpiceType.DIODE: ["p", "n"],
+    vckt.SpiceType.BIPOLAR: ["c", "b", "e", "s"],
+    vckt.SpiceType.RESISTOR: ["p", "n"],
+    vckt.SpiceType.CAPACITOR: ["p", "n"],
+    vckt.SpiceType.INDUCTOR: ["p", "n"],
+}
+
+# `SpiceType`s of model types, in both SPICE (e.g. `.model nch nmos`) and Spectre (e.g. `model nch bsim4`) terms
+_MODEL_TYPES = {
+    "nmos": vckt.SpiceType.MOS,
+    "pmos": vckt.SpiceType.MOS,
+    "d": vckt.SpiceType.DIODE,
+    "diode": vckt.SpiceType.DIODE,
+    "npn": vckt.SpiceType.BIPOLAR,
+    "pnp": vckt.SpiceType.BIPOLAR,
+    "bjt": vckt.SpiceType.BIPOLAR,
+    "vbic": vckt.SpiceType.BIPOLAR,
+    "r": vckt.SpiceType.RESISTOR,
+    "res": vckt.SpiceType.RESISTOR,
+    "resistor": vckt.SpiceType.RESISTOR,
+    "c": vckt.SpiceType.CAPACITOR,
+    "cap": vckt.SpiceType.CAPACITOR,
+    "capacitor": vckt.SpiceType.CAPACITOR,
+    "l": vckt.SpiceType.INDUCTOR,
+    "inductor": vckt.SpiceType.INDUCTOR,
+}
+
+# Prefixes of Spectre MOS model types, e.g. `bsim4`, `psp103`
+_MOS_MODEL_PREFIXES = ("bsim", "psp", "hisim", "mos", "ekv")
+
+
+def model_spicetype(mtype: str) -> Optional[int]:
+    """Get the `SpiceType` of model-type `mtype`, or `None` if it is not supported."""
+    mtype = mtype.lower()
+    if mtype in _MODEL_TYPES:
+        return _MODEL_TYPES[mtype]
+    if mtype.startswith(_MOS_MODEL_PREFIXES):
+        return vckt.SpiceType.MOS
+    return None
+
+
+def param_value(text: str) -> vlsir.ParamValue:
+    """Convert netlist parameter-value `text` to a `ParamValue`.
+    Plain integers and floats become numeric values, double-quoted text becomes a string,
+    and everything else, e.g. `1u` or `'2*w'`, becomes a literal expression."""
+    first = text[0]
+    if first == "'" or first == "{":
+        return vlsir.ParamValue(literal=text[1:-1])
+    if first == '"':
+        return vlsir.ParamValue(string_value=text[1:-1])
+    if first.isdigit() or first in ".-+":
+        try:
+            return vlsir.ParamValue(int64_value=int(text))
+        except ValueError:
+            pass
+        try:
+            return vlsir.ParamValue(double_value=float(text))
+        except ValueError:
+            pass
+    return vlsir.ParamValue(literal=text)
+
+
+def params(pairs: List[Tuple[str, str]]) -> List[vlsir.Param]:
+    """Convert `(name, value)` pairs to `Param`s."""
+    return [vlsir.Param(name=name, value=param_value(value)) for name, value in pairs]
+
+
+# Instances are by far the most numerous items in large netlists, and constructing each
+# via the protobuf API dominates parse time. They are instead encoded directly into the
+# protobuf wire format, as `Module.instances` fields, and decoded once per module.
+# Parameters and connections repeat heavily, and their encodings are cached.
+
+
+def _length(num: int) -> bytes:
+    """Encode length-prefix `num`, with a fast path for the common single-byte case."""
+    return _SMALL[num] if num < 128 else encode_varint(num)
+
+
+_SMALL = [bytes((num,)) for num in range(128)]
+
+
+def _field(tag: bytes, data: bytes) -> bytes:
+    """Encode a length-delimited field, with (pre-encoded) `tag`, and content `data`."""
+    return tag + _length(len(data)) + data
+
+
+# Encoded tags of length-delimited fields, by field number
+_TAG1, _TAG2, _TAG3, _TAG4 = b"\x0a", b"\x12", b"\x1a", b"\x22"
+
+# Pairing of an instance's encoded `module` field, and its master's port names
+_Master = Tuple[bytes, List[str]]
+
+
+def _master(ref: vlsir.Reference, ports: List[str]) -> _Master:
+    return _field(_TAG2, ref.SerializeToString()), ports
+
+
+@lru_cache(maxsize=PARAM_CACHE)
+def _param(name: str, text: str) -> bytes:
+    """Encode parameter `name=text` as an `Instance.parameters` field."""
+    param = vlsir.Param(name=name, value=param_value(text))
+    return _field(_TAG3, param.SerializeToString())
+
+
+@lru_cache(maxsize=CONNECTION_CACHE)
+def _connection(port: str, node: str) -> bytes:
+    """Encode the connection of `port` to `node` as an `Instance.connections` field."""
+    target = _field(_TAG1, node.encode())
+    return _field(_TAG4, _field(_TAG1, port.encode()) + _field(_TAG2, target))
+
+
+def _signal(name: str) -> bytes:
+    """Encode scalar signal `name` as a `Module.signals` field."""
+    return _field(_TAG3, _field(_TAG1, name.encode()) + b"\x10\x01")
+
+
+def encoded_params(pairs: List[Tuple[str, str]]) -> List[bytes]:
+    """Encode `(name, value)` pairs as `Instance.parameters` fields."""
+    return [_param(name, value) for name, value in pairs]
+
+
+@dataclass
+class _SubcktInstance:
+    """An instance of a sub-circuit which has not (yet) been emitted, and whose ports are therefore unknown."""
+
+    name: str
+    nodes: List[str]
+    master: str
+    params: List[bytes]  # Encoded parameter fields
+
+
+@dataclass
+class _ModuleBuilder:
+    """A sub-circuit under construction"""
+
+    name: str
+    ports: List[str]
+    params: List[vlsir.Param]
+    # Instances, either encoded, or awaiting the definition of their sub-circuit
+    instances: List[Union[bytes, _SubcktInstance]] = field(default_factory=list)
+    # Ordered set of signal names
+    signals: Dict[str, None] = field(default_factory=dict)
+    # Signal names by lower-case name, for case-insensitive dialects. Each is spelled as it first appears.
+    spellings: Dict[str, str] = field(default_factory=dict)
+    literals: List[str] = field(default_factory=list)
+    # Port directions, e.g. from CDL `*.PININFO`
+    directions: Dict[str, int] = field(default_factory=dict)
+    # Keys of instantiated, not-yet-emitted sub-circuits
+    deps: Set[str] = field(default_factory=set)
+
+    def __post_init__(self):
+        for port in self.ports:
+            if port in self.signals:
+                raise ParseError(
+                    f"Duplicate port `{port}` in sub-circuit `{self.name}`"
+                )
+            self.signals[port] = None
+            self.spellings.setdefault(port.lower(), port)
+
+
+class Builder:
+    """# Module Builder
+
+    Accumulates the content of each sub-circuit, and emits it as a `vckt.Module` once it is complete,
+    and once every sub-circuit it instantiates has been emitted. Items are appended to `out`,
+    in an order in which each is defined before its first use.
+
+    Sub-circuits instantiated before their definition are held until it arrives.
+    Those never defined become `ExternalModule`s at `finish`, with ports named `p1`, `p2`, etc.
+    """
+
+    def __init__(self, opts: ParseOptions, case_insensitive: bool):
+        self.opts = opts
+        self.case_insensitive = case_insensitive
+        self.out: List[Item] = []  # Completed items, not yet taken by the parser
+
+        self.current: Optional[_ModuleBuilder] = None  # The sub-circuit being defined
+        self.top = _ModuleBuilder(name=opts.top, ports=[], params=[])
+        # Emitted sub-circuits and external sub-circuits, by key
+        self.emitted: Dict[str, _Master] = dict()
+        # Complete sub-circuits awaiting their dependencies
+        self.pending: List[_ModuleBuilder] = []
+        self.pending_keys: Set[str] = set()
+        # Connection-counts of not-yet-emitted sub-circuits
+        self.arity: Dict[str, int] = dict()
+        self.models: Dict[str, int] = dict()  # Declared model types, by key
+        # Model `ExternalModule`s and their masters, by key
+        self.ext_models: Dict[str, Tuple[vckt.ExternalModule, _Master]] = dict()
+        self.primitives: Dict[str, _Master] = dict()  # Primitive masters, by name
+
+    def key(self, name: str) -> str:
+        """Get the lookup-key for sub-circuit or model `name`."""
+        return name.lower() if self.case_insensitive else name
+
+    @property
+    def module(self) -> _ModuleBuilder:
+        """The module receiving new content: the current sub-circuit, or the top-level module."""
+        return self.current or self.top
+
+    def begin_module(
+        self, name: str, ports: List[str], pairs: List[Tuple[str, str]]
+    ) -> None:
+        if self.current is not None:
+            msg = (
+                f"Nested sub-circuit `{name}` in `{self.current.name}` is not supported"
+            )
+            raise ParseError(msg)
+        key = self.key(name)
+        if key in self.emitted or key in self.pending_keys:
+            raise ParseError(f"Duplicate definition of sub-circuit `{name}`")
+        module = _ModuleBuilder(name=name, ports=ports, params=params(pairs))
+        if self.case_insensitive and len(module.spellings) != len(ports):
+            raise ParseError(f"Duplicate port in sub-circuit `{name}`")
+        self.current = module
+
+    def end_module(self) -> None:
+        if self.current is None:
+            raise ParseError("End of sub-circuit outside of any sub-circuit")
+        module, self.current = self.current, None
+        self.complete(module)
+
+    def add_params(self, pairs: List[Tuple[str, str]]) -> None:
+        """Add parameter declarations to the current module."""
+        self.module.params.extend(params(pairs))
+
+    def add_literal(self, text: str) -> None:
+        """Add literal content to the current sub-circuit. Ignored at the top level."""
+        if self.current is not None:
+            self.current.literals.append(text)
+
+    def set_directions(self, directions: Dict[str, int]) -> None:
+        """Set port directions of the current sub-circuit."""
+        if self.current is not None:
+            if self.case_insensitive:
+                spellings = self.current.spellings
+                directions = {
+                    spellings.get(k.lower(), k): v for k, v in directions.items()
+                }
+            self.current.directions.update(directions)
+
+    def declare_model(self, name: str, mtype: str) -> None:
+        """Declare model `name`, of model-type `mtype`. Unsupported types are ignored."""
+        spicetype = model_spicetype(mtype)
+        if spicetype is not None:
+            self.models[self.key(name)] = spicetype
+
+    def is_model(self, name: str) -> bool:
+        return self.key(name) in self.models
+
+    def add_nodes(self, nodes: List[str]) -> List[str]:
+        """Add `nodes` to the signals of the current module, and return their names.
+        In case-insensitive dialects, each node takes the spelling with which it first appeared, e.g. as a port."""
+        module = self.module
+        if self.case_insensitive:
+            spellings = module.spellings
+            nodes = [spellings.setdefault(node.lower(), node) for node in nodes]
+        module.signals.update(dict.fromkeys(nodes))
+        return nodes
+
+    def add_subckt_instance(
+        self, name: str, nodes: List[str], master: str, pairs: List[Tuple[str, str]]
+    ) -> None:
+        """Add an instance of sub-circuit `master`, which may be defined later, or never."""
+        module = self.module
+        nodes = self.add_nodes(nodes)
+        key = self.key(master)
+        emitted = self.emitted.get(key, None)
+        if emitted is not None:
+            inst = _instance(name, emitted, master, nodes, encoded_params(pairs))
+            module.instances.append(inst)
+            return
+        arity = self.arity.setdefault(key, len(nodes))
+        if arity != len(nodes):
+            msg = f"Inconsistent connections to undefined sub-circuit `{master}`: {len(nodes)} vs {arity}"
+            raise ParseError(msg)
+        inst = _SubcktInstance(name, nodes, master, encoded_params(pairs))
+        module.instances.append(inst)
+        module.deps.add(key)
+
+    def add_model_instance(
+        self,
+        name: str,
+        nodes: List[str],
+        model: str,
+        spicetype: int,
+        pairs: List[Tuple[str, str]],
+    ) -> None:
+        """Add an instance of device-model `model`, of type `spicetype`."""
+        module = self.module
+        nodes = self.add_nodes(nodes)
+        _, master = self.model_module(model, spicetype, len(nodes))
+        inst = _instance(name, master, model, nodes, encoded_params(pairs))
+        module.instances.append(inst)
+
+    def add_primitive_instance(
+        self, name: str, nodes: List[str], primitive: str, pairs: List[Tuple[str, str]]
+    ) -> None:
+        """Add an instance of `vlsir.primitives` element `primitive`."""
+        module = self.module
+        nodes = self.add_nodes(nodes)
+        master = self.primitives.get(primitive, None)
+        if master is None:
+            from .. import primitives
+
+            emod = primitives.dct[primitive]
+            ref = vlsir.Reference(external=emod.name)
+            master = _master(ref, [p.signal for p in emod.ports])
+            self.primitives[primitive] = master
+        inst = _instance(name, master, primitive, nodes, encoded_params(pairs))
+        module.instances.append(inst)
+
+    def model_module(
+        self, model: str, spicetype: int, num_ports: int
+    ) -> Tuple[vckt.ExternalModule, _Master]:
+        """Get the `ExternalModule` for `model` and its master, creating and emitting it on first use."""
+        key = self.key(model)
+        cached = self.ext_models.get(key, None)
+        if cached is not None:
+            return cached
+        spicetype = self.models.get(key, spicetype)
+        ports = _MODEL_PORTS[spicetype]
+        if num_ports > len(ports):
+            msg = f"Invalid {num_ports}-terminal instance of {vckt.SpiceType.Name(spicetype)} model `{model}`"
+            raise ParseError(msg)
+        ports = ports[:num_ports]
+        emod = vckt.ExternalModule(
+            name=vlsir.QualifiedName(domain=self.opts.domain, name=model),
+            ports=[vckt.Port(signal=p, direction="NONE") for p in ports],
+            signals=[vckt.Signal(name=p, width=1) for p in ports],
+            spicetype=spicetype,
+        )
+        cached = emod, _master(vlsir.Reference(external=emod.name), ports)
+        self.ext_models[key] = cached
+        self.out.append(emod)
+        return cached
+
+    def complete(self, module: _ModuleBuilder) -> None:
+        """Complete `module`, emitting it if all of its sub-circuits have been emitted, and holding it otherwise."""
+        module.deps = {k for k in module.deps if k not in self.emitted}
+        if module.deps:
+            self.pending.append(module)
+            self.pending_keys.add(self.key(module.name))
+            return
+        self.emit(module)
+        self.release()
+
+    def release(self) -> None:
+        """Emit each pending module whose dependencies have all been emitted."""
+        progress = bool(self.pending)
+        while progress:
+            progress = False
+            for module in list(self.pending):
+                if all(k in self.emitted for k in module.deps):
+                    self.pending.remove(module)
+                    self.pending_keys.discard(self.key(module.name))
+                    self.emit(module)
+                    progress = True
+
+    def emit(self, module: _ModuleBuilder) -> None:
+        """Convert `module` to a `vckt.Module`, and emit it."""
+        unknown = set(module.directions) - set(module.ports)
+        if unknown:
+            msg = f"Port directions for non-ports {sorted(unknown)} of `{module.name}`"
+            raise ParseError(msg)
+        # Encode everything but the signals and instances via the protobuf API
+        head = vckt.Module(
+            name=module.name,
+            ports=[
+                vckt.Port(signal=p, direction=module.directions.get(p, "NONE"))
+                for p in module.ports
+            ],
+            parameters=module.params,
+            literals=module.literals,
+        )
+        parts = [head.SerializeToString()]
+        parts.extend(map(_signal, module.signals))
+        for inst in module.instances:
+            if isinstance(inst, _SubcktInstance):
+                master = self.emitted[self.key(inst.master)]
+                inst = _instance(
+                    inst.name, master, inst.master, inst.nodes, inst.params
+                )
+            parts.append(inst)
+        pmodule = vckt.Module.FromString(b"".join(parts))
+
+        ref = vlsir.Reference(local=module.name)
+        self.emitted[self.key(module.name)] = _master(ref, module.ports)
+        self.out.append(pmodule)
+
+    def finish(self) -> None:
+        """Complete parsing. Create `ExternalModule`s for undefined sub-circuits,
+        and emit all remaining modules, including the top-level module if it has any content.
+        """
+        if self.current is not None:
+            raise ParseError(f"Unterminated sub-circuit `{self.current.name}`")
+
+        for module in self.pending + [self.top]:
+            for inst in module.instances:
+                if not isinstance(inst, _SubcktInstance):
+                    continue
+                key = self.key(inst.master)
+                if key in self.emitted or key in self.pending_keys:
+                    continue
+                if key in self.models:
+                    # Spectre model, declared after its first instance
+                    spicetype, num_ports = self.models[key], self.arity[key]
+                    _, master = self.model_module(inst.master, spicetype, num_ports)
+                else:
+                    ports = [f"p{idx}" for idx in range(1, self.arity[key] + 1)]
+                    emod = vckt.ExternalModule(
+                        name=vlsir.QualifiedName(
+                            domain=self.opts.domain, name=inst.master
+                        ),
+                        ports=[vckt.Port(signal=p, direction="NONE") for p in ports],
+                        signals=[vckt.Signal(name=p, width=1) for p in ports],
+                        spicetype=vckt.SpiceType.SUBCKT,
+                    )
+                    self.out.append(emod)
+                    master = _master(vlsir.Reference(external=emod.name), ports)
+                self.emitted[key] = master
+
+        self.release()
+        if self.pending:
+            names = [m.name for m in self.pending]
+            raise ParseError(f"Recursive sub-circuit definitions among {names}")
+        if self.top.instances or self.top.params:
+            if self.key(self.top.name) in self.emitted:
+                msg = f"Top-level module name `{self.top.name}` conflicts with a sub-circuit. Set `ParseOptions.top`."
+                raise ParseError(msg)
+            self.complete(self.top)
+
+
+def _instance(
+    name: str, master: _Master, master_name: str, nodes: List[str], params: List[bytes]
+) -> bytes:
+    """Encode an instance named `name` of `master`, as a `Module.instances` field.
+    Connects the master's ports to `nodes` in order."""
+    ref, ports = master
+    if len(ports) != len(nodes):
+        msg = f"Instance `{name}` of `{master_name}` has {len(nodes)} connections, for {len(ports)} ports"
+        raise ParseError(msg)
+    parts = [_field(_TAG1, name.encode()), ref]
+    parts.extend(params)
+    parts.extend(map(_connection, ports, nodes))
+    return _field(_TAG4, b"".join(parts))
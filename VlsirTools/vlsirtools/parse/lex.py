@@ -0,0 +1,135 @@
+"""
+# Netlist Lexing
+
+Splits netlist text into logical lines, joining continuations and removing comments,
+and logical lines into tokens, via a single compiled regular expression.
+"""
+
+# Std-Lib Imports
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+
+class ParseError(Exception):
+    """Error parsing a netlist, annotated with its line number."""
+
+    def __init__(self, msg: str, line: int = 0):
+        super().__init__(f"Line {line}: {msg}" if line else msg)
+        self.line = line
+
+
+# Netlist tokens: quoted strings, brace-expressions, parentheses, equals-signs, and whitespace-separated words
+_TOKEN = re.compile(r"""'[^']*'|"[^"]*"|\{[^}]*\}|[()=]|[^\s()='"{}]+""")
+
+# Inline SPICE comments: `$` (other than CDL `$[model]` annotations) and `;`, each preceded by whitespace
+_SPICE_INLINE_COMMENT = re.compile(r"\s(?:\$(?!\[)|;).*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split logical line `text` into tokens."""
+    return _TOKEN.findall(text)
+
+
+def split_params(tokens: List[str]) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """Split `tokens` into positional tokens, and `name=value` parameter pairs.
+    Parenthesized values, e.g. Spectre's `w=(2*wp)`, are joined into a single value."""
+    if "=" not in tokens:
+        return list(tokens), []
+    positional: List[str] = []
+    params: List[Tuple[str, str]] = []
+    idx, num = 0, len(tokens)
+    while idx < num:
+        tok = tokens[idx]
+        if idx + 1 < num and tokens[idx + 1] == "=":
+            start = idx + 2
+            if start >= num:
+                raise ParseError(f"Missing value for parameter `{tok}`")
+            stop = start + 1
+            if tokens[start] == "(":
+                depth = 1
+                while stop < num and depth:
+                    depth += {"(": 1, ")": -1}.get(tokens[stop], 0)
+                    stop += 1
+                if depth:
+                    raise ParseError(f"Unbalanced parentheses in parameter `{tok}`")
+            params.append((tok, "".join(tokens[start:stop])))
+            idx = stop
+        else:
+            positional.append(tok)
+            idx += 1
+    return positional, params
+
+
+class Lexer:
+    """# Logical-Line Lexer
+
+    Iterates over the logical lines of physical lines `src`, as `(line_number, text)` tuples.
+    Lines continue with a leading `+`, and in Spectre, also with a trailing backslash.
+    Comment lines and inline comments are removed, other than CDL `*.PININFO` lines if `pininfo` is set.
+
+    The language may be switched between logical lines, e.g. by a Spectre `simulator lang=spice` statement,
+    by setting `spectre`. Each physical line is interpreted in the language in effect when it is reached.
+    """
+
+    def __init__(self, src: Iterable[str], spectre: bool, pininfo: bool = False):
+        self.src = src
+        self.spectre = spectre
+        self.pininfo = pininfo
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        parts: List[str] = []  # Parts of the current logical line
+        start = 0  # Line number of its first part
+        continued = (
+            False  # Whether its last part ended in a Spectre backslash-continuation
+        )
+
+        for num, line in enumerate(self.src, 1):
+            spectre = self.spectre
+            text = self.text(line, spectre)
+            if not text:
+                continue
+            if parts and (continued or text[0] == "+"):
+                text = text[1:] if text[0] == "+" else text
+                continued = spectre and text.endswith("\\")
+                parts.append(text[:-1] if continued else text)
+                continue
+            if parts:
+                # The current logical line is complete.
+                # The parser may switch languages here, in which case `line` is re-interpreted.
+                yield start, " ".join(parts)
+                if self.spectre != spectre:
+                    spectre = self.spectre
+                    text = self.text(line, spectre)
+                    if not text:
+                        parts = []
+                        continue
+            text = text.lstrip("+")
+            start, continued = num, spectre and text.endswith("\\")
+            parts = [text[:-1] if continued else text]
+
+        if parts:
+            yield start, " ".join(parts)
+
+    def text(self, line: str, spectre: bool) -> str:
+        """Get the content of physical `line`, without comments. Empty for comment lines."""
+        line = line.strip()
+        if not line:
+            return line
+        if spectre:
+            if line[0] == "*" or line.startswith("//"):
+                return ""
+            if "//" in line:
+                line = line[: line.index("//")].rstrip()
+            return line
+        first = line[0]
+        if first == "*":
+            if self.pininfo and line[:9].upper() == "*.PININFO":
+                return line
+            return ""
+        if first == "$" and line[:2] != "$[":
+            return ""
+        if first == ";":  # Xyce-style comment lines
+            return ""
+        if "$" in line or ";" in line:
+            line = _SPICE_INLINE_COMMENT.sub("", line)
+        return line
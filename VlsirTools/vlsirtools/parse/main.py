@@ -0,0 +1,125 @@
+"""
+# Netlist Parsing
+## The main `parse` function(s).
+"""
+
+# Std-Lib Imports
+import os
+from contextlib import nullcontext
+from typing import IO, Iterator, Optional, Union
+
+# Local Imports
+import vlsir.circuit_pb2 as vckt
+from ..netlist.fmt import NetlistFormat, NetlistFormatSpec
+from ..netlist.compress import Compression
+from .lex import Lexer, ParseError, tokenize
+from .base import Builder, Item, ParseOptions
+from .spice import SpiceParser
+from .spectre import SpectreParser
+
+# Sources: paths, or text file-like objects
+Source = Union[str, os.PathLike, IO[str]]
+
+
+def parse(
+    src: Source,
+    fmt: NetlistFormatSpec = "spice",
+    opts: Optional[ParseOptions] = None,
+) -> vckt.Package:
+    """Parse netlist `src`, in format `fmt`, into a `vlsir.circuit.Package`.
+
+    Source `src` may be a path, including gzip, zstd, or xz compressed paths, or a text file-like object.
+    Format-specifier `fmt` may be `spectre`, `cdl`, or any of the SPICE dialects, in enum or string terms.
+    Sub-circuits become `Module`s. Models, and sub-circuits which are instantiated but not defined,
+    become `ExternalModule`s. Any top-level instances are collected into the module named `opts.top`.
+    Includes are not followed.
+    """
+    opts = opts or ParseOptions()
+    pkg = vckt.Package(domain=opts.domain)
+    for item in iter_parse(src, fmt, opts):
+        if isinstance(item, vckt.Module):
+            pkg.modules.append(item)
+        else:
+            pkg.ext_modules.append(item)
+    return pkg
+
+
+def iter_parse(
+    src: Source,
+    fmt: NetlistFormatSpec = "spice",
+    opts: Optional[ParseOptions] = None,
+) -> Iterator[Item]:
+    """Iterate over the `Module`s and `ExternalModule`s of netlist `src`, as each is completed.
+    Each is yielded before any module which instantiates it.
+    Memory use is bounded by the largest sub-circuit, rather than the size of `src`,
+    except for sub-circuits instantiated before they are defined, which are held until they are.
+    """
+    fmt = NetlistFormat.get(fmt)
+    if fmt == NetlistFormat.VERILOG:
+        raise ValueError("Verilog parsing is not supported")
+    opts = opts or ParseOptions()
+    spectre = fmt == NetlistFormat.SPECTRE
+    cdl = fmt == NetlistFormat.CDL
+    title = opts.title if not (spectre or cdl) else False
+
+    builder = Builder(opts, case_insensitive=not spectre)
+    spice_parser = SpiceParser(builder, cdl=cdl)
+    spectre_parser = SpectreParser(builder)
+
+    with _open(src) as f:
+        lexer = Lexer(f, spectre=spectre, pininfo=cdl)
+        for num, text in lexer:
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            if num == 1 and title is not False:
+                if title or tokens[0][0] != ".":
+                    continue  # SPICE title line
+            try:
+                if tokens[0].lower() == "simulator":
+                    lexer.spectre = _simulator_lang(tokens)
+                elif lexer.spectre:
+                    spectre_parser.statement(tokens, text)
+                else:
+                    spice_parser.statement(tokens, text)
+            except ParseError as e:
+                raise ParseError(str(e), num) from None
+            if builder.out:
+                yield from builder.out
+                builder.out.clear()
+
+    builder.finish()
+    yield from builder.out
+    builder.out.clear()
+
+
+def _simulator_lang(tokens) -> bool:
+    """Parse a `simulator lang=...` statement. Returns whether the new language is Spectre."""
+    lang = None
+    for idx, tok in enumerate(tokens[:-2]):
+        if tok.lower() == "lang" and tokens[idx + 1] == "=":
+            lang = tokens[idx + 2].lower()
+    if lang not in ("spice", "spectre"):
+        raise ParseError(f"Unsupported simulator language {lang}")
+    return lang == "spectre"
+
+
+def _open(src: Source):
+    """Open `src` for reading, if it is a path, decompressing it per its suffix."""
+    if not isinstance(src, (str, os.PathLike)):
+        return nullcontext(src)
+    comp = Compression.from_path(src)
+    if comp == Compression.GZIP:
+        import gzip
+
+        return gzip.open(src, "rt")
+    if comp == Compression.XZ:
+        import lzma
+
+        return lzma.open(src, "rt")
+    if comp == Compression.ZSTD:
+        import io
+        import zstandard
+
+        return io.TextIOWrapper(zstandard.open(src, "rb"))
+    return open(src, "r")
@@ -0,0 +1,94 @@
+"""
+# Spectre Parsing
+
+Parses Spectre-language netlists into the `Builder`.
+Instances must list their terminals in parentheses, e.g. `r1 (a b) resistor r=1k`.
+"""
+
+# Std-Lib Imports
+from typing import Dict, List, Tuple
+
+# Local Imports
+from .lex import ParseError, split_params
+from .base import Builder
+
+# Spectre primitive masters: their `vlsir.primitives` element, and parameter renames
+_PRIMITIVES: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "resistor": ("resistor", {}),
+    "capacitor": ("capacitor", {}),
+    "inductor": ("inductor", {}),
+    "vsource": ("vdc", {"mag": "ac"}),
+    "isource": ("isource", {}),
+    "vcvs": ("vcvs", {}),
+    "vccs": ("vccs", {"gm": "gain"}),
+}
+
+
+class SpectreParser:
+    """# Spectre Statement Parser"""
+
+    def __init__(self, builder: Builder):
+        self.builder = builder
+
+    def statement(self, tokens: List[str], text: str) -> None:
+        """Parse a statement, comprising `tokens` and original `text`."""
+        kw = tokens[0]
+        if kw == "inline" and len(tokens) > 1 and tokens[1] == "subckt":
+            tokens, kw = tokens[1:], "subckt"
+        if kw == "subckt":
+            if len(tokens) < 2:
+                raise ParseError("Missing sub-circuit name")
+            ports = [t for t in tokens[2:] if t not in ("(", ")")]
+            return self.builder.begin_module(tokens[1], ports, [])
+        if kw == "ends":
+            return self.builder.end_module()
+        if kw == "parameters":
+            _, pairs = split_params(tokens[1:])
+            return self.builder.add_params(pairs)
+        if kw == "model":
+            if len(tokens) < 3:
+                raise ParseError("Invalid `model`")
+            return self.builder.declare_model(tokens[1], tokens[2])
+        if len(tokens) > 2 and tokens[1] == "(":
+            return self.instance(tokens)
+        # Everything else, e.g. `include` and analyses, is kept verbatim within sub-circuits
+        return self.builder.add_literal(text)
+
+    def instance(self, tokens: List[str]) -> None:
+        """Parse an instance, `name (n1 n2 ...) master params`"""
+        name = tokens[0]
+        try:
+            close = tokens.index(")")
+        except ValueError:
+            raise ParseError(f"Unterminated connections for instance `{name}`")
+        nodes = tokens[2:close]
+        positional, pairs = split_params(tokens[close + 1 :])
+        if len(positional) != 1:
+            raise ParseError(f"Invalid instance `{name}`")
+        master = positional[0]
+
+        if master in _PRIMITIVES:
+            primitive, renames = _PRIMITIVES[master]
+            if master == "vsource":
+                pairs = self.dc_source(name, pairs)
+            pairs = [(renames.get(k, k), v) for k, v in pairs]
+            return self.builder.add_primitive_instance(name, nodes, primitive, pairs)
+        if self.builder.is_model(master):
+            spicetype = self.builder.models[self.builder.key(master)]
+            return self.builder.add_model_instance(
+                name, nodes, master, spicetype, pairs
+            )
+        return self.builder.add_subckt_instance(name, nodes, master, pairs)
+
+    @staticmethod
+    def dc_source(name: str, pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Check that `vsource` `name` is a DC source, and remove its `type` parameter."""
+        out = []
+        for key, val in pairs:
+            if key == "type":
+                if val != "dc":
+                    msg = f"Unsupported `{val}` source `{name}`. Only DC sources are supported."
+                    raise ParseError(msg)
+                continue
+            out.append((key, val))
+        return out
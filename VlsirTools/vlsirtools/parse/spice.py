@@ -0,0 +1,249 @@
+"""
+# SPICE Parsing
+
+Parses SPICE-family netlists, including CDL, into the `Builder`.
+Elements are dispatched by their instance-name prefix, e.g. `X` for sub-circuits and `M` for MOS devices,
+which map to `SpiceType`s as in `vlsirtools.spicetype`.
+"""
+
+# Std-Lib Imports
+import re
+from typing import List, Tuple
+
+# Local Imports
+import vlsir.circuit_pb2 as vckt
+from ..spicetype import SpiceType
+from .lex import ParseError, split_params
+from .base import Builder
+
+# Port directions of CDL `*.PININFO` annotations
+_DIRECTIONS = {"I": "INPUT", "O": "OUTPUT", "B": "INOUT"}
+
+# Plain identifiers, e.g. model names. Excludes expressions such as `wp*2`.
+_IDENTIFIER = re.compile(r"[A-Za-z_][\w.]*")
+
+
+def is_value(tok: str) -> bool:
+    """Boolean indication of whether positional token `tok` is a value (e.g. `1k`, `'2*w'`), rather than a name."""
+    return tok[0] in "0123456789.-+'{"
+
+
+class SpiceParser:
+    """# SPICE Statement Parser
+
+    Parses logical SPICE statements into `builder`.
+    If `cdl` is set, also handles CDL's `*.PININFO` port directions,
+    `$[model]` device models, and the `/` separating sub-circuit instance connections from their master.
+    """
+
+    def __init__(self, builder: Builder, cdl: bool = False):
+        self.builder = builder
+        self.cdl = cdl
+        # Element handlers, by instance-name prefix
+        self.elements = {
+            SpiceType.SUBCKT.value.upper(): self.subckt_instance,
+            SpiceType.MOS.value.upper(): self.mos,
+            SpiceType.DIODE.value.upper(): self.diode,
+            SpiceType.BIPOLAR.value.upper(): self.bipolar,
+            SpiceType.RESISTOR.value.upper(): self.resistor,
+            SpiceType.CAPACITOR.value.upper(): self.capacitor,
+            SpiceType.INDUCTOR.value.upper(): self.inductor,
+            SpiceType.VSOURCE.value.upper(): self.vsource,
+            SpiceType.ISOURCE.value.upper(): self.isource,
+            SpiceType.VCVS.value.upper(): self.vcvs,
+            SpiceType.VCCS.value.upper(): self.vccs,
+        }
+
+    def statement(self, tokens: List[str], text: str) -> None:
+        """Parse a statement, comprising `tokens` and original `text`."""
+        first = tokens[0]
+        if first[0] == ".":
+            return self.directive(first[1:].lower(), tokens, text)
+        if first[0] == "*":
+            return self.pininfo(tokens)
+        handler = self.elements.get(first[0].upper(), None)
+        if handler is None:
+            raise ParseError(f"Unsupported element `{first}`")
+        positional, pairs = split_params(tokens[1:])
+        return handler(first, positional, pairs)
+
+    def directive(self, name: str, tokens: List[str], text: str) -> None:
+        """Parse a dot-directive, e.g. `.subckt`"""
+        if name == "subckt":
+            positional, pairs = split_params(tokens[1:])
+            positional = [t for t in positional if t.lower() != "params:"]
+            if not positional:
+                raise ParseError("Missing sub-circuit name")
+            return self.builder.begin_module(positional[0], positional[1:], pairs)
+        if name == "ends":
+            return self.builder.end_module()
+        if name == "model":
+            if len(tokens) < 3:
+                raise ParseError("Invalid `.model`")
+            return self.builder.declare_model(tokens[1], tokens[2])
+        if name == "param" and self.builder.current is None:
+            _, pairs = split_params(tokens[1:])
+            return self.builder.add_params(pairs)
+        if name == "end":
+            return None
+        # Everything else, e.g. `.include` and `.option`, is kept verbatim within sub-circuits
+        return self.builder.add_literal(text)
+
+    def pininfo(self, tokens: List[str]) -> None:
+        """Parse a CDL `*.PININFO` annotation, e.g. `*.PININFO a:I b:O c:B`"""
+        directions = dict()
+        for tok in tokens[1:]:
+            name, _, direction = tok.rpartition(":")
+            if not name or direction.upper() not in _DIRECTIONS:
+                raise ParseError(f"Invalid `*.PININFO` entry `{tok}`")
+            directions[name] = _DIRECTIONS[direction.upper()]
+        self.builder.set_directions(directions)
+
+    def subckt_instance(
+        self, name: str, positional: List[str], pairs: List[Tuple[str, str]]
+    ) -> None:
+        """Sub-circuit instances: `X1 n1 n2 ... master params`"""
+        # Drop CDL's `/` separator, and the `PARAMS:` keyword of HSPICE and Xyce
+        positional = [t for t in positional if t.lower() != "params:"]
+        if self.cdl:
+            positional = [t for t in positional if t != "/"]
+        if not positional:
+            raise ParseError(f"Missing sub-circuit name for instance `{name}`")
+        self.builder.add_subckt_instance(name, positional[:-1], positional[-1], pairs)
+
+    def mos(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """MOS devices: `M1 d g s b model params`"""
+        if len(positional) < 4:
+            raise ParseError(f"Invalid MOS element `{name}`: too few connections")
+        return self.model_element(name, positional, pairs, vckt.SpiceType.MOS)
+
+    def diode(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Diodes: `D1 p n model [area] params`"""
+        return self.model_element(name, positional, pairs, vckt.SpiceType.DIODE)
+
+    def bipolar(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Bipolar transistors: `Q1 c b e [s] model [area] params`"""
+        return self.model_element(name, positional, pairs, vckt.SpiceType.BIPOLAR)
+
+    def model_element(
+        self,
+        name: str,
+        positional: List[str],
+        pairs: List[Tuple[str, str]],
+        spicetype: int,
+    ) -> None:
+        """Model-based elements: nodes, followed by a model name, and an optional positional area."""
+        if spicetype != vckt.SpiceType.MOS and positional and is_value(positional[-1]):
+            pairs = [("area", positional[-1])] + pairs
+            positional = positional[:-1]
+        if len(positional) < 2:
+            raise ParseError(f"Invalid element `{name}`")
+        model = positional[-1]
+        if self.cdl and model.startswith("$["):
+            model = model[2:-1]
+        self.builder.add_model_instance(name, positional[:-1], model, spicetype, pairs)
+
+    def resistor(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Resistors: `R1 p n [model] [value] params`"""
+        return self.passive(name, positional, pairs, "resistor", "r")
+
+    def capacitor(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Capacitors: `C1 p n [model] [value] params`"""
+        return self.passive(name, positional, pairs, "capacitor", "c")
+
+    def inductor(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Inductors: `L1 p n [model] [value] params`"""
+        return self.passive(name, positional, pairs, "inductor", "l")
+
+    def passive(
+        self,
+        name: str,
+        positional: List[str],
+        pairs: List[Tuple[str, str]],
+        primitive: str,
+        key: str,
+    ) -> None:
+        """Two-terminal passives, either `vlsir.primitives` or model-based.
+        Tokens are models if declared by `.model`, or if plain identifiers. Others, e.g. `wp*2`, are values."""
+        if len(positional) < 2:
+            raise ParseError(f"Invalid element `{name}`")
+        nodes, model, value = positional[:2], None, None
+        for tok in positional[2:]:
+            if tok.startswith("$["):  # CDL model annotation
+                model = tok[2:-1]
+            elif model is None and (
+                self.builder.is_model(tok) or _IDENTIFIER.fullmatch(tok)
+            ):
+                model = tok
+            elif value is None:
+                value = tok
+            else:
+                raise ParseError(f"Invalid element `{name}`")
+        if value is not None:
+            pairs = [(key, value)] + pairs
+        if model is None:
+            return self.builder.add_primitive_instance(name, nodes, primitive, pairs)
+        spicetype = vckt.SpiceType.Value(primitive.upper())
+        return self.builder.add_model_instance(name, nodes, model, spicetype, pairs)
+
+    def vsource(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """DC voltage sources: `V1 p n [dc] value [ac mag]`"""
+        return self.source(name, positional, pairs, "vdc", ("dc", "ac"))
+
+    def isource(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """DC current sources: `I1 p n [dc] value`"""
+        return self.source(name, positional, pairs, "isource", ("dc",))
+
+    def source(
+        self,
+        name: str,
+        positional: List[str],
+        pairs: List[Tuple[str, str]],
+        primitive: str,
+        keys: Tuple[str, ...],
+    ) -> None:
+        """Independent sources. Only DC (and AC magnitude) values are supported."""
+        if len(positional) < 2:
+            raise ParseError(f"Invalid source `{name}`")
+        values = dict()
+        rest = positional[2:]
+        idx = 0
+        while idx < len(rest):
+            tok = rest[idx]
+            if tok.lower() in keys and idx + 1 < len(rest):
+                values[tok.lower()] = rest[idx + 1]
+                idx += 2
+            elif is_value(tok) and "dc" not in values:
+                values["dc"] = tok
+                idx += 1
+            else:
+                msg = f"Unsupported source specification `{tok}` for `{name}`. Only DC sources are supported."
+                raise ParseError(msg)
+        pairs = list(values.items()) + pairs
+        return self.builder.add_primitive_instance(
+            name, positional[:2], primitive, pairs
+        )
+
+    def vcvs(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Voltage-controlled voltage sources: `E1 p n cp cn gain`"""
+        return self.controlled(name, positional, pairs, "vcvs")
+
+    def vccs(self, name: str, positional: List[str], pairs: List[Tuple[str, str]]):
+        """Voltage-controlled current sources: `G1 p n cp cn gain`"""
+        return self.controlled(name, positional, pairs, "vccs")
+
+    def controlled(
+        self,
+        name: str,
+        positional: List[str],
+        pairs: List[Tuple[str, str]],
+        primitive: str,
+    ) -> None:
+        """Linear voltage-controlled sources"""
+        if len(positional) != 5 or not is_value(positional[4]):
+            msg = f"Unsupported controlled source `{name}`. Only linear gains are supported."
+            raise ParseError(msg)
+        pairs = [("gain", positional[4])] + pairs
+        return self.builder.add_primitive_instance(
+            name, positional[:4], primitive, pairs
+        )
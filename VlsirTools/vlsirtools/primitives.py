@@ -5,6 +5,7 @@ Defines the `vlsir.circuit.Package`-worth of the primitive elements
 """
 
 from typing import List, Sequence, Optional, Dict
+from functools import lru_cache
 from textwrap import dedent
 
 from vlsir.utils_pb2 import QualifiedName, Param, ParamValue
@@ -65,290 +66,313 @@ Each `vlsir.primitive` also accepts arbitrary "pass-through" parameters, which a
 These parameters will generally be used, for instance, to specify `mos` devices across the wide variety of SPICE-supported models. 
 """
 
-package = Package(
-    domain=domain,
-    desc=desc,
-    modules=[],  # Empty: no hierarchical/ internally-defined modules
-    ext_modules=[  # Primitives are all `ExternalModule`s
-        ExternalModule(
-            name=_qname("resistor"),
-            desc=dedent(
-                """
-                # Ideal Resistor
-
-                Ports: (p, n) 
-                Params: `r`, resistance (in Ohms)
-
-                Primitive ideal resistor. 
-                Largely corresponds to the "R-prefix" element of Spice-class simulators. 
+
+@lru_cache(maxsize=None)
+def _package() -> Package:
+    """Create the primitives `Package`.
+    Built on first access to `package` (or any of its modules), rather than at import time."""
+    return Package(
+        domain=domain,
+        desc=desc,
+        modules=[],  # Empty: no hierarchical/ internally-defined modules
+        ext_modules=[  # Primitives are all `ExternalModule`s
+            ExternalModule(
+                name=_qname("resistor"),
+                desc=dedent(
+                    """
+                    # Ideal Resistor
+
+                    Ports: (p, n) 
+                    Params: `r`, resistance (in Ohms)
+
+                    Primitive ideal resistor. 
+                    Largely corresponds to the "R-prefix" element of Spice-class simulators. 
                 
-                Additional parameters such as temperature coefficients are allowed, and are to be passed unmodified to netlist formats. 
-                """
+                    Additional parameters such as temperature coefficients are allowed, and are to be passed unmodified to netlist formats. 
+                    """
+                ),
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="r", desc="Resistance (Ohms)"),
+                ],
+                spicetype=SpiceType.RESISTOR,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="r", desc="Resistance (Ohms)"),
-            ],
-            spicetype=SpiceType.RESISTOR,
-        ),
-        ExternalModule(
-            name=_qname("capacitor"),
-            desc=dedent(
-                """
-                # Ideal Capacitor
+            ExternalModule(
+                name=_qname("capacitor"),
+                desc=dedent(
+                    """
+                    # Ideal Capacitor
 
-                Ports: (p, n) 
-                Params: `c`, capacitance (in Farads)
+                    Ports: (p, n) 
+                    Params: `c`, capacitance (in Farads)
 
-                Primitive ideal capacitor. 
-                Largely corresponds to the "C-prefix" element of Spice-class simulators. 
+                    Primitive ideal capacitor. 
+                    Largely corresponds to the "C-prefix" element of Spice-class simulators. 
                 
-                Additional parameters are allowed, and are to be passed unmodified to netlist formats. 
-                """
+                    Additional parameters are allowed, and are to be passed unmodified to netlist formats. 
+                    """
+                ),
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="c", desc="Capacitance (Farads)"),
+                ],
+                spicetype=SpiceType.CAPACITOR,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="c", desc="Capacitance (Farads)"),
-            ],
-            spicetype=SpiceType.CAPACITOR,
-        ),
-        ExternalModule(
-            name=_qname("inductor"),
-            desc=dedent(
-                """
-                # Ideal Inductor
+            ExternalModule(
+                name=_qname("inductor"),
+                desc=dedent(
+                    """
+                    # Ideal Inductor
 
-                Ports: (p, n) 
-                Params: `l`, inductance (in Henries)
+                    Ports: (p, n) 
+                    Params: `l`, inductance (in Henries)
 
-                Primitive ideal inductor. 
-                Largely corresponds to the "L-prefix" element of Spice-class simulators. 
+                    Primitive ideal inductor. 
+                    Largely corresponds to the "L-prefix" element of Spice-class simulators. 
                 
-                Additional parameters are allowed, and are to be passed unmodified to netlist formats. 
-                """
+                    Additional parameters are allowed, and are to be passed unmodified to netlist formats. 
+                    """
+                ),
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="l", desc="Inductance (Henries)"),
+                ],
+                spicetype=SpiceType.INDUCTOR,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="l", desc="Inductance (Henries)"),
-            ],
-            spicetype=SpiceType.INDUCTOR,
-        ),
-        ExternalModule(
-            name=_qname("vcvs"),
-            desc=dedent(
-                """
-                # Voltage-Controlled Voltage Source
+            ExternalModule(
+                name=_qname("vcvs"),
+                desc=dedent(
+                    """
+                    # Voltage-Controlled Voltage Source
 
-                Ports: (p, n, ctrlp, ctrln) 
-                Params: `gain`, voltage gain (in Volts/Volt)
+                    Ports: (p, n, ctrlp, ctrln) 
+                    Params: `gain`, voltage gain (in Volts/Volt)
 
-                Largely corresponds to the "e-prefix" element of Spice-class simulators. 
-                """
+                    Largely corresponds to the "e-prefix" element of Spice-class simulators. 
+                    """
+                ),
+                ports=_ports(("p", "n", "cp", "cn")),
+                signals=_signals(("p", "n", "cp", "cn")),
+                parameters=[
+                    Param(name="gain", desc="Voltage Gain (Volts/Volt)"),
+                ],
+                spicetype=SpiceType.VCVS,
             ),
-            ports=_ports(("p", "n", "cp", "cn")),
-            signals=_signals(("p", "n", "cp", "cn")),
-            parameters=[
-                Param(name="gain", desc="Voltage Gain (Volts/Volt)"),
-            ],
-            spicetype=SpiceType.VCVS,
-        ),
-        ExternalModule(
-            name=_qname("vccs"),
-            desc=dedent(
-                """
-                # Voltage-Controlled Current Source
+            ExternalModule(
+                name=_qname("vccs"),
+                desc=dedent(
+                    """
+                    # Voltage-Controlled Current Source
 
-                Ports: (p, n, ctrlp, ctrln) 
-                Params: `gain`, transconductance gain (in Amps/Volt)
+                    Ports: (p, n, ctrlp, ctrln) 
+                    Params: `gain`, transconductance gain (in Amps/Volt)
 
-                Largely corresponds to the "g-prefix" element of Spice-class simulators. 
-                """
+                    Largely corresponds to the "g-prefix" element of Spice-class simulators. 
+                    """
+                ),
+                ports=_ports(("p", "n", "cp", "cn")),
+                signals=_signals(("p", "n", "cp", "cn")),
+                parameters=[
+                    Param(name="gain", desc="Transconductance Gain (Amps/Volt)"),
+                ],
+                spicetype=SpiceType.VCCS,
             ),
-            ports=_ports(("p", "n", "cp", "cn")),
-            signals=_signals(("p", "n", "cp", "cn")),
-            parameters=[
-                Param(name="gain", desc="Transconductance Gain (Amps/Volt)"),
-            ],
-            spicetype=SpiceType.VCCS,
-        ),
-        ExternalModule(
-            name=_qname("cccs"),
-            desc=dedent(
-                """
-                # Current-Controlled Current Source
+            ExternalModule(
+                name=_qname("cccs"),
+                desc=dedent(
+                    """
+                    # Current-Controlled Current Source
 
-                Ports: (p, n, ctrlp, ctrln) 
-                Params: `gain`, current gain (in Amps/Amp)
+                    Ports: (p, n, ctrlp, ctrln) 
+                    Params: `gain`, current gain (in Amps/Amp)
 
-                Largely corresponds to the "f-prefix" element of Spice-class simulators. 
-                """
+                    Largely corresponds to the "f-prefix" element of Spice-class simulators. 
+                    """
+                ),
+                ports=_ports(("p", "n", "cp", "cn")),
+                signals=_signals(("p", "n", "cp", "cn")),
+                parameters=[
+                    Param(name="gain", desc="Current Gain (Amps/Amp)"),
+                ],
+                spicetype=SpiceType.CCCS,
             ),
-            ports=_ports(("p", "n", "cp", "cn")),
-            signals=_signals(("p", "n", "cp", "cn")),
-            parameters=[
-                Param(name="gain", desc="Current Gain (Amps/Amp)"),
-            ],
-            spicetype=SpiceType.CCCS,
-        ),
-        ExternalModule(
-            name=_qname("ccvs"),
-            desc=dedent(
-                """
-                # Current-Controlled Voltage Source
+            ExternalModule(
+                name=_qname("ccvs"),
+                desc=dedent(
+                    """
+                    # Current-Controlled Voltage Source
 
-                Ports: (p, n, ctrlp, ctrln) 
-                Params: `gain`, transresistance gain (in Volts/Amp)
+                    Ports: (p, n, ctrlp, ctrln) 
+                    Params: `gain`, transresistance gain (in Volts/Amp)
 
-                Largely corresponds to the "h-prefix" element of Spice-class simulators. 
-                """
+                    Largely corresponds to the "h-prefix" element of Spice-class simulators. 
+                    """
+                ),
+                ports=_ports(("p", "n", "cp", "cn")),
+                signals=_signals(("p", "n", "cp", "cn")),
+                parameters=[
+                    Param(name="gain", desc="Transresistance Gain (Volts/Amp)"),
+                ],
+                spicetype=SpiceType.CCVS,
             ),
-            ports=_ports(("p", "n", "cp", "cn")),
-            signals=_signals(("p", "n", "cp", "cn")),
-            parameters=[
-                Param(name="gain", desc="Transresistance Gain (Volts/Amp)"),
-            ],
-            spicetype=SpiceType.CCVS,
-        ),
-        ExternalModule(
-            name=_qname("isource"),
-            desc=dedent(
-                """
-                # Independent Current Source
-
-                Ports: (p, n) 
-                Params: `dc`, dc current (in Amps)
-
-                Largely corresponds to the "i-prefix" element of Spice-class simulators. 
-                Sole required parameter `dc` sets the DC value. 
-                All other parameters are passed unmodifed to netlist-level formats. 
-                """
+            ExternalModule(
+                name=_qname("isource"),
+                desc=dedent(
+                    """
+                    # Independent Current Source
+
+                    Ports: (p, n) 
+                    Params: `dc`, dc current (in Amps)
+
+                    Largely corresponds to the "i-prefix" element of Spice-class simulators. 
+                    Sole required parameter `dc` sets the DC value. 
+                    All other parameters are passed unmodifed to netlist-level formats. 
+                    """
+                ),
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="dc", desc="DC Current (Amps)"),
+                ],
+                spicetype=SpiceType.ISOURCE,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="dc", desc="DC Current (Amps)"),
-            ],
-            spicetype=SpiceType.ISOURCE,
-        ),
-        ExternalModule(
-            name=_qname("vdc"),
-            desc=dedent(
-                """
-                # Independent Voltage Source
+            ExternalModule(
+                name=_qname("vdc"),
+                desc=dedent(
+                    """
+                    # Independent Voltage Source
 
-                Ports: (p, n) 
-                Params: `dc`, dc voltage (in Volts)
+                    Ports: (p, n) 
+                    Params: `dc`, dc voltage (in Volts)
 
-                All other parameters are passed unmodifed to netlist-level formats. 
-                """
+                    All other parameters are passed unmodifed to netlist-level formats. 
+                    """
+                ),
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="dc", desc="DC Voltage (Volts)"),
+                    Param(
+                        name="ac",
+                        desc="AC/ Small-Signal Magnitude (Volts)",
+                        value=ParamValue(int64_value=0),
+                    ),
+                ],
+                spicetype=SpiceType.VSOURCE,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="dc", desc="DC Voltage (Volts)"),
-                Param(
-                    name="ac",
-                    desc="AC/ Small-Signal Magnitude (Volts)",
-                    value=ParamValue(int64_value=0),
+            ExternalModule(
+                name=_qname("vpulse"),
+                desc=dedent(
+                    """
+                    # Pulse Voltage Source
+                    Two-value time-alternating voltage, with parametrizable rise and fall times and delays.
+
+                    Ports: (p, n) 
+                    Params: FIXME!
+
+                    All other parameters are passed unmodifed to netlist-level formats. 
+                    """
                 ),
-            ],
-            spicetype=SpiceType.VSOURCE,
-        ),
-        ExternalModule(
-            name=_qname("vpulse"),
-            desc=dedent(
-                """
-                # Pulse Voltage Source
-                Two-value time-alternating voltage, with parametrizable rise and fall times and delays.
-
-                Ports: (p, n) 
-                Params: FIXME!
-
-                All other parameters are passed unmodifed to netlist-level formats. 
-                """
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="v1", desc="Initial Value (V)"),
+                    Param(name="v2", desc="Pulse Value (V)"),
+                    Param(name="td", desc="Delay Time (s)"),
+                    Param(name="tr", desc="Rise Time (s)"),
+                    Param(name="tf", desc="Fall Time (s)"),
+                    Param(name="tpw", desc="Pulse Width (s)"),
+                    Param(name="tper", desc="Period (s)"),
+                ],
+                spicetype=SpiceType.VSOURCE,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="v1", desc="Initial Value (V)"),
-                Param(name="v2", desc="Pulse Value (V)"),
-                Param(name="td", desc="Delay Time (s)"),
-                Param(name="tr", desc="Rise Time (s)"),
-                Param(name="tf", desc="Fall Time (s)"),
-                Param(name="tpw", desc="Pulse Width (s)"),
-                Param(name="tper", desc="Period (s)"),
-            ],
-            spicetype=SpiceType.VSOURCE,
-        ),
-        ExternalModule(
-            name=_qname("vsin"),
-            desc=dedent(
-                """
-                # Sinusoidal Voltage Source
+            ExternalModule(
+                name=_qname("vsin"),
+                desc=dedent(
+                    """
+                    # Sinusoidal Voltage Source
 
-                Ports: (p, n) 
-                Params: FIXME!
+                    Ports: (p, n) 
+                    Params: FIXME!
 
-                All other parameters are passed unmodifed to netlist-level formats. 
-                """
+                    All other parameters are passed unmodifed to netlist-level formats. 
+                    """
+                ),
+                ports=_ports(("p", "n")),
+                signals=_signals(("p", "n")),
+                parameters=[
+                    Param(name="voff", desc="Offset voltage (V)"),
+                    Param(name="vamp", desc="Amplitude (V)"),
+                    Param(name="freq", desc="Frequency (Hz)"),
+                    Param(name="td", desc="Delay Time (s)"),
+                    Param(name="phase", desc="Phase when t=td (degrees)"),
+                ],
+                spicetype=SpiceType.VSOURCE,
             ),
-            ports=_ports(("p", "n")),
-            signals=_signals(("p", "n")),
-            parameters=[
-                Param(name="voff", desc="Offset voltage (V)"),
-                Param(name="vamp", desc="Amplitude (V)"),
-                Param(name="freq", desc="Frequency (Hz)"),
-                Param(name="td", desc="Delay Time (s)"),
-                Param(name="phase", desc="Phase when t=td (degrees)"),
-            ],
-            spicetype=SpiceType.VSOURCE,
-        ),
-        # FIXME: there's no straightforward way to implement "pwl", without list-valued parameters
-        # ExternalModule(
-        #     name=_qname("vpwl"),
-        #     desc=dedent(
-        #         """
-        #         # Piece-wise Linear Voltage Source
-        #         Driven by a set of (time, voltage) pairs.
-        #
-        #         Ports: (p, n)
-        #         Params: FIXME
-        #
-        #         All other parameters are passed unmodifed to netlist-level formats.
-        #         """
-        #     ),
-        #     ports=_ports(("p", "n")),
-        #     signals=_signals(("p", "n")),
-        #     parameters=[],
-        #     spicetype = SpiceType.VSOURCE,
-        # ),
-    ],
-)
+            # FIXME: there's no straightforward way to implement "pwl", without list-valued parameters
+            # ExternalModule(
+            #     name=_qname("vpwl"),
+            #     desc=dedent(
+            #         """
+            #         # Piece-wise Linear Voltage Source
+            #         Driven by a set of (time, voltage) pairs.
+            #
+            #         Ports: (p, n)
+            #         Params: FIXME
+            #
+            #         All other parameters are passed unmodifed to netlist-level formats.
+            #         """
+            #     ),
+            #     ports=_ports(("p", "n")),
+            #     signals=_signals(("p", "n")),
+            #     parameters=[],
+            #     spicetype = SpiceType.VSOURCE,
+            # ),
+        ],
+    )
+
+
+@lru_cache(maxsize=None)
+def _dct() -> Dict[str, ExternalModule]:
+    """Create the {name: ExternalModule} dictionary of primitives."""
+    dct: Dict[str, ExternalModule] = dict()
+
+    for emod in _package().ext_modules:
+        # First make sure the module-name is valid, and not already defined.
+        modname = emod.name.name
+        if "." in modname:
+            raise RuntimeError(f"Invalid module-name: {emod.name}")
+
+        # Check for duplicates/ conflicts
+        if dct.get(modname, None) is not None:
+            raise RuntimeError(f"Module-name conflict: {modname}")
+        if globals().get(modname, None) is not None:
+            raise RuntimeError(f"Module-name conflict: {modname}")
+
+        # Checks out: add it
+        dct[modname] = emod
+    return dct
 
 
-# Also make each `ExternalModule` available in
-# (a) A {name: ExternalModule} dictionary, and
+# Make the package, and each `ExternalModule`, available lazily in
+# (a) A {name: ExternalModule} dictionary `dct`, and
 # (b) This namespace, under its module-name.
-dct: Dict[str, ExternalModule] = dict()
-
-for emod in package.ext_modules:
-    # First make sure the module-name is valid, and not already defined.
-    modname = emod.name.name
-    if "." in modname:
-        raise RuntimeError(f"Invalid module-name: {emod.name}")
-
-    # Check for duplicates/ conflicts
-    if dct.get(modname, None) is not None:
-        raise RuntimeError(f"Module-name conflict: {modname}")
-    if globals().get(modname, None) is not None:
-        raise RuntimeError(f"Module-name conflict: {modname}")
-
-    # Checks out: add it
-    globals()[modname] = emod
-    dct[modname] = emod
+def __getattr__(name: str):
+    """Module-level attribute access (PEP 562), for the lazily-built `package`, `dct`, and primitives."""
+    if name == "package":
+        return _package()
+    if name == "dct":
+        return _dct()
+    if not name.startswith("_") and name in _dct():
+        return _dct()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + ["package", "dct"] + list(_dct()))
 
 
 """
@@ -43,6 +43,7 @@ from typing import Dict, Optional
 from dataclasses import dataclass
 
 import vlsirtools.spice as vsp
+from vlsirtools.spice import registry
 
 
 class SimulatorTestMode(Enum):
@@ -61,8 +62,14 @@ class SimulatorTestMode(Enum):
 class Simulator:
     marker: str
     # Simulator name/ command-line option/ pytest-marker name
-    available: bool
-    # Boolean indicator of availability in the current environment
+    simulator: vsp.SupportedSimulators
+    # Paired simulator enum
+
+    @property
+    def available(self) -> bool:
+        """Boolean indicator of availability in the current environment.
+        Probed lazily, and at most once per process, by `vlsirtools.spice.registry`."""
+        return registry.available(self.simulator)
 
     def getoption(self, config: "Config") -> Optional["SimulatorTestMode"]:
         """Get this simulator's pytest option"""
@@ -72,15 +79,11 @@ class Simulator:
         return SimulatorTestMode(option)
 
 
-# The "registry" of supported simulators and their availability in the current process environment
-# In other words, the stuff about the simulators that we know before we start running tests
+# The "registry" of supported simulators
+# In other words, the stuff about the simulators that we know before we start running tests.
+# Note their availability is not probed here at import-time, but only when (and if) a test-mode requires it.
 simulators: Dict[str, Simulator] = {
-    s.marker: s
-    for s in [
-        Simulator(marker="spectre", available=vsp.spectre.available()),
-        Simulator(marker="xyce", available=vsp.xyce.available()),
-        Simulator(marker="ngspice", available=vsp.ngspice.available()),
-    ]
+    s.value: Simulator(marker=s.value, simulator=s) for s in vsp.SupportedSimulators
 }
 
 
@@ -0,0 +1,198 @@
+"""
+# VlsirTools Server
+
+A long-running netlisting and simulation server, listening on a local Unix-domain socket.
+Clients avoid per-request interpreter startup and import costs, which generally dominate the latency of small netlists.
+
+Each request and response is a frame comprising:
+* A single `Kind` byte
+* The payload length, as a protobuf varint
+* The payload: a binary-format protobuf message, or for `ERROR` responses, a UTF-8 error message
+
+Requests of kind `NETLIST` carry a `vlsir.netlist.NetlistInput`, and are answered with a `NetlistResult`.
+Requests of kind `SIM` carry a `vlsir.spice.SimInput`, and are answered with a `SimResult`.
+Each connection may make any number of requests, each answered in order.
+
+Netlisting runs in a pool of worker processes, warmed at startup. Simulations run in a pool of threads,
+each of which invokes a simulator sub-process.
+"""
+
+# Std-Lib Imports
+import os
+import sys
+import importlib
+import socket
+import socketserver
+import concurrent.futures
+from enum import Enum
+from pathlib import Path
+from typing import IO, Optional, Tuple, Union
+
+# Local Imports
+import vlsir.netlist_pb2 as vnl
+import vlsir.spice_pb2 as vsp
+from .delimited import encode_varint, read_varint, read_exactly
+from .netlist.batch import netlist_serialized
+
+
+class Kind(Enum):
+    """Enumerated Frame Kinds"""
+
+    NETLIST = 1  # `NetlistInput` requests, and `NetlistResult` responses
+    SIM = 2  # `SimInput` requests, and `SimResult` responses
+    ERROR = 3  # Error responses, with a UTF-8 message payload
+
+
+class ServerError(Exception):
+    """Error reported by the server, in response to a request."""
+
+
+def write_frame(dest: IO[bytes], kind: Kind, payload: bytes) -> None:
+    """Write a frame of kind `kind` and content `payload` to binary file-like `dest`."""
+    dest.write(bytes([kind.value]) + encode_varint(len(payload)) + payload)
+    dest.flush()
+
+
+def read_frame(src: IO[bytes]) -> Optional[Tuple[Kind, bytes]]:
+    """Read a frame from binary file-like `src`. Returns `None` at a clean end-of-file."""
+    kind = src.read(1)
+    if not kind:
+        return None
+    size = read_varint(src)
+    if size is None:
+        raise EOFError("Unexpected end-of-file in frame")
+    return Kind(kind[0]), read_exactly(src, size)
+
+
+class VlsirServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """# Netlisting and Simulation Server
+
+    Serves connections on Unix-domain socket `path`, each on its own thread.
+    Up to `jobs` netlists and up to `jobs` simulations run concurrently.
+    `jobs` defaults to the number of CPUs."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Union[str, os.PathLike], jobs: Optional[int] = None):
+        self.path = Path(path)
+        if self.path.is_socket():
+            self.path.unlink()  # Remove any stale socket from a prior server
+        self.jobs = jobs or os.cpu_count() or 1
+        self.netlist_pool = concurrent.futures.ProcessPoolExecutor(self.jobs)
+        self.sim_pool = concurrent.futures.ThreadPoolExecutor(self.jobs)
+        self.warm()
+        super().__init__(str(self.path), _Handler)
+
+    def warm(self) -> None:
+        """Start every netlisting worker process, and load our simulation dependencies,
+        so that no request pays their startup costs."""
+        futures = [self.netlist_pool.submit(_warm) for _ in range(self.jobs)]
+        # Simulations run in this process
+        importlib.import_module(".spice", __package__)
+        for f in futures:
+            f.result()
+
+    def handle_request_frame(self, kind: Kind, payload: bytes) -> Tuple[Kind, bytes]:
+        """Handle a request frame, returning the kind and payload of the response frame."""
+        try:
+            if kind == Kind.NETLIST:
+                future = self.netlist_pool.submit(netlist_serialized, payload)
+                return Kind.NETLIST, future.result()
+            if kind == Kind.SIM:
+                future = self.sim_pool.submit(_sim_serialized, payload)
+                return Kind.SIM, future.result()
+            raise ValueError(f"Invalid request kind {kind}")
+        except Exception as e:
+            return Kind.ERROR, f"{type(e).__name__}: {e}".encode("utf-8")
+
+    def server_close(self) -> None:
+        super().server_close()
+        for pool in (self.netlist_pool, self.sim_pool):
+            if sys.version_info >= (3, 9):
+                pool.shutdown(wait=True, cancel_futures=True)
+            else:  # `cancel_futures` requires Python 3.9. Pending requests run to completion.
+                pool.shutdown(wait=True)
+        if self.path.is_socket():
+            self.path.unlink()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Per-connection handler. Answers requests until the client disconnects."""
+
+    def handle(self) -> None:
+        while True:
+            try:
+                frame = read_frame(self.rfile)
+            except (EOFError, ValueError, ConnectionError):
+                return  # Malformed or truncated frame. Drop the connection.
+            if frame is None:
+                return
+            kind, payload = self.server.handle_request_frame(*frame)
+            write_frame(self.wfile, kind, payload)
+
+
+def _warm() -> None:
+    """Worker-process warm-up. Build the primitives package, used by all netlisters."""
+    from . import primitives
+
+    primitives.package
+
+
+def _sim_serialized(data: bytes) -> bytes:
+    """Simulate serialized `SimInput` `data`, returning a serialized `SimResult`."""
+    from .spice import SimOptions, ResultFormat, sim
+
+    result = sim(
+        vsp.SimInput.FromString(data), SimOptions(fmt=ResultFormat.VLSIR_PROTO)
+    )
+    return result.SerializeToString()
+
+
+def serve(path: Union[str, os.PathLike], jobs: Optional[int] = None) -> None:
+    """Serve on Unix-domain socket `path` until interrupted."""
+    with VlsirServer(path, jobs) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+class Client:
+    """# Server Client
+
+    Connects to a `VlsirServer` on Unix-domain socket `path`, and makes requests of it.
+    Usable as a context manager, which closes the connection on exit."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(str(path))
+        self.file = self.sock.makefile("rwb")
+
+    def netlist(self, inp: vnl.NetlistInput) -> vnl.NetlistResult:
+        """Netlist `inp` on the server."""
+        return vnl.NetlistResult.FromString(self.request(Kind.NETLIST, inp))
+
+    def sim(self, inp: vsp.SimInput) -> vsp.SimResult:
+        """Simulate `inp` on the server."""
+        return vsp.SimResult.FromString(self.request(Kind.SIM, inp))
+
+    def request(self, kind: Kind, msg) -> bytes:
+        """Send a request of kind `kind`, and return its response payload. Raises `ServerError` on error responses."""
+        write_frame(self.file, kind, msg.SerializeToString())
+        frame = read_frame(self.file)
+        if frame is None:
+            raise ConnectionError("Server closed the connection")
+        rkind, payload = frame
+        if rkind == Kind.ERROR:
+            raise ServerError(payload.decode("utf-8"))
+        return payload
+
+    def close(self) -> None:
+        self.file.close()
+        self.sock.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
@@ -1,4 +1,13 @@
 from .spice import *
-from . import spectre
-from . import xyce
-from . import ngspice
+
+import importlib
+
+# The simulator-specific modules are loaded lazily, on first attribute access.
+_SIMULATOR_MODULES = ("spectre", "xyce", "ngspice")
+
+
+def __getattr__(name: str):
+    """Module-level attribute access (PEP 562), importing `_SIMULATOR_MODULES` on first use."""
+    if name in _SIMULATOR_MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
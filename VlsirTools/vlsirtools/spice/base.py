@@ -3,8 +3,8 @@
 """
 
 # Std-Lib Imports
-import subprocess, os, tempfile
-from typing import Optional, List, IO
+import subprocess, os, time, shutil, tempfile, threading
+from typing import Optional, List, IO, Tuple
 from pathlib import Path
 
 # Local/ Project Dependencies
@@ -14,8 +14,58 @@ from . import (
     SupportedSimulators,
     SimOptions,
     ResultFormat,
+    Retention,
     SimInputAndOptions,
 )
+from .telemetry import SimTelemetry, Phase, wait
+from .sim_data import SignalTable
+
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+
+# Name-prefix of temporary run-directories
+RUNDIR_PREFIX = "vlsirtools-sim-"
+# Marker-file written into completed run-directories retained under `Retention.KEEP_LAST`.
+# Only directories which include it are pruned, so that in-progress simulations are never deleted.
+RUNDIR_COMPLETE = ".vlsirtools-complete"
+
+# Lock serializing pruning across concurrent simulations
+_prune_lock = threading.Lock()
+
+
+def prune_rundirs(
+    root: os.PathLike, keep_last: int, keep_max_bytes: Optional[int] = None
+) -> List[Path]:
+    """Prune completed temporary run-directories in `root`.
+    Keeps the most recent `keep_last`, and only as many of those as fit in `keep_max_bytes`, if specified.
+    Returns the list of deleted directories."""
+
+    with _prune_lock:
+        rundirs = [
+            p
+            for p in Path(root).glob(f"{RUNDIR_PREFIX}*")
+            if (p / RUNDIR_COMPLETE).exists()
+        ]
+        # Sort most-recent first
+        rundirs.sort(key=lambda p: (p / RUNDIR_COMPLETE).stat().st_mtime, reverse=True)
+
+        deleted = rundirs[keep_last:]
+        if keep_max_bytes is not None:
+            total = 0
+            for idx, p in enumerate(rundirs[:keep_last]):
+                total += _dir_size(p)
+                if total > keep_max_bytes:
+                    deleted = rundirs[idx:]
+                    break
+
+        for p in deleted:
+            shutil.rmtree(p, ignore_errors=True)
+        return deleted
+
+
+def _dir_size(path: Path) -> int:
+    """Total size of the files in directory `path`, in bytes."""
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
 
 
 class Sim:
@@ -42,10 +92,26 @@ class Sim:
       * At no point should the sub-classes need to know any more about the `Sim` base-class, or call any of its `super` methods.
     """
 
+    # Command-line arguments which print the simulator version. Used to probe availability.
+    version_args: Tuple[str, ...] = ("-v",)
+
     @classmethod
     def enum(cls) -> SupportedSimulators:
         raise NotImplementedError
 
+    @classmethod
+    def executable(cls) -> str:
+        """Get the simulator executable invoked. Generally set by module-level configuration."""
+        raise NotImplementedError
+
+    @classmethod
+    def available(cls) -> bool:
+        """Boolean indication of whether the current running environment includes the simulator executable.
+        Probed once per process, and cached by the `registry` module."""
+        from . import registry
+
+        return registry.available(cls.enum())
+
     @classmethod
     def apply(cls, i: SimInputAndOptions) -> SimResultUnion:
         """# Apply (i.e., simulate) `SimInputAndOptions` `i`."""
@@ -59,6 +125,13 @@ class Sim:
         #
         return cls.sim(i.inp, i.opts)
 
+    @classmethod
+    def apply_with_telemetry(
+        cls, i: SimInputAndOptions
+    ) -> Tuple[SimResultUnion, SimTelemetry]:
+        """# Apply (i.e., simulate) `SimInputAndOptions` `i`, also returning its `SimTelemetry`."""
+        return cls.sim_with_telemetry(i.inp, i.opts)
+
     @classmethod
     def sim(
         cls, inp: vsp.SimInput, opts: Optional[SimOptions] = None
@@ -67,24 +140,42 @@ class Sim:
         Creates an instance of `cls` as a context manager, run in its simulation directory.
         This should be invoked by typical implementations of a free-standing `sim` function.
         """
+        results, _ = cls.sim_with_telemetry(inp, opts)
+        return results
+
+    @classmethod
+    def sim_with_telemetry(
+        cls, inp: vsp.SimInput, opts: Optional[SimOptions] = None
+    ) -> Tuple[SimResultUnion, SimTelemetry]:
+        """Sim-invoking class method, which also returns the simulation's `SimTelemetry`.
+        `sd.SimResult`s also carry the same `SimTelemetry` as their `telemetry` attribute.
+        """
 
         if opts is None:  # Create the default `SimOptions`
             opts = SimOptions(simulator=cls.enum())
 
         # Create the simulation-class instance, and execute its main `run` method
         sim = cls(inp=inp, opts=opts)
+        start = time.perf_counter()
+        failed = True
         try:
             sim.setup()
+            sim.telemetry.rundir = str(sim.rundir)
             results = sim.run()
+            failed = False
         finally:
-            sim.cleanup()
+            sim.cleanup(failed=failed)
+            sim.telemetry.wall_time = time.perf_counter() - start
+
+        if not isinstance(results, vsp.SimResult):
+            results.telemetry = sim.telemetry
 
         # FIXME: we shouldn't need this `isinstance`; get Xyce to return `sd.SimResult` and decide whether to convert here
         if opts.fmt == ResultFormat.VLSIR_PROTO and not isinstance(
             results, vsp.SimResult
         ):
-            return results.to_proto()
-        return results
+            return results.to_proto(), sim.telemetry
+        return results, sim.telemetry
 
     def run(self) -> SimResultUnion:
         raise NotImplementedError("`Sim` subclasses must implement `run`")
@@ -93,8 +184,9 @@ class Sim:
         self.inp = inp
         self.opts = opts
         self.rundir = opts.rundir
-        self.tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        self.tmpdir: Optional[Path] = None  # Temporary run-directory, if we created one
         self.subprocesses: List[subprocess.Process] = []
+        self.telemetry = SimTelemetry(simulator=self.enum().value)
 
     def setup(self):
         """Perform simulation setup, including the simulation directory and top-level Module validation."""
@@ -105,34 +197,69 @@ class Sim:
             self.rundir = Path(self.rundir).absolute()
             if not self.rundir.exists():
                 os.makedirs(self.rundir)
-        else:  # Create a new temp directory
-            self.tmpdir = tempfile.TemporaryDirectory()
-            self.rundir = Path(self.tmpdir.name).absolute()
+        else:  # Create a new temp directory, in our scratch root if specified
+            if self.opts.scratch is not None:
+                os.makedirs(self.opts.scratch, exist_ok=True)
+            tmpdir = tempfile.mkdtemp(prefix=RUNDIR_PREFIX, dir=self.opts.scratch)
+            self.tmpdir = Path(tmpdir).absolute()
+            self.rundir = self.tmpdir
+
+    def cleanup(self, failed: bool = False):
+        """On completion, clean up after ourselves, per our `Retention` policy.
+        Argument `failed` indicates whether the simulation failed."""
+        if self.tmpdir is None:
+            return  # User-specified `rundir`. Never delete these.
+
+        retention = self.opts.retention
+        if retention == Retention.DELETE or (
+            retention == Retention.KEEP_ON_FAILURE and not failed
+        ):
+            shutil.rmtree(self.tmpdir, ignore_errors=True)
+        elif retention == Retention.KEEP_LAST:
+            # Mark the directory as complete, making it eligible for pruning, and prune its siblings.
+            (self.tmpdir / RUNDIR_COMPLETE).touch()
+            prune_rundirs(
+                root=self.tmpdir.parent,
+                keep_last=self.opts.keep_last,
+                keep_max_bytes=self.opts.keep_max_bytes,
+            )
+
+    def resample(self, data: SignalTable) -> SignalTable:
+        """Apply our `SimOptions.resample` specification, if any, to transient data `data`."""
+        if self.opts.resample is None:
+            return data
+        return self.opts.resample.apply(data)
 
-    def cleanup(self):
-        """On completion, clean up after ourselves."""
-        if self.tmpdir is not None:
-            self.tmpdir.cleanup()
+    def phase(self, phase: Phase):
+        """Context manager which times the enclosed block as `phase` of our `SimTelemetry`."""
+        return self.telemetry.phase(phase)
 
     def run_subprocess(self, cmd: str) -> None:
         """Run a shell subprocess invoking command `cmd`.
         All subprocesses are run in `self.rundir`, and tracked in the list `self.subprocesses`.
         """
 
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=str(self.rundir),
-        )
-        self.subprocesses.append(proc)
-        stdout, stderr = proc.communicate()
+        # Simulator output is captured in temporary files rather than pipes.
+        # This allows waiting via `os.wait4`, which also reports the subprocess's resource usage.
+        with self.phase(Phase.SIMULATE):
+            with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+                start = time.perf_counter()
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=out,
+                    stderr=err,
+                    cwd=str(self.rundir),
+                )
+                self.subprocesses.append(proc)
+                self.telemetry.add_process(wait(proc, start))
 
-        # The subprocess module does not raise Python exceptions: check the return code instead.
-        if proc.returncode != 0:
-            from . import SimError
+                # The subprocess module does not raise Python exceptions: check the return code instead.
+                if proc.returncode != 0:
+                    from . import SimError
 
-            raise SimError(sim=self, stdout=stdout, stderr=stderr)
+                    out.seek(0)
+                    err.seek(0)
+                    raise SimError(sim=self, stdout=out.read(), stderr=err.read())
         return None
 
     def open(self, name: str, mode: str = "r") -> IO:
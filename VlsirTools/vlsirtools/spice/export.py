@@ -0,0 +1,255 @@
+"""
+# Simulation Result Export
+
+Writers and readers for `sim_data.SimResult`s in columnar formats, for result-sets too large for `SimResult.to_proto()`.
+
+* NumPy NPZ - a single file, with each analysis's signals stored as one `(num_signals, num_points)` array.
+  Uncompressed files can be read back as memory-maps, so that opening them reads no signal data.
+* Apache Arrow IPC and Parquet - a directory, with one table-file per analysis and one column per signal.
+  Requires the optional `pyarrow` dependency, e.g. via `pip install vlsirtools[arrow]`.
+  Arrow IPC files can be opened as memory-mapped `pyarrow.Table`s by `open_arrow`.
+
+Complex-valued AC data is stored natively in NPZ, and as `struct<re, im>` columns in Arrow and Parquet.
+Analysis names, types, and measurements are stored alongside the data.
+"""
+
+# Std-Lib Imports
+import os, json, zipfile
+from pathlib import Path
+from typing import Dict, List, Union
+
+# PyPi Imports
+import numpy as np
+
+# Local/ Project Dependencies
+from .sim_data import (
+    AnalysisType,
+    AnalysisResult,
+    SimResult,
+    SignalTable,
+    OpResult,
+    DcResult,
+    TranResult,
+    AcResult,
+    CustomAnalysisResult,
+)
+
+# Key for our metadata, in NPZ member names and Arrow schema metadata
+META_KEY = "vlsir"
+
+
+def write_npz(result: SimResult, dest: Union[str, os.PathLike], compress=False) -> None:
+    """Write `result` to NPZ file `dest`.
+    Compressed files are smaller, but cannot be memory-mapped by `read_npz`."""
+
+    arrays: Dict[str, np.ndarray] = dict()
+    metas: List[Dict] = []
+    for idx, an in enumerate(result.an):
+        metas.append(_meta(an))
+        table = _table(an)
+        arrays[f"{idx}.names"] = np.array(table.names, dtype=str)
+        arrays[f"{idx}.data"] = table.array
+        if isinstance(an, AcResult):
+            arrays[f"{idx}.freq"] = np.asarray(an.freq)
+    arrays[META_KEY] = np.array(json.dumps(metas))
+
+    save = np.savez_compressed if compress else np.savez
+    with open(dest, "wb") as f:
+        save(f, **arrays)
+
+
+def read_npz(src: Union[str, os.PathLike], mmap: bool = True) -> SimResult:
+    """Read a `SimResult` from NPZ file `src`.
+    If `mmap` is set, uncompressed signal data is memory-mapped rather than read.
+    Compressed members are always read into memory."""
+
+    with zipfile.ZipFile(src) as zf:
+        infos = {Path(i.filename).stem: i for i in zf.infolist()}
+
+        def load(name: str, mmap: bool = mmap) -> np.ndarray:
+            info = infos[name]
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                return _mmap_member(src, info)
+            with zf.open(info) as f:
+                return np.lib.format.read_array(f, allow_pickle=False)
+
+        metas = json.loads(str(load(META_KEY, mmap=False)))
+        an = []
+        for idx, meta in enumerate(metas):
+            names = [str(n) for n in load(f"{idx}.names", mmap=False)]
+            table = SignalTable(names=names, array=load(f"{idx}.data"))
+            freq = load(f"{idx}.freq") if f"{idx}.freq" in infos else None
+            an.append(_result(meta, table, freq))
+    return SimResult(an=an)
+
+
+def write_arrow(result: SimResult, dest: Union[str, os.PathLike]) -> None:
+    """Write `result` to directory `dest`, as one Arrow IPC file per analysis."""
+    pa = _pyarrow()
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    for idx, an in enumerate(result.an):
+        table = _arrow_table(an)
+        with pa.OSFile(str(dest / f"{idx}.arrow"), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+def open_arrow(src: Union[str, os.PathLike]) -> List["pyarrow.Table"]:
+    """Open the Arrow IPC files in directory `src` as memory-mapped `pyarrow.Table`s, in analysis order.
+    No signal data is read until accessed."""
+    pa = _pyarrow()
+    tables = []
+    for path in _ordered(src, "arrow"):
+        source = pa.memory_map(str(path), "r")
+        tables.append(pa.ipc.open_file(source).read_all())
+    return tables
+
+
+def read_arrow(src: Union[str, os.PathLike]) -> SimResult:
+    """Read a `SimResult` from the Arrow IPC files in directory `src`."""
+    return SimResult(an=[_from_arrow_table(t) for t in open_arrow(src)])
+
+
+def write_parquet(result: SimResult, dest: Union[str, os.PathLike]) -> None:
+    """Write `result` to directory `dest`, as one Parquet file per analysis."""
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    dest = Path(dest)
+    dest.mkdir(parents=True, exist_ok=True)
+    for idx, an in enumerate(result.an):
+        pq.write_table(_arrow_table(an), str(dest / f"{idx}.parquet"))
+
+
+def read_parquet(src: Union[str, os.PathLike]) -> SimResult:
+    """Read a `SimResult` from the Parquet files in directory `src`."""
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    tables = [pq.read_table(str(p), memory_map=True) for p in _ordered(src, "parquet")]
+    return SimResult(an=[_from_arrow_table(t) for t in tables])
+
+
+def _pyarrow():
+    """Import the optional `pyarrow` dependency, with a helpful error if it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError as e:
+        msg = "Arrow and Parquet export require `pyarrow`. Install it via `pip install vlsirtools[arrow]`."
+        raise ImportError(msg) from e
+    return pyarrow
+
+
+def _meta(an: AnalysisResult) -> Dict:
+    """Get the non-signal content of `an`: its type, name, and measurements."""
+    if isinstance(an, CustomAnalysisResult):
+        return dict(type=an.vlsir_type.value)
+    if not isinstance(an, (OpResult, DcResult, TranResult, AcResult)):
+        raise NotImplementedError(f"Export of {type(an).__name__} is not supported")
+    meta = dict(type=an.vlsir_type.value, analysis_name=an.analysis_name)
+    if isinstance(an, DcResult):
+        meta["indep_name"] = an.indep_name
+    if not isinstance(an, OpResult):
+        meta["measurements"] = {k: float(v) for k, v in an.measurements.items()}
+    return meta
+
+
+def _table(an: AnalysisResult) -> SignalTable:
+    """Get the signal data of `an` as a `SignalTable`. Operating-point data becomes single-point signals."""
+    if isinstance(an, CustomAnalysisResult):
+        return SignalTable.from_dict({})
+    if isinstance(an, OpResult):
+        return SignalTable.from_dict({k: np.array([v]) for k, v in an.data.items()})
+    return SignalTable.from_dict(an.data)
+
+
+def _result(meta: Dict, table: SignalTable, freq=None) -> AnalysisResult:
+    """Re-create an `AnalysisResult` from its metadata and signal data."""
+    tp = AnalysisType(meta["type"])
+    if tp == AnalysisType.CUSTOM:
+        return CustomAnalysisResult()
+    name = meta["analysis_name"]
+    measurements = meta.get("measurements", {})
+    if tp == AnalysisType.OP:
+        return OpResult(analysis_name=name, data={k: v[0] for k, v in table.items()})
+    if tp == AnalysisType.DC:
+        return DcResult(
+            analysis_name=name,
+            indep_name=meta["indep_name"],
+            data=table,
+            measurements=measurements,
+        )
+    if tp == AnalysisType.TRAN:
+        return TranResult(analysis_name=name, data=table, measurements=measurements)
+    if tp == AnalysisType.AC:
+        return AcResult(
+            analysis_name=name, freq=freq, data=table, measurements=measurements
+        )
+    raise NotImplementedError(f"Import of {tp} results is not supported")
+
+
+def _ordered(src: Union[str, os.PathLike], ext: str) -> List[Path]:
+    """Get the per-analysis files in directory `src` with extension `ext`, in analysis order."""
+    return sorted(Path(src).glob(f"*.{ext}"), key=lambda p: int(p.stem))
+
+
+def _arrow_table(an: AnalysisResult) -> "pyarrow.Table":
+    """Convert `an` to a `pyarrow.Table`, with our metadata in its schema."""
+    pa = _pyarrow()
+    columns = dict()
+    if isinstance(an, AcResult):
+        columns["freq"] = pa.array(np.asarray(an.freq))
+    for name, values in _table(an).items():
+        if np.iscomplexobj(values):
+            columns[name] = pa.StructArray.from_arrays(
+                [pa.array(values.real), pa.array(values.imag)], names=["re", "im"]
+            )
+        else:
+            columns[name] = pa.array(values)
+    table = pa.table(columns)
+    return table.replace_schema_metadata({META_KEY: json.dumps(_meta(an))})
+
+
+def _from_arrow_table(table: "pyarrow.Table") -> AnalysisResult:
+    """Convert a `pyarrow.Table` written by `_arrow_table` back to an `AnalysisResult`."""
+    pa = _pyarrow()
+    meta = json.loads(table.schema.metadata[META_KEY.encode()])
+    freq = None
+    data = dict()
+    for name in table.column_names:
+        column = table.column(name).combine_chunks()
+        if name == "freq" and meta["type"] == AnalysisType.AC.value:
+            freq = column.to_numpy()
+        elif pa.types.is_struct(column.type):
+            re = column.field("re").to_numpy()
+            im = column.field("im").to_numpy()
+            data[name] = re + 1j * im
+        else:
+            data[name] = column.to_numpy()
+    return _result(meta, SignalTable.from_dict(data), freq)
+
+
+def _mmap_member(src: Union[str, os.PathLike], info: zipfile.ZipInfo) -> np.ndarray:
+    """Memory-map uncompressed `.npy` member `info` of zip-file `src`."""
+    with open(src, "rb") as f:
+        # The member's local header has a fixed 30-byte part, then its file-name and extra field,
+        # whose lengths may differ from those in the central directory.
+        f.seek(info.header_offset + 26)
+        name_len, extra_len = np.frombuffer(f.read(4), dtype="<u2")
+        f.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if dtype.hasobject:
+        raise ValueError(f"Cannot memory-map object array {info.filename}")
+    if not int(np.prod(shape)):
+        return np.empty(shape, dtype=dtype)
+    order = "F" if fortran else "C"
+    return np.memmap(
+        src, dtype=dtype, mode="r", offset=offset, shape=shape, order=order
+    )
@@ -0,0 +1,134 @@
+"""
+# Measurement-File Parsing
+
+Reads simulator measurement-files into columnar tables: dictionaries from measurement name to a numpy array,
+with one element per row. Stepped, `alter`, and Monte Carlo runs produce multiple rows, and often multiple files;
+`read_files` concatenates all of them, in file order.
+"""
+
+# Std-Lib Imports
+import re
+from pathlib import Path
+from typing import Callable, Dict, IO, Iterable, List
+
+# PyPi Imports
+import numpy as np
+
+# Type alias for columnar measurement data
+MeasTable = Dict[str, np.ndarray]
+
+
+def parse_mt0(file: IO) -> MeasTable:
+    """Parse an (open) "mt0-format" measurement-file into a `MeasTable`.
+
+    The format comprises two header lines, followed by whitespace-separated measurement names,
+    followed by values in the same order. Both may wrap across several lines.
+    Each set of values forms one row. Non-numeric values, e.g. "failed", are converted to NaN.
+    """
+
+    file.readline()  # Header
+    file.readline()  # Netlist Title
+    lines = file.read().splitlines()
+
+    # Names end with the `alter#` column, or failing that, before the first line beginning with a value
+    names: List[str] = []
+    idx = 0
+    while idx < len(lines):
+        tokens = lines[idx].split()
+        if tokens and _is_value(tokens[0]):
+            break
+        names.extend(tokens)
+        idx += 1
+        if tokens and tokens[-1].lower() == "alter#":
+            break
+
+    tokens = " ".join(lines[idx:]).split()
+    if not names:
+        return dict()
+    if len(tokens) % len(names):
+        msg = f"Invalid measurement-file: {len(tokens)} values for {len(names)} measurements"
+        raise RuntimeError(msg)
+    values = _to_floats(tokens).reshape(-1, len(names))
+    return {name: values[:, col].copy() for col, name in enumerate(names)}
+
+
+def parse_name_value(file: IO) -> MeasTable:
+    """Parse an (open) measurement-file comprised of `name = value` lines into a single-row `MeasTable`.
+    Repeated names produce multiple rows."""
+    rows: Dict[str, List[str]] = dict()
+    for line in file.read().splitlines():
+        contents = line.split()
+        if not contents:
+            continue
+        if len(contents) != 3 or contents[1] != "=":
+            raise RuntimeError(f"Invalid line in measurements: {line}")
+        rows.setdefault(contents[0], []).append(contents[2])
+    return {k: _to_floats(v) for k, v in rows.items()}
+
+
+def read_files(paths: Iterable[Path], parse: Callable[[IO], MeasTable]) -> MeasTable:
+    """Read and concatenate the measurement-files at `paths`, each via `parse`.
+    Files are read in "natural" order, e.g. `x.mt2` before `x.mt10`.
+    Measurements missing from some files are filled with NaN for their rows."""
+    tables = []
+    for path in sorted(paths, key=_natural_key):
+        with open(path, "r") as f:
+            tables.append(parse(f))
+    return concat(tables)
+
+
+def concat(tables: List[MeasTable]) -> MeasTable:
+    """Concatenate the rows of `tables`, filling missing measurements with NaN."""
+    tables = [t for t in tables if t]
+    if len(tables) == 1:
+        return tables[0]
+    names: Dict[str, None] = dict()  # Ordered set of names, in first-seen order
+    for t in tables:
+        names.update(dict.fromkeys(t.keys()))
+    nrows = [len(next(iter(t.values()))) for t in tables]
+    return {
+        name: np.concatenate(
+            [t.get(name, np.full(n, np.nan)) for t, n in zip(tables, nrows)]
+        )
+        for name in names
+    }
+
+
+def first_row(table: MeasTable) -> Dict[str, float]:
+    """Get the first row of `table` as scalar {name: value} pairs. Empty if `table` has no rows."""
+    return {k: float(v[0]) for k, v in table.items() if len(v)}
+
+
+def _to_floats(tokens: List[str]) -> np.ndarray:
+    """Convert `tokens` to a float array, converting failing cases to NaN."""
+    try:  # Fast path, for all-numeric content
+        return np.array(tokens, dtype=float)
+    except ValueError:
+        return np.array([_convert(s) for s in tokens], dtype=float)
+
+
+def _convert(s: str) -> float:
+    """Convert a string to a float, converting failing cases to `NaN`"""
+    try:
+        return float(s)
+    except ValueError:
+        return float("NaN")
+
+
+def _is_value(s: str) -> bool:
+    """Boolean indication of whether `s` is a measurement value: a number, or "failed"."""
+    return s.lower() == "failed" or _is_number(s)
+
+
+def _is_number(s: str) -> bool:
+    try:
+        float(s)
+        return True
+    except ValueError:
+        return False
+
+
+def _natural_key(path: Path):
+    """Sort key ordering embedded numbers numerically."""
+    parts = re.split(r"(\d+)", str(path))
+    return [int(p) if p.isdigit() else p for p in parts]
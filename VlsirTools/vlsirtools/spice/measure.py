@@ -0,0 +1,360 @@
+"""
+# Waveform Measurements
+
+Numpy-based measurements over `sim_data` results, evaluated after simulation.
+Unlike simulator `.meas` statements, adding a measurement here requires no re-simulation.
+
+All measurements are vectorized: signal arguments `y` may have any number of leading dimensions, e.g.
+`(nresults, nsignals, npts)`, and measure along their last axis, returning arrays of shape `(nresults, nsignals)`.
+The independent-axis argument `x` is either a single shared `(npts,)` axis, or broadcastable to `y`.
+Measurements which find no result, e.g. a crossing that never occurs, produce NaN.
+
+Typical usage stacks many results, e.g. from a Monte Carlo batch, and measures them in one pass:
+
+```python
+x, y = measure.stack(results, ["out", "inp"])
+delays = measure.delay(x, y[:, 1], y[:, 0], trig_level=0.5, targ_level=0.5)
+```
+"""
+
+# Std-Lib Imports
+from enum import Enum
+from typing import Optional, Sequence, Tuple, Union, Mapping
+
+# PyPi Imports
+import numpy as np
+
+# Local/ Project Dependencies
+from .sim_data import TranResult, DcResult, AcResult
+
+# Union of results with waveform data
+WaveformResult = Union[TranResult, DcResult, AcResult]
+
+
+class Edge(Enum):
+    """Enumerated Crossing Directions"""
+
+    RISE = "rise"
+    FALL = "fall"
+    EITHER = "either"
+
+
+def axis(result: WaveformResult) -> np.ndarray:
+    """Get the independent axis of `result`: time, the swept variable, or frequency."""
+    if isinstance(result, AcResult):
+        return np.asarray(result.freq)
+    if isinstance(result, TranResult):
+        return _get(result.data, "time")
+    if isinstance(result, DcResult):
+        return _get(result.data, result.indep_name)
+    raise TypeError(f"Invalid result type for measurement: {result}")
+
+
+def stack(
+    results: Sequence[WaveformResult],
+    signals: Sequence[str],
+    x: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack `signals` from each of `results` into a single array of shape `(nresults, nsignals, npts)`.
+    Returns a tuple of the shared independent axis, and that array.
+
+    If `x` is specified, every signal is interpolated onto it.
+    Otherwise if all results share an independent axis, it is used as-is.
+    If not, e.g. for transient results with adaptive time-steps, signals are interpolated onto
+    a uniform axis spanning the range common to all results, with as many points as the longest.
+    Signal names are matched case-insensitively."""
+
+    axes = [axis(r) for r in results]
+    if x is None:
+        if all(len(a) == len(axes[0]) and np.array_equal(a, axes[0]) for a in axes):
+            x = axes[0]
+            return x, np.stack([_signals(r, signals) for r in results])
+        start = max(a[0] for a in axes)
+        stop = min(a[-1] for a in axes)
+        x = np.linspace(start, stop, max(len(a) for a in axes))
+
+    x = np.asarray(x)
+    y = np.empty((len(results), len(signals), len(x)), dtype=_dtype(results))
+    for ridx, (r, a) in enumerate(zip(results, axes)):
+        for sidx, s in enumerate(_signals(r, signals)):
+            y[ridx, sidx] = _interp(x, a, s)
+    return x, y
+
+
+def cross(
+    x: np.ndarray,
+    y: np.ndarray,
+    level: float,
+    edge: Edge = Edge.EITHER,
+    n: int = 1,
+) -> np.ndarray:
+    """Value of `x` at which `y` crosses `level` for the `n`th time, in direction `edge`.
+    Negative `n` count from the end, i.e. `n=-1` is the last crossing. Linearly interpolated.
+    """
+    idx, frac, found = _crossing(y, level, edge, n)
+    return _interp_at(np.broadcast_to(x, y.shape), idx, frac, found)
+
+
+def delay(
+    x: np.ndarray,
+    trig: np.ndarray,
+    targ: np.ndarray,
+    trig_level: float,
+    targ_level: float,
+    trig_edge: Edge = Edge.EITHER,
+    targ_edge: Edge = Edge.EITHER,
+    trig_n: int = 1,
+    targ_n: int = 1,
+) -> np.ndarray:
+    """Delay from the `trig_n`th crossing of `trig` to the `targ_n`th crossing of `targ`."""
+    return cross(x, targ, targ_level, targ_edge, targ_n) - cross(
+        x, trig, trig_level, trig_edge, trig_n
+    )
+
+
+def rise_time(
+    x: np.ndarray,
+    y: np.ndarray,
+    low: float,
+    high: float,
+    lo_frac: float = 0.1,
+    hi_frac: float = 0.9,
+    n: int = 1,
+) -> np.ndarray:
+    """Time for the `n`th rising transition of `y` between `lo_frac` and `hi_frac` of the span from `low` to `high`."""
+    lo, hi = _thresholds(low, high, lo_frac, hi_frac)
+    return cross(x, y, hi, Edge.RISE, n) - cross(x, y, lo, Edge.RISE, n)
+
+
+def fall_time(
+    x: np.ndarray,
+    y: np.ndarray,
+    low: float,
+    high: float,
+    lo_frac: float = 0.1,
+    hi_frac: float = 0.9,
+    n: int = 1,
+) -> np.ndarray:
+    """Time for the `n`th falling transition of `y` between `hi_frac` and `lo_frac` of the span from `low` to `high`."""
+    lo, hi = _thresholds(low, high, lo_frac, hi_frac)
+    return cross(x, y, lo, Edge.FALL, n) - cross(x, y, hi, Edge.FALL, n)
+
+
+def average(
+    x: np.ndarray,
+    y: np.ndarray,
+    start: Optional[float] = None,
+    stop: Optional[float] = None,
+) -> np.ndarray:
+    """Average of `y` over `x`, i.e. its integral divided by the span of `x`.
+    Optionally restricted to the window from `start` to `stop`."""
+    integral, span = _integrate(x, y, start, stop)
+    return integral / span
+
+
+def rms(
+    x: np.ndarray,
+    y: np.ndarray,
+    start: Optional[float] = None,
+    stop: Optional[float] = None,
+) -> np.ndarray:
+    """Root-mean-square of `y` over `x`. Optionally restricted to the window from `start` to `stop`."""
+    integral, span = _integrate(x, np.abs(y) ** 2, start, stop)
+    return np.sqrt(integral / span)
+
+
+def minimum(
+    x: np.ndarray,
+    y: np.ndarray,
+    start: Optional[float] = None,
+    stop: Optional[float] = None,
+) -> np.ndarray:
+    """Minimum of `y`. Optionally restricted to the window from `start` to `stop`."""
+    mask = _window(x, y, start, stop)
+    return np.where(mask.any(axis=-1), np.where(mask, y, np.inf).min(axis=-1), np.nan)
+
+
+def maximum(
+    x: np.ndarray,
+    y: np.ndarray,
+    start: Optional[float] = None,
+    stop: Optional[float] = None,
+) -> np.ndarray:
+    """Maximum of `y`. Optionally restricted to the window from `start` to `stop`."""
+    mask = _window(x, y, start, stop)
+    return np.where(mask.any(axis=-1), np.where(mask, y, -np.inf).max(axis=-1), np.nan)
+
+
+def settling_time(
+    x: np.ndarray,
+    y: np.ndarray,
+    tol: float = 0.01,
+    final: Optional[np.ndarray] = None,
+    start: Optional[float] = None,
+) -> np.ndarray:
+    """Value of `x` after which `y` remains within relative tolerance `tol` of its `final` value.
+    `final` defaults to the last value of `y`. If `start` is specified, returns the time elapsed since it.
+    Returns NaN if `y` has not settled by its last point."""
+
+    if final is None:
+        final = y[..., -1]
+    final = np.asarray(final)[..., np.newaxis]
+    violates = np.abs(y - final) > tol * np.abs(final)
+    if start is not None:
+        violates &= np.broadcast_to(x, y.shape) >= start
+
+    npts = y.shape[-1]
+    last = npts - 1 - np.argmax(violates[..., ::-1], axis=-1)
+    settled_idx = np.where(violates.any(axis=-1), last + 1, 0)
+    xb = np.broadcast_to(x, y.shape)
+    valid = settled_idx < npts
+    idx = np.minimum(settled_idx, npts - 1)[..., np.newaxis]
+    rv = np.where(valid, np.take_along_axis(xb, idx, axis=-1)[..., 0], np.nan)
+    if start is not None:
+        rv = rv - start
+    return rv
+
+
+def gain_margin(freq: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """Gain margin of complex loop-gain `h` in dB,
+    i.e. the inverse of its magnitude where its phase first crosses -180 degrees."""
+    phase = _phase(h)
+    idx, frac, found = _crossing(phase, -180.0, Edge.FALL, 1)
+    mag_db = 20 * np.log10(np.abs(h))
+    return -_interp_at(mag_db, idx, frac, found)
+
+
+def phase_margin(freq: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """Phase margin of complex loop-gain `h` in degrees,
+    i.e. its phase plus 180 degrees where its magnitude first falls through unity."""
+    mag_db = 20 * np.log10(np.abs(h))
+    idx, frac, found = _crossing(mag_db, 0.0, Edge.FALL, 1)
+    return 180.0 + _interp_at(_phase(h), idx, frac, found)
+
+
+def unity_gain_freq(freq: np.ndarray, h: np.ndarray) -> np.ndarray:
+    """Frequency at which the magnitude of complex gain `h` first falls through unity.
+    Interpolated on a logarithmic frequency axis."""
+    mag_db = 20 * np.log10(np.abs(h))
+    idx, frac, found = _crossing(mag_db, 0.0, Edge.FALL, 1)
+    logf = np.log10(np.broadcast_to(freq, h.shape))
+    return 10 ** _interp_at(logf, idx, frac, found)
+
+
+def _crossing(
+    y: np.ndarray, level: float, edge: Edge, n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the `n`th crossing of `level` by `y` along its last axis.
+    Returns a tuple of (segment index, fraction along the segment, found-flag), each shaped `y.shape[:-1]`.
+    """
+
+    if n == 0:
+        raise ValueError("Crossing number `n` must be non-zero")
+    d = np.asarray(y, dtype=float) - level
+    d0, d1 = d[..., :-1], d[..., 1:]
+    rising = (d0 < 0) & (d1 >= 0)
+    falling = (d0 > 0) & (d1 <= 0)
+    if edge == Edge.RISE:
+        hits = rising
+    elif edge == Edge.FALL:
+        hits = falling
+    else:
+        hits = rising | falling
+
+    counts = np.cumsum(hits, axis=-1)
+    total = counts[..., -1] if counts.shape[-1] else np.zeros(d.shape[:-1], int)
+    target = n if n > 0 else total + n + 1
+    found = (target >= 1) & (target <= total)
+    idx = np.argmax(counts >= np.asarray(target)[..., np.newaxis], axis=-1)
+
+    idx_ = idx[..., np.newaxis]
+    a = np.take_along_axis(d0, idx_, axis=-1)[..., 0]
+    b = np.take_along_axis(d1, idx_, axis=-1)[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(a == b, 0.0, a / (a - b))
+    return idx, frac, found
+
+
+def _interp_at(
+    arr: np.ndarray, idx: np.ndarray, frac: np.ndarray, found: np.ndarray
+) -> np.ndarray:
+    """Linearly interpolate `arr` at fraction `frac` along segment `idx` of its last axis. NaN where not `found`."""
+    idx_ = idx[..., np.newaxis]
+    a = np.take_along_axis(arr, idx_, axis=-1)[..., 0]
+    b = np.take_along_axis(arr, idx_ + 1, axis=-1)[..., 0]
+    return np.where(found, a + frac * (b - a), np.nan)
+
+
+def _window(
+    x: np.ndarray, y: np.ndarray, start: Optional[float], stop: Optional[float]
+) -> np.ndarray:
+    """Boolean mask of points of `y` with `x` in the window from `start` to `stop`."""
+    xb = np.broadcast_to(x, y.shape)
+    mask = np.ones(y.shape, dtype=bool)
+    if start is not None:
+        mask &= xb >= start
+    if stop is not None:
+        mask &= xb <= stop
+    return mask
+
+
+def _integrate(
+    x: np.ndarray, y: np.ndarray, start: Optional[float], stop: Optional[float]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Trapezoidal integral of `y` over `x`, and the span of `x` integrated over.
+    Segments are clipped to the window from `start` to `stop`, interpolating `y` at its edges.
+    """
+    xb = np.broadcast_to(x, y.shape)
+    x0, x1 = xb[..., :-1], xb[..., 1:]
+    y0, y1 = y[..., :-1], y[..., 1:]
+    lo = x0 if start is None else np.maximum(x0, start)
+    hi = x1 if stop is None else np.minimum(x1, stop)
+    width = np.clip(hi - lo, 0, None)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(x1 > x0, (y1 - y0) / (x1 - x0), 0.0)
+    ylo = y0 + slope * (lo - x0)
+    yhi = y0 + slope * (hi - x0)
+    integral = np.sum(width * (ylo + yhi) / 2, axis=-1)
+    span = np.sum(width, axis=-1)
+    return integral, np.where(span > 0, span, np.nan)
+
+
+def _thresholds(
+    low: float, high: float, lo_frac: float, hi_frac: float
+) -> Tuple[float, float]:
+    """Absolute thresholds at fractions `lo_frac` and `hi_frac` of the span from `low` to `high`."""
+    span = high - low
+    return low + lo_frac * span, low + hi_frac * span
+
+
+def _phase(h: np.ndarray) -> np.ndarray:
+    """Unwrapped phase of complex `h`, in degrees."""
+    return np.degrees(np.unwrap(np.angle(h), axis=-1))
+
+
+def _get(data: Mapping[str, np.ndarray], name: str) -> np.ndarray:
+    """Get signal `name` from `data`, matching case-insensitively. Simulators differ in signal-name case."""
+    if name in data:
+        return np.asarray(data[name])
+    lower = name.lower()
+    for k, v in data.items():
+        if k.lower() == lower:
+            return np.asarray(v)
+    raise KeyError(f"Signal {name} not found")
+
+
+def _signals(result: WaveformResult, signals: Sequence[str]) -> np.ndarray:
+    """Get `signals` from `result` as a `(nsignals, npts)` array."""
+    return np.stack([_get(result.data, s) for s in signals])
+
+
+def _dtype(results: Sequence[WaveformResult]) -> type:
+    """Data type for stacked signals: complex for AC results, float otherwise."""
+    return complex if any(isinstance(r, AcResult) for r in results) else float
+
+
+def _interp(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """Linearly interpolate `fp`, sampled at `xp`, onto `x`. Supports complex-valued `fp`."""
+    if np.iscomplexobj(fp):
+        return np.interp(x, xp, fp.real) + 1j * np.interp(x, xp, fp.imag)
+    return np.interp(x, xp, fp)
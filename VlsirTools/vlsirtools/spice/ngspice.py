@@ -6,7 +6,6 @@ NGSpice Implementation of `vlsir.spice.Sim`
 from concurrent.futures import ProcessPoolExecutor
 import subprocess, re, shutil
 from enum import Enum
-from warnings import warn
 from dataclasses import dataclass
 from typing import Mapping, IO, Dict
 import shlex
@@ -19,7 +18,17 @@ import vlsir.spice_pb2 as vsp
 from ..netlist import netlist
 from ..netlist.spice import NgspiceNetlister
 from .base import Sim
-from .sim_data import TranResult, OpResult, SimResult, AcResult, DcResult, NoiseResult
+from .telemetry import Phase
+from . import meas
+from .sim_data import (
+    TranResult,
+    OpResult,
+    SimResult,
+    AcResult,
+    DcResult,
+    NoiseResult,
+    SignalTable,
+)
 from .spice import SupportedSimulators, sim
 
 # Module-level configuration. Over-writeable by sufficiently motivated users.
@@ -37,24 +46,9 @@ class NGSpiceSim(Sim):
     State and execution logic for a NGSpice-call to `vsp.Sim`.
     """
 
-    @staticmethod
-    def available() -> bool:
-        """Boolean indication of whether the current running environment includes the simulator executable."""
-        if shutil.which(NGSPICE_EXECUTABLE) is None:
-            return False
-        try:
-            subprocess.run(
-                f"{NGSPICE_EXECUTABLE} -v",
-                shell=True,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=10,
-            )
-        except Exception:
-            # Indicate "not available" for any Exception. Usually this will be a `subprocess.CalledProcessError`.
-            return False
-        return True  # Otherwise, installation looks good.
+    @classmethod
+    def executable(cls) -> str:
+        return NGSPICE_EXECUTABLE
 
     @classmethod
     def enum(cls) -> SupportedSimulators:
@@ -64,13 +58,15 @@ class NGSpiceSim(Sim):
         """Run the specified `SimInput` in directory `self.rundir`, returning its results."""
 
         # Write the netlist
-        self.write_netlist()
+        with self.phase(Phase.NETLIST):
+            self.write_netlist()
 
         self.run_sim_process()
 
         # Handle stdout and stderr as needed
         # Parse up the results
-        return self.parse_results()
+        with self.phase(Phase.PARSE):
+            return self.parse_results()
 
     def write_netlist(self) -> None:
         """# Write our netlist to file"""
@@ -125,10 +121,11 @@ class NGSpiceSim(Sim):
 
     def parse_ac(self, an: vsp.AcInput, nutbin: "NutBinAnalysis") -> AcResult:
         # FIXME: the `mt0` and friends file names collide with tran, if they are used in the same Sim!
-        measurements = self.get_measurements("*.mt*")
+        meas_table = self.get_measurements("*.mt*")
 
-        # Pop the frequence vector out of the data
-        freq = nutbin.data.pop("frequency")
+        # Separate the frequency vector from the data
+        freq = nutbin.data["frequency"].copy()
+        data = nutbin.data.select([n for n in nutbin.data if n != "frequency"])
 
         # Nutbin format stores the frequency vector as complex numbers, along with all the complex-valued signal data.
         # NOTE: once upon a time, we checked that the imaginary part of all frequencies was zero.
@@ -140,17 +137,19 @@ class NGSpiceSim(Sim):
         return AcResult(
             analysis_name=an.analysis_name,
             freq=freq,
-            data=nutbin.data,
-            measurements=measurements,
+            data=data,
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def parse_dc(self, an: vsp.DcInput, nutbin: "NutBinAnalysis") -> DcResult:
-        measurements = self.get_measurements("*.ms*")
+        meas_table = self.get_measurements("*.ms*")
         return DcResult(
             analysis_name=an.analysis_name,
             indep_name=an.indep_name,
             data=nutbin.data,
-            measurements=measurements,
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def parse_op(self, an: vsp.OpInput, nutbin: "NutBinAnalysis") -> OpResult:
@@ -161,9 +160,12 @@ class NGSpiceSim(Sim):
 
     def parse_tran(self, an: vsp.TranInput, nutbin: "NutBinAnalysis") -> TranResult:
         """Extract the results for Analysis `an` from `data`."""
-        measurements = self.get_measurements("*.mt*")
+        meas_table = self.get_measurements("*.mt*")
         return TranResult(
-            analysis_name=an.analysis_name, data=nutbin.data, measurements=measurements
+            analysis_name=an.analysis_name,
+            data=self.resample(nutbin.data),
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def parse_noise(
@@ -185,17 +187,10 @@ class NGSpiceSim(Sim):
             measurements={},
         )
 
-    def get_measurements(self, filepat: str) -> Dict[str, float]:
-        """Get the measurements at files matching (glob) `filepat`.
-        Returns only a single files-worth of measurements, and issues a warning if more than one such file exists.
+    def get_measurements(self, filepat: str) -> meas.MeasTable:
+        """Get the measurements in all files matching (glob) `filepat`, as columnar arrays of all their rows.
         Returns an empty dictionary if no matching files are found."""
-        meas_files = list(self.glob(filepat))
-        if not meas_files:
-            return dict()
-        if len(meas_files) > 1:
-            msg = f"Unsupported: more than one measurement-file generated. Only the first will be read"
-            warn(msg)
-        return parse_mt0(self.open(meas_files[0], "r"))
+        return meas.read_files(self.glob(filepat), meas.parse_mt0)
 
     def run_sim_process(self) -> None:
         """Run a NGSpice sub-process, executing the simulation"""
@@ -258,7 +253,7 @@ class NutBinAnalysis:
 
     analysis_name: str  # Analysis name
     numtype: NumType  # Numeric type in `data` field
-    data: Mapping[str, np.ndarray]  # Signal name => data
+    data: SignalTable  # Signal name => data
     units: Mapping[str, Units]  # Signal name => units
 
 
@@ -370,11 +365,12 @@ def parse_nutbin_analysis(f: IO, plotname: str) -> NutBinAnalysis:
     bin_data = np.fromfile(
         f, dtype=np.dtype(nptype).newbyteorder("<"), count=num_vars * num_pts
     )
-    data = {}
-    units = {}
-    for i, var in enumerate(var_specs):
-        data[var.name] = bin_data[i::num_vars]
-        units[var.name] = var.units
+    # Points are stored interleaved, i.e. point-major. Transpose them into a signal-major `SignalTable`,
+    # converting to native byte-order in the same copy.
+    names = [var.name for var in var_specs]
+    array = bin_data.reshape(num_pts, num_vars).T.astype(nptype, order="C")
+    data = SignalTable(names=names, array=array)
+    units = {var.name: var.units for var in var_specs}
 
     return NutBinAnalysis(
         analysis_name=sim_name,
@@ -394,20 +390,6 @@ def _read_var_spec(line: str) -> VarSpec:
 
 
 def parse_mt0(file: IO) -> Dict[str, float]:
-    """Parse an (open) "mt0-format" measurement-file into a set of {name: value} pairs."""
-
-    file.readline()  # Header
-    file.readline()  # Netlist Title
-    keys = file.readline()  # Measurement Names Line
-    keys = keys.split()
-    values = file.readline()  # Measurement Values Line
-
-    def convert(s: str) -> float:
-        """Convert a string to a float, converting failing cases to `NaN`"""
-        try:
-            return float(s)
-        except:
-            return float("NaN")
-
-    values = [convert(s) for s in values.split()]
-    return dict(zip(keys, values))
+    """Parse an (open) "mt0-format" measurement-file into a set of {name: value} pairs, from its first row.
+    See `meas.parse_mt0` for all rows."""
+    return meas.first_row(meas.parse_mt0(file))
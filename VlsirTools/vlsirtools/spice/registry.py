@@ -0,0 +1,175 @@
+"""
+# Simulator Registry
+
+Process-wide record of which `SupportedSimulators` are available, and at which versions.
+
+Each simulator is probed at most once per process, generally on the first call to its `available()` method.
+Probing consists of finding its executable on the path, and running it with its "version" flag.
+Successful probes can optionally be persisted to a small JSON cache-file,
+keyed by executable path and modification time, so that later processes skip the `subprocess` calls altogether.
+
+The cache-file is disabled by default. Enable it by setting either:
+* The `VLSIRTOOLS_SIM_CACHE` environment variable, or
+* The module-level `CACHE_PATH` attribute
+to the desired file path.
+"""
+
+# Std-Lib Imports
+import os, re, json, shutil, subprocess, threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple, Sequence
+
+# Local/ Project Dependencies
+from .spice import SupportedSimulators
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+
+# Path to the persistent probe-cache file. `None` disables persistence.
+CACHE_PATH: Optional[os.PathLike] = os.environ.get("VLSIRTOOLS_SIM_CACHE", None)
+# Timeout for each version-probing subprocess, in seconds.
+PROBE_TIMEOUT: float = 10
+
+
+@dataclass
+class SimulatorInfo:
+    """# Probed Simulator Information"""
+
+    simulator: SupportedSimulators  # Which simulator
+    available: bool  # Boolean indication of availability in this environment
+    path: Optional[str] = None  # Resolved executable path, if found
+    mtime: Optional[float] = None  # Executable modification time, if found
+    version: Optional[str] = None  # Version string, if available
+
+    def to_json(self) -> Dict:
+        """Convert to a JSON-compatible dictionary, for the cache-file."""
+        return dict(
+            available=self.available,
+            path=self.path,
+            mtime=self.mtime,
+            version=self.version,
+        )
+
+
+# Probed results, keyed by (simulator, executable).
+# Including the executable in the key re-probes if a user over-rides the module-level `*_EXECUTABLE` setting.
+_probed: Dict[Tuple[SupportedSimulators, str], SimulatorInfo] = dict()
+_lock = threading.Lock()
+
+
+def get(simulator: SupportedSimulators) -> SimulatorInfo:
+    """Get the `SimulatorInfo` for `simulator`, probing it if this process has not yet done so."""
+
+    cls = simulator.sim_class()
+    executable = cls.executable()
+    key = (simulator, executable)
+    with _lock:
+        info = _probed.get(key, None)
+        if info is None:
+            info = _probe(simulator, executable, cls.version_args)
+            _probed[key] = info
+        return info
+
+
+def available(simulator: SupportedSimulators) -> bool:
+    """Boolean indication of whether `simulator` is available in this environment."""
+    return get(simulator).available
+
+
+def versions() -> Dict[SupportedSimulators, str]:
+    """Get the versions of each available simulator.
+    Unavailable simulators are not included."""
+    infos = [get(s) for s in SupportedSimulators]
+    return {i.simulator: i.version for i in infos if i.available}
+
+
+def clear() -> None:
+    """Clear all probe results, both in-process and in the cache-file (if enabled).
+    Subsequent calls to `get` will re-probe each simulator."""
+    with _lock:
+        _probed.clear()
+        if CACHE_PATH is not None and Path(CACHE_PATH).exists():
+            Path(CACHE_PATH).unlink()
+
+
+def _probe(
+    simulator: SupportedSimulators, executable: str, version_args: Sequence[str]
+) -> SimulatorInfo:
+    """Probe `simulator`, first checking the cache-file, and running its executable if necessary."""
+
+    path = shutil.which(executable)
+    if path is None:
+        return SimulatorInfo(simulator=simulator, available=False)
+    mtime = os.stat(path).st_mtime
+
+    # Check for a cached result from this same executable
+    cached = _load_cache().get(simulator.value, None)
+    if cached is not None and cached["path"] == path and cached["mtime"] == mtime:
+        return SimulatorInfo(simulator=simulator, **cached)
+
+    try:
+        # Check that we can get its version without croaking.
+        # This can often fail because of an inaccessible license server, or just a badly-linked installation.
+        proc = subprocess.run(
+            [path, *version_args],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=PROBE_TIMEOUT,
+        )
+    except Exception:
+        # Indicate "not available" for any Exception. Usually this will be a `subprocess.CalledProcessError`.
+        # Note these failures are *not* persisted to the cache-file, as they are often transient.
+        return SimulatorInfo(
+            simulator=simulator, available=False, path=path, mtime=mtime
+        )
+
+    info = SimulatorInfo(
+        simulator=simulator,
+        available=True,
+        path=path,
+        mtime=mtime,
+        version=_parse_version(proc.stdout + proc.stderr),
+    )
+    _store_cache(info)
+    return info
+
+
+def _parse_version(output: bytes) -> Optional[str]:
+    """Extract a version number from simulator version-output `output`.
+    Returns the first dotted-number sequence, e.g. "7.6.0" from "Xyce Release 7.6.0", or `None` if there is none.
+    """
+    m = re.search(r"\d+(\.\d+)*", output.decode("utf-8", errors="replace"))
+    if m is None:
+        return None
+    return m.group(0)
+
+
+def _load_cache() -> Dict[str, Dict]:
+    """Load the cache-file content, or an empty dictionary if it is disabled, missing, or invalid."""
+    if CACHE_PATH is None:
+        return dict()
+    try:
+        with open(CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return dict()
+
+
+def _store_cache(info: SimulatorInfo) -> None:
+    """Add `info` to the cache-file, if enabled."""
+    if CACHE_PATH is None:
+        return
+    content = _load_cache()
+    content[info.simulator.value] = info.to_json()
+
+    # Write to a temporary file and rename it into place, so that concurrent processes never read a partial file.
+    path = Path(CACHE_PATH)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump(content, f, indent=2)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Persistence is strictly an optimization; failing to write is not an error.
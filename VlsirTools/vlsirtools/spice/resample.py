@@ -0,0 +1,167 @@
+"""
+# Transient Waveform Resampling
+
+Reduces transient results, which generally include every simulator time-step, to a requested resolution.
+Enabled by setting `SimOptions.resample` to a `Resample` specification, and applied once each result is read.
+Note resampling runs on the fully-parsed result, and does not reduce peak memory while parsing.
+It reduces the size of the results returned, and of everything downstream of them, e.g. exports and plots.
+
+All methods produce a single time-axis shared by every signal, and are vectorized across signals:
+* `INTERPOLATE` - linear interpolation onto a uniform grid
+* `MINMAX` - per-bucket minimum and maximum, preserving peaks and edges
+* `LTTB` - "largest triangle three buckets" downsampling, preserving visual shape.
+  Each output point is chosen to best preserve *all* signals, each normalized by its range.
+"""
+
+# Std-Lib Imports
+from enum import Enum
+from typing import Optional
+from dataclasses import dataclass
+
+# PyPi Imports
+import numpy as np
+
+# Local/ Project Dependencies
+from .sim_data import SignalTable
+
+
+class ResampleMethod(Enum):
+    """Enumerated Resampling Methods"""
+
+    INTERPOLATE = "interpolate"
+    MINMAX = "minmax"
+    LTTB = "lttb"
+
+
+@dataclass
+class Resample:
+    """# Transient Resampling Specification
+    Exactly one of `npts` and `tstep` is required. `tstep` is only valid for `INTERPOLATE`.
+    """
+
+    method: ResampleMethod = ResampleMethod.INTERPOLATE
+    npts: Optional[int] = None  # Number of output points
+    tstep: Optional[float] = None  # Uniform output time-step
+
+    def __post_init__(self):
+        if (self.npts is None) == (self.tstep is None):
+            raise ValueError("Resample requires exactly one of `npts` and `tstep`")
+        if self.tstep is not None and self.method != ResampleMethod.INTERPOLATE:
+            raise ValueError("Resample `tstep` is only valid for INTERPOLATE")
+        if self.npts is not None and self.npts < 3:
+            raise ValueError("Resample `npts` must be at least 3")
+
+    def apply(self, data: SignalTable) -> SignalTable:
+        """Resample transient data `data`. Returns `data` itself if it is already small enough."""
+        if not len(data) or data.num_points < 3:
+            return data
+        t = data[time_name(data)]
+        if self.method == ResampleMethod.INTERPOLATE:
+            if self.tstep is not None:
+                npts = int(np.floor((t[-1] - t[0]) / self.tstep + 1e-9)) + 1
+                tnew = t[0] + self.tstep * np.arange(npts)
+            else:
+                tnew = np.linspace(t[0], t[-1], self.npts)
+            return interpolate(data, tnew)
+        if self.npts >= len(t):
+            return data
+        if self.method == ResampleMethod.MINMAX:
+            return minmax(data, self.npts)
+        if self.method == ResampleMethod.LTTB:
+            return lttb(data, self.npts)
+        raise ValueError(f"Invalid ResampleMethod {self.method}")
+
+
+def time_name(data: SignalTable) -> str:
+    """Get the name of the time-signal in `data`. Simulators differ in its case.
+    Falls back to the first signal, which is generally time."""
+    for name in data.names:
+        if name.lower() == "time":
+            return name
+    return data.names[0]
+
+
+def interpolate(data: SignalTable, tnew: np.ndarray) -> SignalTable:
+    """Linearly interpolate every signal in `data` onto time-points `tnew`."""
+    tname = time_name(data)
+    t = data[tname]
+    # Find the segment including each new point, and its fractional position within it
+    idx = np.clip(np.searchsorted(t, tnew, side="right") - 1, 0, len(t) - 2)
+    dt = t[idx + 1] - t[idx]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = np.where(dt > 0, (tnew - t[idx]) / dt, 0.0)
+    a = data.array
+    array = a[:, idx] + frac * (a[:, idx + 1] - a[:, idx])
+    array[data.index[tname]] = tnew
+    return SignalTable(names=data.names, array=array)
+
+
+def minmax(data: SignalTable, npts: int) -> SignalTable:
+    """Reduce `data` to `npts` points by bucketing, and keeping each bucket's minimum and maximum.
+    Each bucket produces two points, at its first and last time-steps.
+    The minimum and maximum are ordered per signal, following the direction of its change across the bucket.
+    For odd `npts`, the first point is kept as-is, and the remainder bucketed.
+    """
+    tname = time_name(data)
+    a = data.array
+    n = a.shape[1]
+    nbuckets = npts // 2
+    offset = npts % 2  # Leading point kept as-is
+    starts = offset + np.linspace(0, n - offset, nbuckets + 1).astype(int)[:-1]
+    ends = np.append(starts[1:], n) - 1
+
+    lo = np.minimum.reduceat(a, starts, axis=1)
+    hi = np.maximum.reduceat(a, starts, axis=1)
+    rising = a[:, ends] >= a[:, starts]
+    first = np.where(rising, lo, hi)
+    last = np.where(rising, hi, lo)
+
+    # Interleave the first and last points of each bucket, after any leading point
+    array = np.empty((a.shape[0], npts), dtype=a.dtype)
+    array[:, :offset] = a[:, :offset]
+    array[:, offset::2] = first
+    array[:, offset + 1 :: 2] = last
+    t = data[tname]
+    array[data.index[tname], offset::2] = t[starts]
+    array[data.index[tname], offset + 1 :: 2] = t[ends]
+    return SignalTable(names=data.names, array=array)
+
+
+def lttb(data: SignalTable, npts: int) -> SignalTable:
+    """Reduce `data` to `npts` points via "largest triangle three buckets" downsampling.
+    Always keeps the first and last points. Between them, selects the point in each bucket
+    which forms the largest total triangle-area with the previously selected point and the next bucket's average,
+    summed across all signals after normalizing each by its range."""
+    tname = time_name(data)
+    t = data[tname]
+    others = [i for i, name in enumerate(data.names) if name != tname]
+    y = data.array[others]
+    n = len(t)
+
+    # Normalize each signal by its range, so that each contributes comparably
+    span = np.ptp(y, axis=1, keepdims=True)
+    y = (y - y.min(axis=1, keepdims=True)) / np.where(span > 0, span, 1.0)
+    x = (t - t[0]) / (t[-1] - t[0]) if t[-1] > t[0] else np.zeros_like(t)
+
+    # Bucket boundaries, excluding the first and last points
+    edges = np.floor(np.linspace(1, n - 1, npts - 1)).astype(int)
+    selected = np.empty(npts, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(npts - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # Average of the next bucket, or the last point for the final bucket
+        if i < npts - 3:
+            nlo, nhi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x = x[nlo:nhi].mean()
+            avg_y = y[:, nlo:nhi].mean(axis=1, keepdims=True)
+        else:
+            avg_x, avg_y = x[-1], y[:, -1:]
+        area = np.abs(
+            (x[a] - avg_x) * (y[:, lo:hi] - y[:, a : a + 1])
+            - (x[a] - x[lo:hi]) * (avg_y - y[:, a : a + 1])
+        ).sum(axis=0)
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return SignalTable(names=data.names, array=data.array[:, selected])
@@ -5,13 +5,15 @@ A mirror of Spice Proto's Analysis Result objects for in-Python usage,
 using python data classes and numpy arrays.
 
 Also provides round-tripping utilities between the two.
-TODO: Go from proto -> sim_result
+Signal data can be converted either to VLSIR's `repeated` numeric fields,
+or to its densely-packed `BinaryArray`s, which convert to and from numpy without per-element work.
 """
 
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Mapping, Union, ClassVar, Dict, Optional
+from collections.abc import MutableMapping
+from typing import List, Mapping, Union, ClassVar, Dict, Optional, Sequence, Iterator
 
 import numpy as np
 
@@ -32,6 +34,147 @@ class AnalysisType(Enum):
     CUSTOM = "custom"
 
 
+# Mapping between VLSIR `BinaryArray` element-types and (little-endian) numpy dtypes
+_BINARY_DTYPES = {
+    vsp.BinaryArray.FLOAT64: np.dtype("<f8"),
+    vsp.BinaryArray.COMPLEX128: np.dtype("<c16"),
+}
+
+
+def to_binary_array(array: np.ndarray) -> vsp.BinaryArray:
+    """Convert `array` to a VLSIR `BinaryArray`.
+    Complex-valued arrays are stored as `COMPLEX128`, all others as `FLOAT64`."""
+    array = np.asarray(array)
+    dtype = (
+        vsp.BinaryArray.COMPLEX128
+        if np.iscomplexobj(array)
+        else vsp.BinaryArray.FLOAT64
+    )
+    data = np.ascontiguousarray(array, dtype=_BINARY_DTYPES[dtype]).tobytes()
+    return vsp.BinaryArray(dtype=dtype, shape=array.shape, data=data)
+
+
+def from_binary_array(proto: vsp.BinaryArray) -> np.ndarray:
+    """Convert a VLSIR `BinaryArray` to a numpy array.
+    The result is a read-only view of the proto's data, converted to native byte-order only where necessary."""
+    array = np.frombuffer(proto.data, dtype=_BINARY_DTYPES[proto.dtype])
+    array = array.reshape(tuple(proto.shape))
+    return array.astype(array.dtype.newbyteorder("="), copy=False)
+
+
+def _table_from_proto(
+    signals: Sequence[str], data: np.ndarray, binary: vsp.BinaryArray
+) -> "SignalTable":
+    """Get the `SignalTable` of a result-proto with signal-names `signals`,
+    from either its `binary_data` field if set, or its `repeated` field `data` otherwise."""
+    if not signals:
+        return SignalTable(names=[], array=np.empty((0, 0)))
+    if binary.data:
+        array = from_binary_array(binary)
+    else:
+        array = np.asarray(data).reshape(len(signals), -1)
+    return SignalTable(names=list(signals), array=array)
+
+
+class SignalTable(MutableMapping):
+    """# Columnar Signal Data
+
+    Stores a set of equal-length signals as one contiguous `(num_signals, num_points)` array, plus a name index.
+    Behaves as a `Dict[str, np.ndarray]` for compatibility, in which each value is a zero-copy row of `array`.
+
+    `select` and `window` produce sub-tables by signal-name and by independent-axis range,
+    without copying wherever the selected rows are contiguous.
+    Adding or removing signals copies the array, and is comparatively slow.
+
+    Sub-tables share their parent's data until written. Assigning a signal of a table whose `array` is a view
+    of another, e.g. a sub-table, first copies the array, so that neither table's writes affect the other.
+    Note modifying the arrays returned by `__getitem__` in place, e.g. `table["out"][0] = 0`, does not copy.
+    """
+
+    def __init__(self, names: Sequence[str], array: np.ndarray) -> None:
+        array = np.asanyarray(array)  # Note preserves sub-classes, e.g. `np.memmap`
+        if array.ndim != 2 or array.shape[0] != len(names):
+            msg = f"Invalid SignalTable array shape {array.shape} for {len(names)} signals"
+            raise ValueError(msg)
+        self.names: List[str] = list(names)
+        self.array: np.ndarray = array
+        self.index: Dict[str, int] = {name: idx for idx, name in enumerate(names)}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, np.ndarray]) -> "SignalTable":
+        """Create from a dictionary of equal-length signals.
+        Returns `data` itself if it is already a `SignalTable`."""
+        if isinstance(data, SignalTable):
+            return data
+        if not data:
+            return cls(names=[], array=np.empty((0, 0)))
+        return cls(names=list(data.keys()), array=np.stack(list(data.values())))
+
+    @property
+    def num_points(self) -> int:
+        return self.array.shape[1]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.array[self.index[name]]
+
+    def __setitem__(self, name: str, value: np.ndarray) -> None:
+        if name in self.index:  # Over-write in place, after copying any shared data
+            if not self.array.flags.owndata:
+                self.array = np.array(self.array)
+            self.array[self.index[name]] = value
+            return
+        # Add a new row. Note this copies the array.
+        value = np.asarray(value)
+        if not self.names:
+            self.array = value.reshape(1, -1).copy()
+        else:
+            self.array = np.concatenate([self.array, value.reshape(1, -1)])
+        self.index[name] = len(self.names)
+        self.names.append(name)
+
+    def __delitem__(self, name: str) -> None:
+        # Remove a row. Note this copies the array.
+        idx = self.index[name]
+        self.array = np.delete(self.array, idx, axis=0)
+        self.names.pop(idx)
+        self.index = {name: idx for idx, name in enumerate(self.names)}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"SignalTable(names={self.names}, shape={self.array.shape})"
+
+    def select(self, names: Sequence[str]) -> "SignalTable":
+        """Get a sub-table of signals `names`, in order.
+        Zero-copy if they are contiguous, in-order rows; copied otherwise."""
+        rows = [self.index[name] for name in names]
+        if rows and rows == list(range(rows[0], rows[0] + len(rows))):
+            return SignalTable(names, self.array[rows[0] : rows[0] + len(rows)])
+        return SignalTable(names, self.array[rows])
+
+    def window(
+        self,
+        start: Optional[float] = None,
+        stop: Optional[float] = None,
+        axis: Optional[str] = None,
+    ) -> "SignalTable":
+        """Get a zero-copy sub-table of the points at which independent-axis signal `axis` is between `start` and `stop`.
+        `axis` must be monotonically increasing. Defaults to the first signal, generally time or frequency."""
+        x = self[axis] if axis is not None else self.array[0]
+        x = x.real
+        lo = 0 if start is None else int(np.searchsorted(x, start, side="left"))
+        hi = len(x) if stop is None else int(np.searchsorted(x, stop, side="right"))
+        return SignalTable(self.names, self.array[:, lo:hi])
+
+    def flat(self) -> np.ndarray:
+        """Get all data as a flat, signal-major array. Zero-copy if `array` is contiguous."""
+        return self.array.ravel()
+
+
 @dataclass
 class OpResult:
     analysis_name: str
@@ -45,57 +188,120 @@ class OpResult:
             res.data.append(v)
         return res
 
+    @classmethod
+    def from_proto(cls, proto: vsp.OpResult) -> "OpResult":
+        return cls(
+            analysis_name=proto.analysis_name,
+            data=dict(zip(proto.signals, proto.data)),
+        )
+
 
 @dataclass
 class DcResult:
     analysis_name: str
     indep_name: str
-    data: Mapping[str, np.ndarray]
+    data: Mapping[str, np.ndarray]  # Stored as a `SignalTable`
     measurements: Mapping[str, float]
+    measurement_table: Mapping[str, np.ndarray] = field(
+        default_factory=dict, compare=False
+    )  # All rows of measurement data, per measurement name
     vlsir_type: ClassVar[AnalysisType] = AnalysisType.DC
 
-    def to_proto(self) -> vsp.DcResult:
-        res = vsp.DcResult(analysis_name=self.analysis_name, indep_name=self.indep_name)
-        for k, v in self.data.items():
-            res.signals.append(k)
-            for d in v:
-                res.data.append(d)
-        # TODO Add support for measurements
+    def __post_init__(self):
+        self.data = SignalTable.from_dict(self.data)
+
+    def to_proto(self, binary: bool = False) -> vsp.DcResult:
+        """Convert to a VLSIR `DcResult` proto object.
+        If `binary` is set, data is stored in its `binary_data` field, rather than `repeated` field `data`."""
+        res = vsp.DcResult(
+            analysis_name=self.analysis_name,
+            indep_name=self.indep_name,
+            measurements=self.measurements,
+        )
+        res.signals.extend(self.data.names)
+        if binary:
+            res.binary_data.CopyFrom(to_binary_array(self.data.array))
+        else:
+            res.data.extend(self.data.flat())
         return res
 
+    @classmethod
+    def from_proto(cls, proto: vsp.DcResult) -> "DcResult":
+        return cls(
+            analysis_name=proto.analysis_name,
+            indep_name=proto.indep_name,
+            data=_table_from_proto(proto.signals, proto.data, proto.binary_data),
+            measurements=dict(proto.measurements),
+        )
+
 
 @dataclass
 class TranResult:
     analysis_name: str
-    data: Mapping[str, np.ndarray]
+    data: Mapping[str, np.ndarray]  # Stored as a `SignalTable`
     measurements: Mapping[str, float]
+    measurement_table: Mapping[str, np.ndarray] = field(
+        default_factory=dict, compare=False
+    )  # All rows of measurement data, per measurement name
     vlsir_type: ClassVar[AnalysisType] = AnalysisType.TRAN
 
-    def to_proto(self) -> vsp.TranResult:
-        res = vsp.TranResult(analysis_name=self.analysis_name)
-        for k, v in self.data.items():
-            res.signals.append(k)
-            for d in v:
-                res.data.append(d)
-        # TODO Add support for measurements
+    def __post_init__(self):
+        self.data = SignalTable.from_dict(self.data)
+
+    def to_proto(self, binary: bool = False) -> vsp.TranResult:
+        """Convert to a VLSIR `TranResult` proto object.
+        If `binary` is set, data is stored in its `binary_data` field, rather than `repeated` field `data`."""
+        res = vsp.TranResult(
+            analysis_name=self.analysis_name, measurements=self.measurements
+        )
+        res.signals.extend(self.data.names)
+        if binary:
+            res.binary_data.CopyFrom(to_binary_array(self.data.array))
+        else:
+            res.data.extend(self.data.flat())
         return res
 
+    @classmethod
+    def from_proto(cls, proto: vsp.TranResult) -> "TranResult":
+        return cls(
+            analysis_name=proto.analysis_name,
+            data=_table_from_proto(proto.signals, proto.data, proto.binary_data),
+            measurements=dict(proto.measurements),
+        )
+
 
 @dataclass
 class AcResult:
     analysis_name: str  # Analysis name
     freq: np.ndarray  # Real/ float-valued frequency data
-    data: Mapping[str, np.ndarray]  # Complex-valued signal data
+    # Complex-valued signal data, stored as a `SignalTable`
+    data: Mapping[str, np.ndarray]
     measurements: Mapping[str, float]  # Measurement data
+    measurement_table: Mapping[str, np.ndarray] = field(
+        default_factory=dict, compare=False
+    )  # All rows of measurement data, per measurement name
     vlsir_type: ClassVar[AnalysisType] = AnalysisType.AC
 
-    def to_proto(self) -> vsp.AcResult:
-        """Convert to a VLSIR `AcResult` proto object
-        Primarily "flattens" the complex-valued data into a single list."""
+    def __post_init__(self):
+        self.data = SignalTable.from_dict(self.data)
 
-        data: List[vsp.ComplexNum] = []
-        for v in self.data.values():
-            data.extend([vsp.ComplexNum(re=c.real, im=c.imag) for c in v])
+    def to_proto(self, binary: bool = False) -> vsp.AcResult:
+        """Convert to a VLSIR `AcResult` proto object
+        Primarily "flattens" the complex-valued data into a single list.
+        If `binary` is set, data and frequencies are instead stored in `BinaryArray`s,
+        avoiding a `ComplexNum` sub-message per point."""
+
+        if binary:
+            return vsp.AcResult(
+                analysis_name=self.analysis_name,
+                binary_freq=to_binary_array(self.freq),
+                signals=list(self.data.keys()),
+                binary_data=to_binary_array(self.data.array.astype(complex)),
+                measurements=self.measurements,
+            )
+
+        flat = self.data.flat()
+        data = [vsp.ComplexNum(re=r, im=i) for r, i in zip(flat.real, flat.imag)]
 
         return vsp.AcResult(
             analysis_name=self.analysis_name,
@@ -105,6 +311,20 @@ class AcResult:
             measurements=self.measurements,
         )
 
+    @classmethod
+    def from_proto(cls, proto: vsp.AcResult) -> "AcResult":
+        if proto.binary_freq.data:
+            freq = from_binary_array(proto.binary_freq)
+        else:
+            freq = np.array(proto.freq)
+        data = np.array([complex(c.re, c.im) for c in proto.data], dtype=complex)
+        return cls(
+            analysis_name=proto.analysis_name,
+            freq=freq,
+            data=_table_from_proto(proto.signals, data, proto.binary_data),
+            measurements=dict(proto.measurements),
+        )
+
 
 @dataclass
 class NoiseResult:
@@ -143,6 +363,13 @@ class CustomAnalysisResult:
 
     vlsir_type: ClassVar[AnalysisType] = AnalysisType.CUSTOM
 
+    def to_proto(self) -> vsp.CustomAnalysisResult:
+        return vsp.CustomAnalysisResult()
+
+    @classmethod
+    def from_proto(cls, proto: vsp.CustomAnalysisResult) -> "CustomAnalysisResult":
+        return cls()
+
 
 # Type alias for the union of each result-type
 AnalysisResult = Union[
@@ -209,6 +436,10 @@ class SimResult:
     an: List[AnalysisResult] = field(default_factory=list)
     # List of per-analysis results, in the same order specified in `SimInput.an`.
 
+    telemetry: Optional["SimTelemetry"] = field(default=None, compare=False)
+    # Timing and resource-usage of the simulation which produced these results, if available.
+    # A `vlsirtools.spice.telemetry.SimTelemetry`. Not included in conversions to proto.
+
     def __post_init__(self):
         # Our multi-indexed table of results.
         # Unset until accessed with `get or __getitem__`
@@ -228,10 +459,35 @@ class SimResult:
             self.index()
         return self._table.get(key)
 
-    def to_proto(self) -> vsp.SimResult:
-        """Convert to a VLSIR `SimResult` proto object."""
+    def to_proto(self, binary: bool = False) -> vsp.SimResult:
+        """Convert to a VLSIR `SimResult` proto object.
+        If `binary` is set, signal data is stored in `BinaryArray`s, rather than `repeated` numeric fields."""
         res = vsp.SimResult()
         for an in self.an:
-            ar = vsp.AnalysisResult(**{an.vlsir_type.value: an.to_proto()})
+            if isinstance(an, (DcResult, TranResult, AcResult)):
+                proto = an.to_proto(binary=binary)
+            else:
+                proto = an.to_proto()
+            ar = vsp.AnalysisResult(**{an.vlsir_type.value: proto})
             res.an.append(ar)
         return res
+
+    @classmethod
+    def from_proto(cls, proto: vsp.SimResult) -> "SimResult":
+        """Create from a VLSIR `SimResult` proto object, with signal data in either `repeated` or `BinaryArray` fields."""
+        return cls(an=[analysis_result_from_proto(ar) for ar in proto.an])
+
+
+def analysis_result_from_proto(proto: vsp.AnalysisResult) -> AnalysisResult:
+    """Convert a VLSIR `AnalysisResult` proto-union to its `sim_data` equivalent."""
+    converters = {
+        AnalysisType.OP: OpResult,
+        AnalysisType.DC: DcResult,
+        AnalysisType.TRAN: TranResult,
+        AnalysisType.AC: AcResult,
+        AnalysisType.CUSTOM: CustomAnalysisResult,
+    }
+    tp = AnalysisType(proto.WhichOneof("an"))
+    if tp not in converters:
+        raise NotImplementedError(f"Import of {tp} results is not supported")
+    return converters[tp].from_proto(getattr(proto, tp.value))
@@ -7,14 +7,22 @@ import subprocess, re, shutil, glob, shlex
 import numpy as np
 from typing import Tuple, Any, Mapping, Optional, IO, Dict
 from dataclasses import dataclass
-from warnings import warn
 from enum import Enum
 
 # Local/ Project Dependencies
 import vlsir.spice_pb2 as vsp
 from ..netlist.spectre import SpectreNetlister
 from .base import Sim
-from .sim_data import TranResult, OpResult, SimResult, AcResult, DcResult
+from .telemetry import Phase
+from . import meas
+from .sim_data import (
+    TranResult,
+    OpResult,
+    SimResult,
+    AcResult,
+    DcResult,
+    SignalTable,
+)
 from .spice import SupportedSimulators, sim
 
 # Module-level configuration. Over-writeable by sufficiently motivated users.
@@ -34,26 +42,12 @@ class SpectreSim(Sim):
     State and execution logic for a Spectre-call to `vsp.Sim`.
     """
 
-    @staticmethod
-    def available() -> bool:
-        """Boolean indication of whether the current running environment includes the simulator executable."""
-        if shutil.which(SPECTRE_EXECUTABLE) is None:
-            return False
-        try:
-            # And if it's set, check that we can get its version without croaking.
-            # This can often happen because of an inaccessible license server, or just a badly-linked installation.
-            subprocess.run(
-                f"{SPECTRE_EXECUTABLE} -V",  # Yes, "version" gets a capital "V" for this program (ascii shrug)
-                shell=True,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=10,
-            )
-        except Exception:
-            # Indicate "not available" for any Exception. Usually this will be a `subprocess.CalledProcessError`.
-            return False
-        return True  # Otherwise, installation looks good.
+    # Yes, "version" gets a capital "V" for this program (ascii shrug)
+    version_args = ("-V",)
+
+    @classmethod
+    def executable(cls) -> str:
+        return SPECTRE_EXECUTABLE
 
     @classmethod
     def enum(cls) -> SupportedSimulators:
@@ -63,13 +57,15 @@ class SpectreSim(Sim):
         """Run the specified `SimInput` in directory `self.rundir`, returning its results."""
 
         # Write our netlist to file
-        self.write_netlist()
+        with self.phase(Phase.NETLIST):
+            self.write_netlist()
 
         # Run the simulation
         self.run_spectre_process()
 
         # Parse the results
-        return self.parse_results()
+        with self.phase(Phase.PARSE):
+            return self.parse_results()
 
     def write_netlist(self) -> None:
         """# Write our netlist to file"""
@@ -106,10 +102,11 @@ class SpectreSim(Sim):
 
     def parse_ac(self, an: vsp.AcInput, nutbin: "NutBinAnalysis") -> AcResult:
         # FIXME: the `mt0` and friends file names collide with tran, if they are used in the same Sim!
-        measurements = self.get_measurements("*.mt*")
+        meas_table = self.get_measurements("*.mt*")
 
-        # Pop the frequence vector out of the data
-        freq = nutbin.data.pop("freq")
+        # Separate the frequency vector from the data
+        freq = nutbin.data["freq"].copy()
+        data = nutbin.data.select([n for n in nutbin.data if n != "freq"])
         # Nutbin format stores the frequency vector as complex numbers, along with all the complex-valued signal data.
         # Grab the real parts of the frequencies, and ensure that they don't (somehow) have nonzero imaginary parts.
         if np.any(freq.imag):
@@ -119,17 +116,19 @@ class SpectreSim(Sim):
         return AcResult(
             analysis_name=an.analysis_name,
             freq=freq,
-            data=nutbin.data,
-            measurements=measurements,
+            data=data,
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def parse_dc(self, an: vsp.DcInput, nutbin: "NutBinAnalysis") -> DcResult:
-        measurements = self.get_measurements("*.ms*")
+        meas_table = self.get_measurements("*.ms*")
         return DcResult(
             analysis_name=an.analysis_name,
             indep_name=an.indep_name,
             data=nutbin.data,
-            measurements=measurements,
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def parse_op(self, an: vsp.OpInput, nutbin: "NutBinAnalysis") -> OpResult:
@@ -140,22 +139,18 @@ class SpectreSim(Sim):
 
     def parse_tran(self, an: vsp.TranInput, nutbin: "NutBinAnalysis") -> TranResult:
         """Extract the results for Analysis `an` from `data`."""
-        measurements = self.get_measurements("*.mt*")
+        meas_table = self.get_measurements("*.mt*")
         return TranResult(
-            analysis_name=an.analysis_name, data=nutbin.data, measurements=measurements
+            analysis_name=an.analysis_name,
+            data=self.resample(nutbin.data),
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
-    def get_measurements(self, filepat: str) -> Dict[str, float]:
-        """Get the measurements at files matching (glob) `filepat`.
-        Returns only a single files-worth of measurements, and issues a warning if more than one such file exists.
+    def get_measurements(self, filepat: str) -> meas.MeasTable:
+        """Get the measurements in all files matching (glob) `filepat`, as columnar arrays of all their rows.
         Returns an empty dictionary if no matching files are found."""
-        meas_files = list(self.glob(filepat))
-        if not meas_files:
-            return dict()
-        if len(meas_files) > 1:
-            msg = f"Unsupported: more than one measurement-file generated. Only the first will be read"
-            warn(msg)
-        return parse_mt0(self.open(meas_files[0], "r"))
+        return meas.read_files(self.glob(filepat), meas.parse_mt0)
 
     def run_spectre_process(self) -> None:
         """Run a Spectre sub-process, executing the simulation"""
@@ -213,7 +208,7 @@ class NutBinAnalysis:
 
     analysis_name: str  # Analysis name
     numtype: NumType  # Numeric type in `data` field
-    data: Mapping[str, np.ndarray]  # Signal name => data
+    data: SignalTable  # Signal name => data
     units: Mapping[str, Units]  # Signal name => units
 
 
@@ -322,11 +317,12 @@ def parse_nutbin_analysis(f: IO, plotname: str) -> NutBinAnalysis:
     bin_data = np.fromfile(
         f, dtype=np.dtype(nptype).newbyteorder(">"), count=num_vars * num_pts
     )
-    data = {}
-    units = {}
-    for i, var in enumerate(var_specs):
-        data[var.name] = bin_data[i::num_vars]
-        units[var.name] = var.units
+    # Points are stored interleaved, i.e. point-major. Transpose them into a signal-major `SignalTable`,
+    # converting to native byte-order in the same copy.
+    names = [var.name for var in var_specs]
+    array = bin_data.reshape(num_pts, num_vars).T.astype(nptype, order="C")
+    data = SignalTable(names=names, array=array)
+    units = {var.name: var.units for var in var_specs}
 
     return NutBinAnalysis(
         analysis_name=sim_name,
@@ -346,20 +342,6 @@ def _read_var_spec(line: str) -> VarSpec:
 
 
 def parse_mt0(file: IO) -> Dict[str, float]:
-    """Parse an (open) "mt0-format" measurement-file into a set of {name: value} pairs."""
-
-    file.readline()  # Header
-    file.readline()  # Netlist Title
-    keys = file.readline()  # Measurement Names Line
-    keys = keys.split()
-    values = file.readline()  # Measurement Values Line
-
-    def convert(s: str) -> float:
-        """Convert a string to a float, converting failing cases to `NaN`"""
-        try:
-            return float(s)
-        except:
-            return float("NaN")
-
-    values = [convert(s) for s in values.split()]
-    return dict(zip(keys, values))
+    """Parse an (open) "mt0-format" measurement-file into a set of {name: value} pairs, from its first row.
+    See `meas.parse_mt0` for all rows."""
+    return meas.first_row(meas.parse_mt0(file))
@@ -5,7 +5,7 @@
 # Std-Lib Imports
 import os, subprocess
 import concurrent.futures
-from typing import Union, Optional, Sequence, TypeVar
+from typing import IO, Dict, Union, Optional, Sequence, TypeVar, List, Tuple, Iterator
 from enum import Enum
 from pathlib import Path
 from textwrap import dedent
@@ -15,6 +15,7 @@ from dataclasses import dataclass, field, replace
 import vlsir.spice_pb2 as vsp
 from vlsir.spice_pb2 import *  # Not used here intentionally, but "re-exported"
 from . import sim_data as sd
+from .resample import Resample, ResampleMethod
 
 
 class ResultFormat(Enum):
@@ -24,6 +25,18 @@ class ResultFormat(Enum):
     VLSIR_PROTO = "vlsir_proto"  # `vsp.SimResults` and related protobuf-defined types
 
 
+class Retention(Enum):
+    """Enumerated Run-Directory Retention Policies
+    Apply only to temporary run-directories, i.e. when `SimOptions.rundir` is not specified.
+    User-specified run-directories are never deleted."""
+
+    DELETE = "delete"  # Always delete on completion
+    # Delete on success, keep on failure for debugging
+    KEEP_ON_FAILURE = "keep_on_failure"
+    # Keep the most recent `SimOptions.keep_last` run-directories
+    KEEP_LAST = "keep_last"
+
+
 # Union of the two result-types, returned by many simulation methods
 SimResultUnion = Union[vsp.SimResult, sd.SimResult]
 
@@ -35,23 +48,37 @@ class SupportedSimulators(Enum):
     XYCE = "xyce"
     NGSPICE = "ngspice"
 
+    def sim_class(self) -> type:
+        """Get the paired `Sim` sub-class"""
+        if self == SupportedSimulators.XYCE:
+            from .xyce import XyceSim
+
+            return XyceSim
+        if self == SupportedSimulators.SPECTRE:
+            from .spectre import SpectreSim
+
+            return SpectreSim
+        if self == SupportedSimulators.NGSPICE:
+            from .ngspice import NGSpiceSim
+
+            return NGSpiceSim
+        raise ValueError(f"Unsupported simulator: {self}")
+
 
 def default() -> Optional[SupportedSimulators]:
     """Get the default simulator, for this Python-process and its environment.
     This largely consists of a priority-ordered walk through `SupportedSimulators`,
     returning the first whose `available()` method indicates its availability.
-    Returns `None` if no such simulator appears available."""
-
-    from .spectre import available as spectre_available
-    from .xyce import available as xyce_available
-    from .ngspice import available as ngspice_available
-
-    if spectre_available():
-        return SupportedSimulators.SPECTRE
-    if xyce_available():
-        return SupportedSimulators.XYCE
-    if ngspice_available():
-        return SupportedSimulators.NGSPICE
+    Returns `None` if no such simulator appears available.
+
+    Availability is probed once per process by the `registry` module,
+    so only the first call incurs any simulator-probing subprocesses."""
+
+    from . import registry
+
+    for simulator in SupportedSimulators:
+        if registry.available(simulator):
+            return simulator
     return None  # Nothing found
 
 
@@ -70,6 +97,29 @@ class SimOptions:
     # Simulation run-directory. Uses a `tempdir` if unspecified.
     rundir: Optional[os.PathLike] = None
 
+    # Root directory for temporary run-directories, e.g. a RAM-disk such as `/dev/shm`.
+    # Uses the default temporary-file location if unspecified.
+    scratch: Optional[os.PathLike] = None
+
+    # Retention policy for temporary run-directories
+    retention: Retention = Retention.DELETE
+
+    # Maximum number of retained run-directories, for `Retention.KEEP_LAST`
+    keep_last: int = 8
+
+    # Maximum total size of retained run-directories in bytes, for `Retention.KEEP_LAST`. Unlimited if unspecified.
+    keep_max_bytes: Optional[int] = None
+
+    # Resampling of transient results, applied once each is read. Keeps every simulator time-step if unspecified.
+    resample: Optional[Resample] = None
+
+    # Path to which per-simulation `SimTelemetry` records are appended, as JSON lines.
+    # No telemetry is written if unspecified.
+    telemetry_path: Optional[os.PathLike] = None
+
+    # Maximum number of concurrent simulations, when running several. Uses `concurrent.futures` defaults if unspecified.
+    jobs: Optional[int] = None
+
 
 # Shorthand type alias for "an element or list thereof", used by all the call signatures below
 T = TypeVar("T")
@@ -90,9 +140,97 @@ def sim(
     Dispatches across `SupportedSimulators` specified in `SimOptions` `opts`.
     Uses the default `Simulator` as detected by the `default` method if no `simulator` is specified.
     """
-    from .xyce import XyceSim
-    from .spectre import SpectreSim
-    from .ngspice import NGSpiceSim
+
+    # Sort out the difference between "One" "OrMore" cases of input
+    # For a single `SimInput`, create a list, but note we only want to return a single `SimResult`
+    inp_is_a_single_sim = False
+    if not isinstance(inp, Sequence):
+        inp = [inp]
+        inp_is_a_single_sim = True
+
+    # And do the real work, invoking the target simulator
+    # Note the list of `SimResult`s is ordered per the order of `SimInput`s.
+    results: List[Optional[SimResultUnion]] = [None] * len(inp)
+    for idx, result in sim_iter(inp, opts):
+        results[idx] = result
+
+    # For the sequence of inputs case, return the sequence of results that came back
+    if not inp_is_a_single_sim:
+        return results
+
+    # Unpack the single-input case
+    if len(results) != 1:
+        raise RuntimeError("Expected a single result")
+    return results[0]
+
+
+def sim_iter(
+    inp: Sequence[vsp.SimInput], opts: Optional[SimOptions] = None
+) -> Iterator[Tuple[int, SimResultUnion]]:
+    """
+    Concurrently execute a sequence of `vlsir.spice.SimInput`s, yielding `(index, result)` pairs as each completes.
+    Results are yielded in order of *completion*, not of `inp`; `index` is the position of each result's input in `inp`.
+
+    Each result is released as soon as it is yielded, so that callers which process and drop results
+    incrementally need not hold every result in memory at once.
+    Stopping iteration early (e.g. via `break`) cancels any simulations which have not yet started.
+    """
+    cls, inputs_and_options = _inputs_and_options(inp, opts)
+
+    max_workers = opts.jobs if opts is not None else None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(cls.apply_with_telemetry, io): idx
+            for idx, io in enumerate(inputs_and_options)
+        }
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                idx = futures.pop(future)
+                result, telemetry = future.result()
+
+                # Export telemetry, if requested
+                if opts is not None and opts.telemetry_path is not None:
+                    from .telemetry import write_jsonl
+
+                    telemetry.index = idx
+                    write_jsonl([telemetry], opts.telemetry_path)
+
+                yield idx, result
+        finally:
+            # Cancel anything not yet started, e.g. if the caller stopped iterating, or a simulation failed.
+            for future in futures:
+                future.cancel()
+
+
+def sim_to_stream(
+    inp: Sequence[vsp.SimInput], dest: IO[bytes], opts: Optional[SimOptions] = None
+) -> int:
+    """
+    Concurrently execute a sequence of `vlsir.spice.SimInput`s, writing each `vsp.SimResult` to binary file-like `dest`
+    as a length-delimited message (see `vlsirtools.delimited`), in the order of `inp`.
+    Each result is written as soon as all of its predecessors have been, so only out-of-order results are held in memory.
+    Returns the number of results written.
+    """
+    from ..delimited import write_delimited
+
+    pending: Dict[int, vsp.SimResult] = dict()
+    next_idx = 0
+    for idx, result in sim_iter(inp, opts):
+        if isinstance(result, sd.SimResult):
+            result = result.to_proto()
+        pending[idx] = result
+        while next_idx in pending:
+            write_delimited(dest, pending.pop(next_idx))
+            next_idx += 1
+    dest.flush()
+    return next_idx
+
+
+def _inputs_and_options(
+    inp: Sequence[vsp.SimInput], opts: Optional[SimOptions]
+) -> Tuple[type, List[SimInputAndOptions]]:
+    """Validate the arguments to `sim` and `sim_iter`.
+    Returns the target `Sim` sub-class, and a `SimInputAndOptions` per input."""
 
     if opts is None:  # Create the default `SimOptions`
         opts = SimOptions()
@@ -102,21 +240,7 @@ def sim(
         raise RuntimeError(msg)
 
     # Get the per-simulator callable
-    if opts.simulator == SupportedSimulators.XYCE:
-        cls = XyceSim
-    elif opts.simulator == SupportedSimulators.SPECTRE:
-        cls = SpectreSim
-    elif opts.simulator == SupportedSimulators.NGSPICE:
-        cls = NGSpiceSim
-    else:
-        raise ValueError(f"Unsupported simulator: {opts.simulator}")
-
-    # Sort out the difference between "One" "OrMore" cases of input
-    # For a single `SimInput`, create a list, but note we only want to return a single `SimResult`
-    inp_is_a_single_sim = False
-    if not isinstance(inp, Sequence):
-        inp = [inp]
-        inp_is_a_single_sim = True
+    cls = SupportedSimulators(opts.simulator).sim_class()
 
     inputs_and_options: List[SimInputAndOptions] = []
     for idx, x in enumerate(inp):
@@ -130,19 +254,7 @@ def sim(
             io = SimInputAndOptions(inp=x, opts=opts)
         inputs_and_options.append(io)
 
-    # And do the real work, invoking the target simulator
-    # Note the list of `SimResult`s is ordered per the order of `SimInput`s.
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        results = list(executor.map(cls.apply, inputs_and_options))
-
-    # For the sequence of inputs case, return the sequence of results that came back
-    if not inp_is_a_single_sim:
-        return results
-
-    # Unpack the single-input case
-    if len(results) != 1:
-        raise RuntimeError("Expected a single result")
-    return results[0]
+    return cls, inputs_and_options
 
 
 class SimError(Exception):
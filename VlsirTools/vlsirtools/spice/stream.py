@@ -0,0 +1,230 @@
+"""
+# Streamed Simulation Results
+
+Writes and reads `SimResult`s as sequences of length-delimited `vsp.ResultStreamMessage`s,
+for results too large to serialize as a single `vsp.SimResult`, which protobuf limits to 2 GB.
+
+Each analysis is written as a `ResultHeader`, carrying everything but its signal data,
+followed by `ResultChunk`s, each a window of points across all of its signals.
+Writers encode, and readers decode, a single chunk at a time,
+so streams can be written to and read from files or sockets with bounded memory.
+"""
+
+# Std-Lib Imports
+from dataclasses import dataclass, replace
+from typing import IO, Iterator, List, Optional, Tuple, Union
+
+# PyPi Imports
+import numpy as np
+
+# Local/ Project Dependencies
+import vlsir.spice_pb2 as vsp
+from ..delimited import write_delimited, iter_delimited
+from .sim_data import (
+    AnalysisResult,
+    AcResult,
+    DcResult,
+    TranResult,
+    SimResult,
+    SignalTable,
+    to_binary_array,
+    from_binary_array,
+    analysis_result_from_proto,
+)
+
+# Module-level configuration. Over-writeable by sufficiently motivated users.
+CHUNK_BYTES = 16 * 1024 * 1024  # Target size of the signal data in each `ResultChunk`
+
+
+@dataclass
+class StreamChunk:
+    """A window of points of all signals in an analysis, as read from a stream."""
+
+    an: AnalysisResult  # The analysis, as read from its header, without signal data
+    num_points: int  # Total number of points in the analysis
+    start: int  # Index of the first point in the window
+    data: SignalTable  # Signal data for the window
+    freq: Optional[np.ndarray] = None  # Window frequency data, for AC analyses only
+
+
+class ResultStreamWriter:
+    """# Streamed Result Writer
+
+    Writes analyses to binary file-like `dest`, either whole via `write` and `write_analysis`,
+    or incrementally via `write_header` followed by `write_chunk`s, e.g. as a simulator produces them.
+    """
+
+    def __init__(self, dest: IO[bytes], chunk_bytes: Optional[int] = None) -> None:
+        self.dest = dest
+        self.chunk_bytes = chunk_bytes or CHUNK_BYTES
+        self.bytes_written = 0
+        # State of the most recent header, checked by `write_chunk`
+        self._num_signals = 0
+        self._num_points = 0
+        self._next_point = 0
+
+    def write(self, result: SimResult) -> None:
+        """Write all analyses in `result`."""
+        for an in result.an:
+            self.write_analysis(an)
+
+    def write_analysis(self, an: AnalysisResult) -> None:
+        """Write analysis `an`, split into chunks of (approximately) `chunk_bytes` each."""
+        table, freq = _signal_data(an)
+        num_points = table.num_points if table is not None and len(table) else 0
+        self.write_header(an, num_points)
+        if not num_points:
+            return
+        itemsize = np.dtype(complex if freq is not None else float).itemsize
+        step = max(1, self.chunk_bytes // (len(table) * itemsize))
+        for start in range(0, num_points, step):
+            window = slice(start, start + step)
+            self.write_chunk(
+                table.array[:, window], freq[window] if freq is not None else None
+            )
+
+    def write_header(self, an: AnalysisResult, num_points: int) -> None:
+        """Write the header for analysis `an`, which will be followed by chunks totalling `num_points`.
+        Any signal data in `an` is not written."""
+        self._check_complete()
+        header, num_signals = _header(an)
+        header.num_points = num_points
+        self._write(vsp.ResultStreamMessage(header=header))
+        self._num_signals = num_signals
+        self._num_points = num_points
+        self._next_point = 0
+
+    def write_chunk(self, data: np.ndarray, freq: Optional[np.ndarray] = None) -> None:
+        """Write the next chunk of the current analysis.
+        `data` is of shape `(num_signals, num_points_in_chunk)`.
+        `freq` is required for, and only for, AC analyses."""
+        data = np.asarray(data)
+        if data.ndim != 2 or data.shape[0] != self._num_signals:
+            msg = f"Invalid chunk shape {data.shape} for {self._num_signals} signals"
+            raise ValueError(msg)
+        if self._next_point + data.shape[1] > self._num_points:
+            msg = f"Chunk exceeds header's {self._num_points} points"
+            raise ValueError(msg)
+        chunk = vsp.ResultChunk(start=self._next_point, data=to_binary_array(data))
+        if freq is not None:
+            chunk.freq.CopyFrom(to_binary_array(freq))
+        self._write(vsp.ResultStreamMessage(chunk=chunk))
+        self._next_point += data.shape[1]
+
+    def close(self) -> None:
+        """Check that the final analysis is complete, and flush `dest`."""
+        self._check_complete()
+        self.dest.flush()
+
+    def _write(self, msg: vsp.ResultStreamMessage) -> None:
+        self.bytes_written += write_delimited(self.dest, msg)
+
+    def _check_complete(self) -> None:
+        if self._next_point != self._num_points:
+            msg = f"Incomplete analysis: {self._next_point} of {self._num_points} points written"
+            raise RuntimeError(msg)
+
+
+def write_stream(
+    result: SimResult, dest: IO[bytes], chunk_bytes: Optional[int] = None
+) -> int:
+    """Write `result` to binary file-like `dest`. Returns the number of bytes written."""
+    writer = ResultStreamWriter(dest, chunk_bytes)
+    writer.write(result)
+    writer.close()
+    return writer.bytes_written
+
+
+def iter_stream(src: IO[bytes]) -> Iterator[Union[AnalysisResult, StreamChunk]]:
+    """Iterate over the contents of the stream in binary file-like `src`, without accumulating them.
+    Yields each analysis, without signal data, followed by each of its `StreamChunk`s.
+    Analyses without signal data, e.g. operating points, are complete as yielded."""
+    an = None
+    for msg in iter_delimited(src, vsp.ResultStreamMessage):
+        kind = msg.WhichOneof("msg")
+        if kind == "header":
+            an = analysis_result_from_proto(msg.header.an)
+            an_num_points = msg.header.num_points
+            yield an
+        elif kind == "chunk":
+            if an is None:
+                raise RuntimeError("Invalid result stream: chunk before header")
+            chunk = msg.chunk
+            array = from_binary_array(chunk.data)
+            freq = from_binary_array(chunk.freq) if chunk.HasField("freq") else None
+            if chunk.start + array.shape[1] > an_num_points:
+                raise RuntimeError("Invalid result stream: chunk exceeds header")
+            data = SignalTable(names=an.data.names, array=array)
+            yield StreamChunk(
+                an=an,
+                num_points=an_num_points,
+                start=chunk.start,
+                data=data,
+                freq=freq,
+            )
+        else:
+            raise RuntimeError(f"Invalid result stream message {msg}")
+
+
+def read_stream(src: IO[bytes]) -> SimResult:
+    """Read a `SimResult` from the stream in binary file-like `src`.
+    Signal data is copied into pre-allocated arrays of each analysis's full size, as its chunks arrive.
+    """
+    an: List[AnalysisResult] = []
+    # Destination arrays for the current analysis, and its number of points read so far
+    array, freq, filled = None, None, 0
+    for item in iter_stream(src):
+        if not isinstance(item, StreamChunk):
+            _check_filled(array, filled)
+            an.append(item)
+            array, freq, filled = None, None, 0
+            continue
+        if array is None:
+            array = np.empty(
+                (len(item.data), item.num_points), dtype=item.data.array.dtype
+            )
+            if item.freq is not None:
+                freq = np.empty(item.num_points, dtype=item.freq.dtype)
+                an[-1].freq = freq
+            an[-1].data = SignalTable(names=item.data.names, array=array)
+        stop = item.start + item.data.num_points
+        array[:, item.start : stop] = item.data.array
+        if freq is not None:
+            freq[item.start : stop] = item.freq
+        filled += item.data.num_points
+    _check_filled(array, filled)
+    return SimResult(an=an)
+
+
+def _signal_data(
+    an: AnalysisResult,
+) -> Tuple[Optional[SignalTable], Optional[np.ndarray]]:
+    """Get the signal data and (for AC analyses) frequency data of `an`, if it has any."""
+    if isinstance(an, AcResult):
+        return an.data, np.asarray(an.freq)
+    if isinstance(an, (DcResult, TranResult)):
+        return an.data, None
+    return None, None
+
+
+def _header(an: AnalysisResult) -> Tuple[vsp.ResultHeader, int]:
+    """Create the `ResultHeader` for `an`, and get its number of signals."""
+    table, freq = _signal_data(an)
+    if table is None:
+        # Analyses without signal data are written whole
+        proto = vsp.AnalysisResult(**{an.vlsir_type.value: an.to_proto()})
+        return vsp.ResultHeader(an=proto), 0
+    empty = SignalTable(names=table.names, array=table.array[:, :0])
+    if freq is not None:
+        an = replace(an, data=empty, freq=freq[:0])
+    else:
+        an = replace(an, data=empty)
+    proto = vsp.AnalysisResult(**{an.vlsir_type.value: an.to_proto()})
+    return vsp.ResultHeader(an=proto), len(table)
+
+
+def _check_filled(array: Optional[np.ndarray], filled: int) -> None:
+    """Check that all points of destination `array`, if any, have been read."""
+    if array is not None and filled != array.shape[1]:
+        msg = f"Invalid result stream: {filled} of {array.shape[1]} points read"
+        raise RuntimeError(msg)
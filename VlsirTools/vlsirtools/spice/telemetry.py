@@ -0,0 +1,161 @@
+"""
+# Simulation Telemetry
+
+Per-simulation records of where time and resources went:
+* Wall-clock time of each `Phase` - netlisting, running the simulator, and parsing its results.
+* Resource usage of each simulator subprocess, including peak memory (RSS) and CPU time.
+
+Each `Sim` collects a `SimTelemetry` record, which is attached to `sim_data.SimResult`s as their `telemetry` attribute.
+Batch calls to `sim` can export these records as JSON lines, via the `SimOptions.telemetry_path` option.
+"""
+
+# Std-Lib Imports
+import os, sys, json, time, threading, subprocess
+from enum import Enum
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, IO, Iterable, Optional, Union
+
+
+class Phase(Enum):
+    """# Enumerated Simulation Phases
+    Values are the names of the `Sim` methods which generally implement each."""
+
+    NETLIST = "write_netlist"
+    SIMULATE = "run_subprocess"
+    PARSE = "parse_results"
+
+
+@dataclass
+class ProcessUsage:
+    """# Resource usage of a simulator subprocess.
+    CPU and memory fields are `None` on platforms without `os.wait4`."""
+
+    wall_time: float  # Wall-clock time, in seconds
+    returncode: int  # Process return code
+    user_time: Optional[float] = None  # User-mode CPU time, in seconds
+    system_time: Optional[float] = None  # System-mode CPU time, in seconds
+    max_rss: Optional[int] = None  # Peak resident set size, in bytes
+
+
+@dataclass
+class SimTelemetry:
+    """# Telemetry for a single `Sim`"""
+
+    simulator: Optional[str] = None  # Simulator name
+    rundir: Optional[str] = None  # Simulation run-directory
+    index: Optional[int] = None  # Position in a batch of `SimInput`s, if applicable
+    wall_time: float = 0.0  # Total wall-clock time, in seconds
+    phases: Dict[str, float] = field(default_factory=dict)
+    # Wall-clock time per `Phase`, in seconds, keyed by `Phase.value`.
+    # Note simulators which run concurrent subprocesses (e.g. Xyce) sum across them,
+    # so that these can total more than `wall_time`.
+    processes: List[ProcessUsage] = field(default_factory=list)
+    # Resource usage of each simulator subprocess
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @contextmanager
+    def phase(self, phase: Phase):
+        """Context manager which times the enclosed block, adding it to `phase`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - start)
+
+    def add_phase(self, phase: Phase, elapsed: float) -> None:
+        """Add `elapsed` seconds to the total for `phase`."""
+        with self._lock:
+            self.phases[phase.value] = self.phases.get(phase.value, 0.0) + elapsed
+
+    def add_process(self, usage: ProcessUsage) -> None:
+        """Add the resource usage of a completed subprocess."""
+        with self._lock:
+            self.processes.append(usage)
+
+    @property
+    def max_rss(self) -> Optional[int]:
+        """Peak resident set size across all subprocesses, in bytes. `None` if unknown."""
+        rss = [p.max_rss for p in self.processes if p.max_rss is not None]
+        return max(rss) if rss else None
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        """Total (user plus system) CPU time across all subprocesses, in seconds. `None` if unknown."""
+        times = [
+            p.user_time + p.system_time
+            for p in self.processes
+            if p.user_time is not None and p.system_time is not None
+        ]
+        return sum(times) if times else None
+
+    def to_dict(self) -> Dict:
+        """Convert to a JSON-compatible dictionary."""
+        return dict(
+            simulator=self.simulator,
+            rundir=self.rundir,
+            index=self.index,
+            wall_time=self.wall_time,
+            phases=dict(self.phases),
+            max_rss=self.max_rss,
+            cpu_time=self.cpu_time,
+            processes=[p.__dict__.copy() for p in self.processes],
+        )
+
+    def to_json(self) -> str:
+        """Convert to a single-line JSON string."""
+        return json.dumps(self.to_dict())
+
+
+def wait(proc: subprocess.Popen, start: float) -> ProcessUsage:
+    """Wait for subprocess `proc` to complete, and collect its resource usage.
+    Argument `start` is its `time.perf_counter` start-time.
+
+    Uses `os.wait4` where available, which reports usage for `proc` alone,
+    even when several simulations run concurrently in the same parent process.
+    Sets `proc.returncode`, as `Popen.wait` would."""
+
+    if not hasattr(os, "wait4"):  # Not available, e.g. on Windows.
+        proc.wait()
+        return ProcessUsage(
+            wall_time=time.perf_counter() - start, returncode=proc.returncode
+        )
+
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        # Already reaped elsewhere. Fall back to the `Popen`-stored return code.
+        proc.wait()
+        return ProcessUsage(
+            wall_time=time.perf_counter() - start, returncode=proc.returncode
+        )
+
+    if os.WIFSIGNALED(status):
+        proc.returncode = -os.WTERMSIG(status)
+    else:
+        proc.returncode = os.WEXITSTATUS(status)
+
+    # `ru_maxrss` is in kilobytes on Linux, but in bytes on MacOS.
+    max_rss = rusage.ru_maxrss if sys.platform == "darwin" else 1024 * rusage.ru_maxrss
+    return ProcessUsage(
+        wall_time=time.perf_counter() - start,
+        returncode=proc.returncode,
+        user_time=rusage.ru_utime,
+        system_time=rusage.ru_stime,
+        max_rss=max_rss,
+    )
+
+
+def write_jsonl(
+    records: Iterable[SimTelemetry], dest: Union[IO, os.PathLike, str]
+) -> None:
+    """Write `records` to `dest` as JSON lines, one record per line.
+    If `dest` is a path, records are appended to it."""
+    if isinstance(dest, (str, os.PathLike)):
+        with open(dest, "a") as f:
+            return write_jsonl(records, f)
+    for record in records:
+        dest.write(record.to_json() + "\n")
+    dest.flush()
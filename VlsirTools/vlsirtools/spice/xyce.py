@@ -5,18 +5,18 @@ Xyce Implementation of `vsp.Sim`
 # Std-Lib Imports
 import subprocess, random, shutil
 import concurrent.futures
-from glob import glob
 from os import PathLike
 from typing import IO, Dict, Union
 import shlex
 
 import numpy as np
-import pandas as pd
 
 # Local/ Project Dependencies
 import vlsir.spice_pb2 as vsp
 from ..netlist import XyceNetlister
 from .base import Sim
+from .telemetry import Phase
+from . import meas
 from .sim_data import (
     TranResult,
     OpResult,
@@ -24,6 +24,7 @@ from .sim_data import (
     AcResult,
     DcResult,
     AnalysisResult,
+    SignalTable,
 )
 from .spice import SupportedSimulators, sim
 
@@ -48,26 +49,9 @@ class XyceSim(Sim):
     Results from each analysis-process are collated into a single `SimResult`.
     """
 
-    @staticmethod
-    def available() -> bool:
-        """Boolean indication of whether the current running environment includes the simulator executable on its path."""
-
-        if shutil.which(XYCE_EXECUTABLE) is None:
-            return False
-        try:
-            # And if it's set, check that we can get its version without croaking.
-            subprocess.run(
-                f"{XYCE_EXECUTABLE} -v",  # Get the version,
-                shell=True,
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=10,
-            )
-        except Exception:
-            # Indicate "not available" for any Exception. Usually this will be a `subprocess.CalledProcessError`.
-            return False
-        return True  # Otherwise, installation looks good.
+    @classmethod
+    def executable(cls) -> str:
+        return XYCE_EXECUTABLE
 
     @classmethod
     def enum(cls) -> SupportedSimulators:
@@ -77,7 +61,8 @@ class XyceSim(Sim):
         """Run the specified `SimInput` in directory `self.rundir`, returning its results."""
 
         # Write the DUT netlist
-        self.write_dut_netlist()
+        with self.phase(Phase.NETLIST):
+            self.write_dut_netlist()
 
         # Run each analysis as a concurrent subprocess
         with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -121,6 +106,9 @@ class XyceSim(Sim):
         # And ensure all output makes it to `self.dest`
         netlister.flush()
 
+        # Keep the netlister, and particularly its signal-saving specification, for each analysis
+        self.dut_netlister = netlister
+
     def analysis(self, an: vsp.Analysis) -> AnalysisResult:
         """Execute a `vsp.Analysis`, returning its `AnalysisResult`"""
 
@@ -159,9 +147,8 @@ class XyceSim(Sim):
         fstop = an.fstop
         netlist.write(f".ac DEC {npts} {fstart} {fstop} \n\n")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        netlist.write(".print ac format=csv v(*) i(*) \n\n")
+        # Write the `.print` statement for our saved signals
+        self.write_print(netlist, "ac")
 
         # And don't forget - the thing SPICE can't live without - END!
         netlist.write(".end \n\n")
@@ -171,11 +158,10 @@ class XyceSim(Sim):
         self.run_xyce_process(analysis_name)
 
         # Read the results from CSV
-        with self.open(f"{analysis_name}.sp.FD.csv", "r") as csv_handle:
-            csv_data = read_csv(csv_handle)
+        csv_data = self.read_results(f"{analysis_name}.sp.FD.csv", "ac")
 
         # Separate Frequency vector
-        freq: np.ndarray = csv_data.pop("FREQ")
+        freq: np.ndarray = csv_data.pop("FREQ", np.array([]))
         data: Dict[str, np.ndarray] = {}
 
         # Pull together separate real/imaginary parts into complex numbers
@@ -191,14 +177,15 @@ class XyceSim(Sim):
             )
 
         # Parse any scalar measurement results
-        measurements = self.parse_measurements(analysis_name)
+        meas_table = self.parse_measurements(analysis_name)
 
         # And arrange them in an `AcResult`
         return AcResult(
             analysis_name=an.analysis_name,
             freq=freq,
             data=data,
-            measurements=measurements,
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def dc(self, an: vsp.DcInput) -> DcResult:
@@ -236,9 +223,8 @@ class XyceSim(Sim):
         else:
             raise ValueError("Invalid sweep type")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        netlist.write(".print dc format=csv v(*) i(*) \n\n")
+        # Write the `.print` statement for our saved signals
+        self.write_print(netlist, "dc")
 
         # And don't forget - the thing SPICE can't live without - END!
         netlist.write(".end \n\n")
@@ -248,18 +234,18 @@ class XyceSim(Sim):
         self.run_xyce_process(analysis_name)
 
         # Read the results from CSV
-        with self.open(f"{analysis_name}.sp.csv", "r") as csv_handle:
-            csv_data = read_csv(csv_handle)
+        csv_data = self.read_results(f"{analysis_name}.sp.csv", "dc")
 
         # Parse any scalar measurement results
-        measurements = self.parse_measurements(analysis_name)
+        meas_table = self.parse_measurements(analysis_name)
 
         # And arrange them in an `OpResult`
         return DcResult(
             analysis_name=an.analysis_name,
             indep_name=an.indep_name,
             data=csv_data,
-            measurements=measurements,
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def op(self, an: vsp.OpInput) -> OpResult:
@@ -284,9 +270,8 @@ class XyceSim(Sim):
         # Write the analysis command
         netlist.write(f".dc {dummy_param} 1 1 1 \n\n")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        netlist.write(".print dc format=csv v(*) i(*) \n\n")
+        # Write the `.print` statement for our saved signals
+        self.write_print(netlist, "dc")
 
         # And don't forget - the thing SPICE can't live without - END!
         netlist.write(".end \n\n")
@@ -296,8 +281,7 @@ class XyceSim(Sim):
         self.run_xyce_process(analysis_name)
 
         # Read the results from CSV
-        with self.open(f"{analysis_name}.sp.csv", "r") as csv_handle:
-            csv_data = read_csv(csv_handle)
+        csv_data = self.read_results(f"{analysis_name}.sp.csv", "dc")
 
         # Each value in `csv_data` will be a single-element list.
         # Pull those single elements out.
@@ -333,9 +317,8 @@ class XyceSim(Sim):
         # Write the analysis command
         netlist.write(f".tran {tstep} {tstop} \n\n")
 
-        # FIXME: always saving everything, no matter what
-        # Note `csv` output-formatting is encoded here
-        netlist.write(".print tran format=csv v(*) i(*) \n\n")
+        # Write the `.print` statement for our saved signals
+        self.write_print(netlist, "tran")
 
         # And don't forget - the thing SPICE can't live without - END!
         netlist.write(".end \n\n")
@@ -346,32 +329,52 @@ class XyceSim(Sim):
 
         # Parse and organize our results
         # First pull them in from CSV
-        with self.open(f"{analysis_name}.sp.csv", "r") as csv_handle:
-            csv_data = read_csv(csv_handle)
+        csv_data = self.read_results(f"{analysis_name}.sp.csv", "tran")
 
         # Parse any scalar measurement results
-        measurements = self.parse_measurements(analysis_name)
+        meas_table = self.parse_measurements(analysis_name)
 
         # And organize them into a `TranResult`
         return TranResult(
-            analysis_name=an.analysis_name, data=csv_data, measurements=measurements
+            analysis_name=an.analysis_name,
+            data=self.resample(SignalTable.from_dict(csv_data)),
+            measurements=meas.first_row(meas_table),
+            measurement_table=meas_table,
         )
 
     def run_xyce_process(self, name: str) -> None:
         """Run a `Xyce` sub-process executing the simulation."""
         return self.run_subprocess(cmd=shlex.split(f"{XYCE_EXECUTABLE} {name}.sp"))
 
-    def parse_measurements(self, analysis_name: str) -> Dict[str, float]:
-        # FIXME: the *input* should really be dictating whether we have measurements.
-        # For now, we just search for any matching filenames via `glob`
-        meas_glob = glob(f"*{analysis_name}*.m*0")
-        if len(meas_glob) > 1:
-            raise RuntimeError(f"Unsupported multiple measurement results for {self}")
-        if len(meas_glob) == 1:
-            measurements = parse_meas(self.open(meas_glob[0], "r"))
-            return {k.lower(): v for k, v in measurements.items()}
-        # No measurement-file, return an empty result
-        return {}
+    def parse_measurements(self, analysis_name: str) -> meas.MeasTable:
+        """Parse all measurement-files for analysis `analysis_name`, as columnar arrays of all their rows.
+        Xyce writes one file per step of stepped analyses, e.g. `tran.sp.mt0`, `tran.sp.mt1`."""
+        with self.phase(Phase.PARSE):
+            # FIXME: the *input* should really be dictating whether we have measurements.
+            # For now, we just search for any matching filenames via `glob`
+            paths = self.glob(f"{analysis_name}.sp.m[tas][0-9]*")
+            table = meas.read_files(paths, meas.parse_name_value)
+            return {k.lower(): v for k, v in table.items()}
+
+    def write_print(self, netlist: IO, analysis_type: str) -> None:
+        """Write the `.print` statement for an analysis of type `analysis_type` to `netlist`.
+        Analyses which save no signals get no `.print` statement, and hence no CSV results-file."""
+        line = self.dut_netlister.format_print(analysis_type)
+        if line is not None:
+            netlist.write(line + "\n")
+
+    def read_results(self, name: str, analysis_type: str) -> Dict[str, np.ndarray]:
+        """Read CSV results-file `name`, of an analysis of type `analysis_type`.
+        Returns an empty dictionary if the analysis saved no signals, and hence had no `.print` statement.
+        Raises a `RuntimeError` if the file is otherwise missing, e.g. if Xyce failed to write it."""
+        with self.phase(Phase.PARSE):
+            if not self.path(name).exists():
+                if self.dut_netlister.format_print(analysis_type) is None:
+                    return dict()
+                msg = f"Missing Xyce results-file {name} in run-directory {self.rundir}"
+                raise RuntimeError(msg)
+            with self.open(name, "r") as csv_handle:
+                return read_csv(csv_handle)
 
     def copy_dut_netlist(self, path: str) -> IO:
         """Copy the `DUT` part of the netlist to file `path`,
@@ -380,20 +383,15 @@ class XyceSim(Sim):
         return self.open(path, "a")
 
 
-def read_csv(handle: Union[IO, PathLike]) -> Dict[str, np.ndarray]:
-    """Read CSV from file-handle `handle` into a dictionary of {header: array}s."""
+def read_csv(handle: Union[IO, PathLike]) -> SignalTable:
+    """Read CSV from file-handle `handle` into a `SignalTable` of {header: array}s."""
+    import pandas as pd  # Imported here, as it is comparatively slow to import
 
     df = pd.read_csv(handle)
-    return {n: np.array(c) for n, c in df.items()}
+    array = np.ascontiguousarray(df.to_numpy(dtype=float).T)
+    return SignalTable(names=list(df.columns), array=array)
 
 
 def parse_meas(file: IO) -> Dict[str, float]:
     """Parse an (open) measurement-file to a {name: value} dictionary."""
-    rv = {}
-    for line in file.readlines():
-        contents = line.split()
-        if len(contents) != 3 or contents[1] != "=":
-            raise RuntimeError(f"Invalid line in Xyce measurements: {line}")
-        name, val = contents[0], float(contents[2])
-        rv[name] = val
-    return rv
+    return meas.first_row(meas.parse_name_value(file))
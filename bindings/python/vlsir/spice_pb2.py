@@ -18,7 +18,7 @@ from . import circuit_pb2 as circuit__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0bspice.proto\x12\x0bvlsir.spice\x1a\x0butils.proto\x1a\rcircuit.proto"\xab\x01\n\x08SimInput\x12#\n\x03pkg\x18\x01 \x01(\x0b\x32\x16.vlsir.circuit.Package\x12\x0b\n\x03top\x18\x02 \x01(\t\x12%\n\x04opts\x18\n \x03(\x0b\x32\x17.vlsir.spice.SimOptions\x12!\n\x02\x61n\x18\x0b \x03(\x0b\x32\x15.vlsir.spice.Analysis\x12#\n\x05\x63trls\x18\x0c \x03(\x0b\x32\x14.vlsir.spice.Control"4\n\tSimResult\x12\'\n\x02\x61n\x18\x01 \x03(\x0b\x32\x1b.vlsir.spice.AnalysisResult"B\n\nSimOptions\x12\x0c\n\x04name\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.vlsir.utils.ParamValue"\xd6\x02\n\x08\x41nalysis\x12"\n\x02op\x18\x01 \x01(\x0b\x32\x14.vlsir.spice.OpInputH\x00\x12"\n\x02\x64\x63\x18\x02 \x01(\x0b\x32\x14.vlsir.spice.DcInputH\x00\x12&\n\x04tran\x18\x03 \x01(\x0b\x32\x16.vlsir.spice.TranInputH\x00\x12"\n\x02\x61\x63\x18\x04 \x01(\x0b\x32\x14.vlsir.spice.AcInputH\x00\x12(\n\x05noise\x18\x05 \x01(\x0b\x32\x17.vlsir.spice.NoiseInputH\x00\x12(\n\x05sweep\x18\n \x01(\x0b\x32\x17.vlsir.spice.SweepInputH\x00\x12(\n\x05monte\x18\x0b \x01(\x0b\x32\x17.vlsir.spice.MonteInputH\x00\x12\x32\n\x06\x63ustom\x18\x14 \x01(\x0b\x32 .vlsir.spice.CustomAnalysisInputH\x00\x42\x04\n\x02\x61n"\xe4\x02\n\x0e\x41nalysisResult\x12#\n\x02op\x18\x01 \x01(\x0b\x32\x15.vlsir.spice.OpResultH\x00\x12#\n\x02\x64\x63\x18\x02 \x01(\x0b\x32\x15.vlsir.spice.DcResultH\x00\x12\'\n\x04tran\x18\x03 \x01(\x0b\x32\x17.vlsir.spice.TranResultH\x00\x12#\n\x02\x61\x63\x18\x04 \x01(\x0b\x32\x15.vlsir.spice.AcResultH\x00\x12)\n\x05noise\x18\x05 \x01(\x0b\x32\x18.vlsir.spice.NoiseResultH\x00\x12)\n\x05sweep\x18\n \x01(\x0b\x32\x18.vlsir.spice.SweepResultH\x00\x12)\n\x05monte\x18\x0b \x01(\x0b\x32\x18.vlsir.spice.MonteResultH\x00\x12\x33\n\x06\x63ustom\x18\x14 \x01(\x0b\x32!.vlsir.spice.CustomAnalysisResultH\x00\x42\x04\n\x02\x61n"E\n\x07OpInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"L\n\x08OpResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05"|\n\x07\x44\x63Input\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x12\n\nindep_name\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\xce\x01\n\x08\x44\x63Result\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x12\n\nindep_name\x18\x02 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01\x12=\n\x0cmeasurements\x18\n \x03(\x0b\x32\'.vlsir.spice.DcResult.MeasurementsEntry\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x04\x10\x05"\xbc\x01\n\tTranInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\r\n\x05tstop\x18\x02 \x01(\x01\x12\r\n\x05tstep\x18\x03 \x01(\x01\x12*\n\x02ic\x18\x04 \x03(\x0b\x32\x1e.vlsir.spice.TranInput.IcEntry\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control\x1a)\n\x07IcEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01"\xc4\x01\n\nTranResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01\x12?\n\x0cmeasurements\x18\n \x03(\x0b\x32).vlsir.spice.TranResult.MeasurementsEntry\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05"$\n\nComplexNum\x12\n\n\x02re\x18\x01 \x01(\x01\x12\n\n\x02im\x18\x02 \x01(\x01"r\n\x07\x41\x63Input\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0e\n\x06\x66start\x18\x02 \x01(\x01\x12\r\n\x05\x66stop\x18\x03 \x01(\x01\x12\x0c\n\x04npts\x18\x04 \x01(\x04\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\xe1\x01\n\x08\x41\x63Result\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0c\n\x04\x66req\x18\x02 \x03(\x01\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12%\n\x04\x64\x61ta\x18\x05 \x03(\x0b\x32\x17.vlsir.spice.ComplexNum\x12=\n\x0cmeasurements\x18\n \x03(\x0b\x32\'.vlsir.spice.AcResult.MeasurementsEntry\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x04\x10\x05"\xaf\x01\n\nNoiseInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08output_p\x18\x02 \x01(\t\x12\x10\n\x08output_n\x18\x03 \x01(\t\x12\x14\n\x0cinput_source\x18\x04 \x01(\t\x12\x0e\n\x06\x66start\x18\n \x01(\x01\x12\r\n\x05\x66stop\x18\x0b \x01(\x01\x12\x0c\n\x04npts\x18\x0c \x01(\x04\x12#\n\x05\x63trls\x18\x14 \x03(\x0b\x32\x14.vlsir.spice.Control"\xc7\x02\n\x0bNoiseResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01\x12G\n\x10integrated_noise\x18\n \x03(\x0b\x32-.vlsir.spice.NoiseResult.IntegratedNoiseEntry\x12@\n\x0cmeasurements\x18\x0b \x03(\x0b\x32*.vlsir.spice.NoiseResult.MeasurementsEntry\x1a\x36\n\x14IntegratedNoiseEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05"\xa0\x01\n\nSweepInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08variable\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12!\n\x02\x61n\x18\x04 \x03(\x0b\x32\x15.vlsir.spice.Analysis\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\x82\x01\n\x0bSweepResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08variable\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12\'\n\x02\x61n\x18\x04 \x03(\x0b\x32\x1b.vlsir.spice.AnalysisResult"\x87\x01\n\nMonteInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0c\n\x04npts\x18\x02 \x01(\x03\x12\x0c\n\x04seed\x18\x03 \x01(\x03\x12!\n\x02\x61n\x18\x04 \x03(\x0b\x32\x15.vlsir.spice.Analysis\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\x82\x01\n\x0bMonteResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08variable\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12\'\n\x02\x61n\x18\x04 \x03(\x0b\x32\x1b.vlsir.spice.AnalysisResult"^\n\x13\x43ustomAnalysisInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0b\n\x03\x63md\x18\x02 \x01(\t\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\x16\n\x14\x43ustomAnalysisResult"\x8a\x01\n\x05Sweep\x12*\n\x06linear\x18\x01 \x01(\x0b\x32\x18.vlsir.spice.LinearSweepH\x00\x12$\n\x03log\x18\x02 \x01(\x0b\x32\x15.vlsir.spice.LogSweepH\x00\x12)\n\x06points\x18\x03 \x01(\x0b\x32\x17.vlsir.spice.PointSweepH\x00\x42\x04\n\x02tp"8\n\x0bLinearSweep\x12\r\n\x05start\x18\x01 \x01(\x01\x12\x0c\n\x04stop\x18\x02 \x01(\x01\x12\x0c\n\x04step\x18\x03 \x01(\x01"5\n\x08LogSweep\x12\r\n\x05start\x18\x01 \x01(\x01\x12\x0c\n\x04stop\x18\x02 \x01(\x01\x12\x0c\n\x04npts\x18\x03 \x01(\x01"8\n\nPointSweep\x12\x0e\n\x06points\x18\x01 \x03(\x01\x12\x0c\n\x04stop\x18\x02 \x01(\x01\x12\x0c\n\x04npts\x18\x03 \x01(\x01"\xe0\x01\n\x07\x43ontrol\x12\'\n\x07include\x18\x01 \x01(\x0b\x32\x14.vlsir.spice.IncludeH\x00\x12&\n\x03lib\x18\x02 \x01(\x0b\x32\x17.vlsir.spice.LibIncludeH\x00\x12!\n\x04save\x18\x05 \x01(\x0b\x32\x11.vlsir.spice.SaveH\x00\x12!\n\x04meas\x18\x06 \x01(\x0b\x32\x11.vlsir.spice.MeasH\x00\x12#\n\x05param\x18\x07 \x01(\x0b\x32\x12.vlsir.utils.ParamH\x00\x12\x11\n\x07literal\x18\n \x01(\tH\x00\x42\x06\n\x04\x63trl"k\n\x04Save\x12*\n\x04mode\x18\x01 \x01(\x0e\x32\x1a.vlsir.spice.Save.SaveModeH\x00\x12\x10\n\x06signal\x18\x02 \x01(\tH\x00"\x1d\n\x08SaveMode\x12\x08\n\x04NONE\x10\x00\x12\x07\n\x03\x41LL\x10\x01\x42\x06\n\x04save"\x17\n\x07Include\x12\x0c\n\x04path\x18\x01 \x01(\t"+\n\nLibInclude\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0f\n\x07section\x18\x02 \x01(\t"9\n\x04Meas\x12\x15\n\ranalysis_type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x65xpr\x18\x03 \x01(\t"v\n\x06Signal\x12\x0c\n\x04name\x18\x01 \x01(\t\x12.\n\x08quantity\x18\x02 \x01(\x0e\x32\x1c.vlsir.spice.Signal.Quantity".\n\x08Quantity\x12\x0b\n\x07VOLTAGE\x10\x00\x12\x0b\n\x07\x43URRENT\x10\x01\x12\x08\n\x04NONE\x10\x03\x32=\n\x05Spice\x12\x34\n\x03Sim\x12\x15.vlsir.spice.SimInput\x1a\x16.vlsir.spice.SimResultb\x06proto3'
+    b'\n\x0bspice.proto\x12\x0bvlsir.spice\x1a\x0butils.proto\x1a\rcircuit.proto"\xab\x01\n\x08SimInput\x12#\n\x03pkg\x18\x01 \x01(\x0b\x32\x16.vlsir.circuit.Package\x12\x0b\n\x03top\x18\x02 \x01(\t\x12%\n\x04opts\x18\n \x03(\x0b\x32\x17.vlsir.spice.SimOptions\x12!\n\x02\x61n\x18\x0b \x03(\x0b\x32\x15.vlsir.spice.Analysis\x12#\n\x05\x63trls\x18\x0c \x03(\x0b\x32\x14.vlsir.spice.Control"4\n\tSimResult\x12\'\n\x02\x61n\x18\x01 \x03(\x0b\x32\x1b.vlsir.spice.AnalysisResult"B\n\nSimOptions\x12\x0c\n\x04name\x18\x01 \x01(\t\x12&\n\x05value\x18\x02 \x01(\x0b\x32\x17.vlsir.utils.ParamValue"\xd6\x02\n\x08\x41nalysis\x12"\n\x02op\x18\x01 \x01(\x0b\x32\x14.vlsir.spice.OpInputH\x00\x12"\n\x02\x64\x63\x18\x02 \x01(\x0b\x32\x14.vlsir.spice.DcInputH\x00\x12&\n\x04tran\x18\x03 \x01(\x0b\x32\x16.vlsir.spice.TranInputH\x00\x12"\n\x02\x61\x63\x18\x04 \x01(\x0b\x32\x14.vlsir.spice.AcInputH\x00\x12(\n\x05noise\x18\x05 \x01(\x0b\x32\x17.vlsir.spice.NoiseInputH\x00\x12(\n\x05sweep\x18\n \x01(\x0b\x32\x17.vlsir.spice.SweepInputH\x00\x12(\n\x05monte\x18\x0b \x01(\x0b\x32\x17.vlsir.spice.MonteInputH\x00\x12\x32\n\x06\x63ustom\x18\x14 \x01(\x0b\x32 .vlsir.spice.CustomAnalysisInputH\x00\x42\x04\n\x02\x61n"\xe4\x02\n\x0e\x41nalysisResult\x12#\n\x02op\x18\x01 \x01(\x0b\x32\x15.vlsir.spice.OpResultH\x00\x12#\n\x02\x64\x63\x18\x02 \x01(\x0b\x32\x15.vlsir.spice.DcResultH\x00\x12\'\n\x04tran\x18\x03 \x01(\x0b\x32\x17.vlsir.spice.TranResultH\x00\x12#\n\x02\x61\x63\x18\x04 \x01(\x0b\x32\x15.vlsir.spice.AcResultH\x00\x12)\n\x05noise\x18\x05 \x01(\x0b\x32\x18.vlsir.spice.NoiseResultH\x00\x12)\n\x05sweep\x18\n \x01(\x0b\x32\x18.vlsir.spice.SweepResultH\x00\x12)\n\x05monte\x18\x0b \x01(\x0b\x32\x18.vlsir.spice.MonteResultH\x00\x12\x33\n\x06\x63ustom\x18\x14 \x01(\x0b\x32!.vlsir.spice.CustomAnalysisResultH\x00\x42\x04\n\x02\x61n"E\n\x07OpInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"L\n\x08OpResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05"\x7f\n\x0b\x42inaryArray\x12-\n\x05\x64type\x18\x01 \x01(\x0e\x32\x1e.vlsir.spice.BinaryArray.DType\x12\r\n\x05shape\x18\x02 \x03(\x04\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c"$\n\x05\x44Type\x12\x0b\n\x07\x46LOAT64\x10\x00\x12\x0e\n\nCOMPLEX128\x10\x01"t\n\x13ResultStreamMessage\x12+\n\x06header\x18\x01 \x01(\x0b\x32\x19.vlsir.spice.ResultHeaderH\x00\x12)\n\x05\x63hunk\x18\x02 \x01(\x0b\x32\x18.vlsir.spice.ResultChunkH\x00\x42\x05\n\x03msg"K\n\x0cResultHeader\x12\'\n\x02\x61n\x18\x01 \x01(\x0b\x32\x1b.vlsir.spice.AnalysisResult\x12\x12\n\nnum_points\x18\x02 \x01(\x04"l\n\x0bResultChunk\x12\r\n\x05start\x18\x01 \x01(\x04\x12&\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x18.vlsir.spice.BinaryArray\x12&\n\x04\x66req\x18\x03 \x01(\x0b\x32\x18.vlsir.spice.BinaryArray"|\n\x07\x44\x63Input\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x12\n\nindep_name\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\xfd\x01\n\x08\x44\x63Result\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x12\n\nindep_name\x18\x02 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01\x12-\n\x0b\x62inary_data\x18\x06 \x01(\x0b\x32\x18.vlsir.spice.BinaryArray\x12=\n\x0cmeasurements\x18\n \x03(\x0b\x32\'.vlsir.spice.DcResult.MeasurementsEntry\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x04\x10\x05"\xbc\x01\n\tTranInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\r\n\x05tstop\x18\x02 \x01(\x01\x12\r\n\x05tstep\x18\x03 \x01(\x01\x12*\n\x02ic\x18\x04 \x03(\x0b\x32\x1e.vlsir.spice.TranInput.IcEntry\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control\x1a)\n\x07IcEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01"\xf3\x01\n\nTranResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01\x12-\n\x0b\x62inary_data\x18\x06 \x01(\x0b\x32\x18.vlsir.spice.BinaryArray\x12?\n\x0cmeasurements\x18\n \x03(\x0b\x32).vlsir.spice.TranResult.MeasurementsEntry\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05"$\n\nComplexNum\x12\n\n\x02re\x18\x01 \x01(\x01\x12\n\n\x02im\x18\x02 \x01(\x01"r\n\x07\x41\x63Input\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0e\n\x06\x66start\x18\x02 \x01(\x01\x12\r\n\x05\x66stop\x18\x03 \x01(\x01\x12\x0c\n\x04npts\x18\x04 \x01(\x04\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\xbf\x02\n\x08\x41\x63Result\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0c\n\x04\x66req\x18\x02 \x03(\x01\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12%\n\x04\x64\x61ta\x18\x05 \x03(\x0b\x32\x17.vlsir.spice.ComplexNum\x12-\n\x0b\x62inary_data\x18\x06 \x01(\x0b\x32\x18.vlsir.spice.BinaryArray\x12-\n\x0b\x62inary_freq\x18\x07 \x01(\x0b\x32\x18.vlsir.spice.BinaryArray\x12=\n\x0cmeasurements\x18\n \x03(\x0b\x32\'.vlsir.spice.AcResult.MeasurementsEntry\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x04\x10\x05"\xaf\x01\n\nNoiseInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08output_p\x18\x02 \x01(\t\x12\x10\n\x08output_n\x18\x03 \x01(\t\x12\x14\n\x0cinput_source\x18\x04 \x01(\t\x12\x0e\n\x06\x66start\x18\n \x01(\x01\x12\r\n\x05\x66stop\x18\x0b \x01(\x01\x12\x0c\n\x04npts\x18\x0c \x01(\x04\x12#\n\x05\x63trls\x18\x14 \x03(\x0b\x32\x14.vlsir.spice.Control"\xc7\x02\n\x0bNoiseResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0f\n\x07signals\x18\x03 \x03(\t\x12\x0c\n\x04\x64\x61ta\x18\x05 \x03(\x01\x12G\n\x10integrated_noise\x18\n \x03(\x0b\x32-.vlsir.spice.NoiseResult.IntegratedNoiseEntry\x12@\n\x0cmeasurements\x18\x0b \x03(\x0b\x32*.vlsir.spice.NoiseResult.MeasurementsEntry\x1a\x36\n\x14IntegratedNoiseEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a\x33\n\x11MeasurementsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01J\x04\x08\x02\x10\x03J\x04\x08\x04\x10\x05"\xa0\x01\n\nSweepInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08variable\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12!\n\x02\x61n\x18\x04 \x03(\x0b\x32\x15.vlsir.spice.Analysis\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\x82\x01\n\x0bSweepResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08variable\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12\'\n\x02\x61n\x18\x04 \x03(\x0b\x32\x1b.vlsir.spice.AnalysisResult"\x87\x01\n\nMonteInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0c\n\x04npts\x18\x02 \x01(\x03\x12\x0c\n\x04seed\x18\x03 \x01(\x03\x12!\n\x02\x61n\x18\x04 \x03(\x0b\x32\x15.vlsir.spice.Analysis\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\x82\x01\n\x0bMonteResult\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x10\n\x08variable\x18\x02 \x01(\t\x12!\n\x05sweep\x18\x03 \x01(\x0b\x32\x12.vlsir.spice.Sweep\x12\'\n\x02\x61n\x18\x04 \x03(\x0b\x32\x1b.vlsir.spice.AnalysisResult"^\n\x13\x43ustomAnalysisInput\x12\x15\n\ranalysis_name\x18\x01 \x01(\t\x12\x0b\n\x03\x63md\x18\x02 \x01(\t\x12#\n\x05\x63trls\x18\x05 \x03(\x0b\x32\x14.vlsir.spice.Control"\x16\n\x14\x43ustomAnalysisResult"\x8a\x01\n\x05Sweep\x12*\n\x06linear\x18\x01 \x01(\x0b\x32\x18.vlsir.spice.LinearSweepH\x00\x12$\n\x03log\x18\x02 \x01(\x0b\x32\x15.vlsir.spice.LogSweepH\x00\x12)\n\x06points\x18\x03 \x01(\x0b\x32\x17.vlsir.spice.PointSweepH\x00\x42\x04\n\x02tp"8\n\x0bLinearSweep\x12\r\n\x05start\x18\x01 \x01(\x01\x12\x0c\n\x04stop\x18\x02 \x01(\x01\x12\x0c\n\x04step\x18\x03 \x01(\x01"5\n\x08LogSweep\x12\r\n\x05start\x18\x01 \x01(\x01\x12\x0c\n\x04stop\x18\x02 \x01(\x01\x12\x0c\n\x04npts\x18\x03 \x01(\x01"8\n\nPointSweep\x12\x0e\n\x06points\x18\x01 \x03(\x01\x12\x0c\n\x04stop\x18\x02 \x01(\x01\x12\x0c\n\x04npts\x18\x03 \x01(\x01"\xe0\x01\n\x07\x43ontrol\x12\'\n\x07include\x18\x01 \x01(\x0b\x32\x14.vlsir.spice.IncludeH\x00\x12&\n\x03lib\x18\x02 \x01(\x0b\x32\x17.vlsir.spice.LibIncludeH\x00\x12!\n\x04save\x18\x05 \x01(\x0b\x32\x11.vlsir.spice.SaveH\x00\x12!\n\x04meas\x18\x06 \x01(\x0b\x32\x11.vlsir.spice.MeasH\x00\x12#\n\x05param\x18\x07 \x01(\x0b\x32\x12.vlsir.utils.ParamH\x00\x12\x11\n\x07literal\x18\n \x01(\tH\x00\x42\x06\n\x04\x63trl"k\n\x04Save\x12*\n\x04mode\x18\x01 \x01(\x0e\x32\x1a.vlsir.spice.Save.SaveModeH\x00\x12\x10\n\x06signal\x18\x02 \x01(\tH\x00"\x1d\n\x08SaveMode\x12\x08\n\x04NONE\x10\x00\x12\x07\n\x03\x41LL\x10\x01\x42\x06\n\x04save"\x17\n\x07Include\x12\x0c\n\x04path\x18\x01 \x01(\t"+\n\nLibInclude\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0f\n\x07section\x18\x02 \x01(\t"9\n\x04Meas\x12\x15\n\ranalysis_type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x65xpr\x18\x03 \x01(\t"v\n\x06Signal\x12\x0c\n\x04name\x18\x01 \x01(\t\x12.\n\x08quantity\x18\x02 \x01(\x0e\x32\x1c.vlsir.spice.Signal.Quantity".\n\x08Quantity\x12\x0b\n\x07VOLTAGE\x10\x00\x12\x0b\n\x07\x43URRENT\x10\x01\x12\x08\n\x04NONE\x10\x03\x32=\n\x05Spice\x12\x34\n\x03Sim\x12\x15.vlsir.spice.SimInput\x1a\x16.vlsir.spice.SimResultb\x06proto3'
 )
 
 _globals = globals()
@@ -52,72 +52,82 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_OPINPUT"]._serialized_end = 1125
     _globals["_OPRESULT"]._serialized_start = 1127
     _globals["_OPRESULT"]._serialized_end = 1203
-    _globals["_DCINPUT"]._serialized_start = 1205
-    _globals["_DCINPUT"]._serialized_end = 1329
-    _globals["_DCRESULT"]._serialized_start = 1332
-    _globals["_DCRESULT"]._serialized_end = 1538
-    _globals["_DCRESULT_MEASUREMENTSENTRY"]._serialized_start = 1481
-    _globals["_DCRESULT_MEASUREMENTSENTRY"]._serialized_end = 1532
-    _globals["_TRANINPUT"]._serialized_start = 1541
-    _globals["_TRANINPUT"]._serialized_end = 1729
-    _globals["_TRANINPUT_ICENTRY"]._serialized_start = 1688
-    _globals["_TRANINPUT_ICENTRY"]._serialized_end = 1729
-    _globals["_TRANRESULT"]._serialized_start = 1732
-    _globals["_TRANRESULT"]._serialized_end = 1928
-    _globals["_TRANRESULT_MEASUREMENTSENTRY"]._serialized_start = 1481
-    _globals["_TRANRESULT_MEASUREMENTSENTRY"]._serialized_end = 1532
-    _globals["_COMPLEXNUM"]._serialized_start = 1930
-    _globals["_COMPLEXNUM"]._serialized_end = 1966
-    _globals["_ACINPUT"]._serialized_start = 1968
-    _globals["_ACINPUT"]._serialized_end = 2082
-    _globals["_ACRESULT"]._serialized_start = 2085
-    _globals["_ACRESULT"]._serialized_end = 2310
-    _globals["_ACRESULT_MEASUREMENTSENTRY"]._serialized_start = 1481
-    _globals["_ACRESULT_MEASUREMENTSENTRY"]._serialized_end = 1532
-    _globals["_NOISEINPUT"]._serialized_start = 2313
-    _globals["_NOISEINPUT"]._serialized_end = 2488
-    _globals["_NOISERESULT"]._serialized_start = 2491
-    _globals["_NOISERESULT"]._serialized_end = 2818
-    _globals["_NOISERESULT_INTEGRATEDNOISEENTRY"]._serialized_start = 2699
-    _globals["_NOISERESULT_INTEGRATEDNOISEENTRY"]._serialized_end = 2753
-    _globals["_NOISERESULT_MEASUREMENTSENTRY"]._serialized_start = 1481
-    _globals["_NOISERESULT_MEASUREMENTSENTRY"]._serialized_end = 1532
-    _globals["_SWEEPINPUT"]._serialized_start = 2821
-    _globals["_SWEEPINPUT"]._serialized_end = 2981
-    _globals["_SWEEPRESULT"]._serialized_start = 2984
-    _globals["_SWEEPRESULT"]._serialized_end = 3114
-    _globals["_MONTEINPUT"]._serialized_start = 3117
-    _globals["_MONTEINPUT"]._serialized_end = 3252
-    _globals["_MONTERESULT"]._serialized_start = 3255
-    _globals["_MONTERESULT"]._serialized_end = 3385
-    _globals["_CUSTOMANALYSISINPUT"]._serialized_start = 3387
-    _globals["_CUSTOMANALYSISINPUT"]._serialized_end = 3481
-    _globals["_CUSTOMANALYSISRESULT"]._serialized_start = 3483
-    _globals["_CUSTOMANALYSISRESULT"]._serialized_end = 3505
-    _globals["_SWEEP"]._serialized_start = 3508
-    _globals["_SWEEP"]._serialized_end = 3646
-    _globals["_LINEARSWEEP"]._serialized_start = 3648
-    _globals["_LINEARSWEEP"]._serialized_end = 3704
-    _globals["_LOGSWEEP"]._serialized_start = 3706
-    _globals["_LOGSWEEP"]._serialized_end = 3759
-    _globals["_POINTSWEEP"]._serialized_start = 3761
-    _globals["_POINTSWEEP"]._serialized_end = 3817
-    _globals["_CONTROL"]._serialized_start = 3820
-    _globals["_CONTROL"]._serialized_end = 4044
-    _globals["_SAVE"]._serialized_start = 4046
-    _globals["_SAVE"]._serialized_end = 4153
-    _globals["_SAVE_SAVEMODE"]._serialized_start = 4116
-    _globals["_SAVE_SAVEMODE"]._serialized_end = 4145
-    _globals["_INCLUDE"]._serialized_start = 4155
-    _globals["_INCLUDE"]._serialized_end = 4178
-    _globals["_LIBINCLUDE"]._serialized_start = 4180
-    _globals["_LIBINCLUDE"]._serialized_end = 4223
-    _globals["_MEAS"]._serialized_start = 4225
-    _globals["_MEAS"]._serialized_end = 4282
-    _globals["_SIGNAL"]._serialized_start = 4284
-    _globals["_SIGNAL"]._serialized_end = 4402
-    _globals["_SIGNAL_QUANTITY"]._serialized_start = 4356
-    _globals["_SIGNAL_QUANTITY"]._serialized_end = 4402
-    _globals["_SPICE"]._serialized_start = 4404
-    _globals["_SPICE"]._serialized_end = 4465
+    _globals["_BINARYARRAY"]._serialized_start = 1205
+    _globals["_BINARYARRAY"]._serialized_end = 1332
+    _globals["_BINARYARRAY_DTYPE"]._serialized_start = 1296
+    _globals["_BINARYARRAY_DTYPE"]._serialized_end = 1332
+    _globals["_RESULTSTREAMMESSAGE"]._serialized_start = 1334
+    _globals["_RESULTSTREAMMESSAGE"]._serialized_end = 1450
+    _globals["_RESULTHEADER"]._serialized_start = 1452
+    _globals["_RESULTHEADER"]._serialized_end = 1527
+    _globals["_RESULTCHUNK"]._serialized_start = 1529
+    _globals["_RESULTCHUNK"]._serialized_end = 1637
+    _globals["_DCINPUT"]._serialized_start = 1639
+    _globals["_DCINPUT"]._serialized_end = 1763
+    _globals["_DCRESULT"]._serialized_start = 1766
+    _globals["_DCRESULT"]._serialized_end = 2019
+    _globals["_DCRESULT_MEASUREMENTSENTRY"]._serialized_start = 1962
+    _globals["_DCRESULT_MEASUREMENTSENTRY"]._serialized_end = 2013
+    _globals["_TRANINPUT"]._serialized_start = 2022
+    _globals["_TRANINPUT"]._serialized_end = 2210
+    _globals["_TRANINPUT_ICENTRY"]._serialized_start = 2169
+    _globals["_TRANINPUT_ICENTRY"]._serialized_end = 2210
+    _globals["_TRANRESULT"]._serialized_start = 2213
+    _globals["_TRANRESULT"]._serialized_end = 2456
+    _globals["_TRANRESULT_MEASUREMENTSENTRY"]._serialized_start = 1962
+    _globals["_TRANRESULT_MEASUREMENTSENTRY"]._serialized_end = 2013
+    _globals["_COMPLEXNUM"]._serialized_start = 2458
+    _globals["_COMPLEXNUM"]._serialized_end = 2494
+    _globals["_ACINPUT"]._serialized_start = 2496
+    _globals["_ACINPUT"]._serialized_end = 2610
+    _globals["_ACRESULT"]._serialized_start = 2613
+    _globals["_ACRESULT"]._serialized_end = 2932
+    _globals["_ACRESULT_MEASUREMENTSENTRY"]._serialized_start = 1962
+    _globals["_ACRESULT_MEASUREMENTSENTRY"]._serialized_end = 2013
+    _globals["_NOISEINPUT"]._serialized_start = 2935
+    _globals["_NOISEINPUT"]._serialized_end = 3110
+    _globals["_NOISERESULT"]._serialized_start = 3113
+    _globals["_NOISERESULT"]._serialized_end = 3440
+    _globals["_NOISERESULT_INTEGRATEDNOISEENTRY"]._serialized_start = 3321
+    _globals["_NOISERESULT_INTEGRATEDNOISEENTRY"]._serialized_end = 3375
+    _globals["_NOISERESULT_MEASUREMENTSENTRY"]._serialized_start = 1962
+    _globals["_NOISERESULT_MEASUREMENTSENTRY"]._serialized_end = 2013
+    _globals["_SWEEPINPUT"]._serialized_start = 3443
+    _globals["_SWEEPINPUT"]._serialized_end = 3603
+    _globals["_SWEEPRESULT"]._serialized_start = 3606
+    _globals["_SWEEPRESULT"]._serialized_end = 3736
+    _globals["_MONTEINPUT"]._serialized_start = 3739
+    _globals["_MONTEINPUT"]._serialized_end = 3874
+    _globals["_MONTERESULT"]._serialized_start = 3877
+    _globals["_MONTERESULT"]._serialized_end = 4007
+    _globals["_CUSTOMANALYSISINPUT"]._serialized_start = 4009
+    _globals["_CUSTOMANALYSISINPUT"]._serialized_end = 4103
+    _globals["_CUSTOMANALYSISRESULT"]._serialized_start = 4105
+    _globals["_CUSTOMANALYSISRESULT"]._serialized_end = 4127
+    _globals["_SWEEP"]._serialized_start = 4130
+    _globals["_SWEEP"]._serialized_end = 4268
+    _globals["_LINEARSWEEP"]._serialized_start = 4270
+    _globals["_LINEARSWEEP"]._serialized_end = 4326
+    _globals["_LOGSWEEP"]._serialized_start = 4328
+    _globals["_LOGSWEEP"]._serialized_end = 4381
+    _globals["_POINTSWEEP"]._serialized_start = 4383
+    _globals["_POINTSWEEP"]._serialized_end = 4439
+    _globals["_CONTROL"]._serialized_start = 4442
+    _globals["_CONTROL"]._serialized_end = 4666
+    _globals["_SAVE"]._serialized_start = 4668
+    _globals["_SAVE"]._serialized_end = 4775
+    _globals["_SAVE_SAVEMODE"]._serialized_start = 4738
+    _globals["_SAVE_SAVEMODE"]._serialized_end = 4767
+    _globals["_INCLUDE"]._serialized_start = 4777
+    _globals["_INCLUDE"]._serialized_end = 4800
+    _globals["_LIBINCLUDE"]._serialized_start = 4802
+    _globals["_LIBINCLUDE"]._serialized_end = 4845
+    _globals["_MEAS"]._serialized_start = 4847
+    _globals["_MEAS"]._serialized_end = 4904
+    _globals["_SIGNAL"]._serialized_start = 4906
+    _globals["_SIGNAL"]._serialized_end = 5024
+    _globals["_SIGNAL_QUANTITY"]._serialized_start = 4978
+    _globals["_SIGNAL_QUANTITY"]._serialized_end = 5024
+    _globals["_SPICE"]._serialized_start = 5026
+    _globals["_SPICE"]._serialized_end = 5087
 # @@protoc_insertion_point(module_scope)